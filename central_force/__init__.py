@@ -0,0 +1,162 @@
+"""Núcleo de física compartido por las aplicaciones de Streamlit."""
+from .batch import derivadas_orbita_batch, integrate_batch
+from .cache import cache_stats, memoize
+from .conservation import (
+    ConservationError,
+    CostAccuracy,
+    MonitoredOrbit,
+    cheapest,
+    conservation_errors,
+    cost_accuracy,
+    max_conservation_error,
+    refinement_ladder,
+    simulate_monitored,
+)
+from .curves import CurveSet, curve_set, potential_curve_set
+from .elements import OrbitalElements, element_sweep, kepler_orbital_elements, orbital_elements
+from .kepler import propagate_kepler
+from .levicivita import (
+    LeviCivitaResult,
+    StepComparison,
+    compare_step_counts,
+    integrate_levi_civita,
+    propagate_levi_civita,
+)
+from .metrics import (
+    Histogram,
+    enable_metrics,
+    export_json,
+    export_prometheus,
+    instrumented,
+    metrics_enabled,
+    metrics_summary,
+    observe,
+    reset_metrics,
+    span,
+    write_metrics,
+)
+from .physics import (
+    calculate_turning_points,
+    derivadas_orbita,
+    energy_scale,
+    get_veff,
+    hamiltonian,
+    initial_radial_momentum,
+    orbital_type,
+    phase_space_loop,
+    radial_momentum,
+    TurningPoints,
+    turning_points_exact,
+)
+from .potentials import POTENTIALS, Potential, from_expression, get_potential, register_potential
+from .quadrature import (
+    OrbitShape,
+    RadialQuadrature,
+    orbit_shape,
+    radial_integrals,
+    radial_quadrature,
+    well_turning_points,
+)
+from .rendering import (
+    IMAGE_CACHE,
+    THEMES,
+    RenderStats,
+    apply_theme,
+    cached_figure,
+    encode,
+    figure,
+    render_figure,
+    render_stats,
+)
+from .simulation import OrbitResult, simulate_orbit
+from .spherical import (
+    SphericalResult,
+    cartesian_to_spherical,
+    derivadas_esfericas,
+    integrate_spherical,
+    spherical_to_cartesian,
+)
+from .symplectic import SymplecticResult, integrate_symplectic
+from .trajectory import Trajectory, orbit_trajectory
+
+__all__ = [
+    "apply_theme",
+    "cache_stats",
+    "cached_figure",
+    "calculate_turning_points",
+    "cartesian_to_spherical",
+    "cheapest",
+    "compare_step_counts",
+    "conservation_errors",
+    "cost_accuracy",
+    "curve_set",
+    "derivadas_esfericas",
+    "derivadas_orbita",
+    "derivadas_orbita_batch",
+    "element_sweep",
+    "enable_metrics",
+    "encode",
+    "energy_scale",
+    "export_json",
+    "export_prometheus",
+    "figure",
+    "from_expression",
+    "get_potential",
+    "get_veff",
+    "hamiltonian",
+    "initial_radial_momentum",
+    "instrumented",
+    "integrate_batch",
+    "integrate_levi_civita",
+    "integrate_spherical",
+    "integrate_symplectic",
+    "kepler_orbital_elements",
+    "max_conservation_error",
+    "memoize",
+    "metrics_enabled",
+    "metrics_summary",
+    "observe",
+    "orbit_shape",
+    "orbit_trajectory",
+    "orbital_elements",
+    "orbital_type",
+    "phase_space_loop",
+    "potential_curve_set",
+    "propagate_kepler",
+    "propagate_levi_civita",
+    "radial_integrals",
+    "radial_momentum",
+    "radial_quadrature",
+    "refinement_ladder",
+    "register_potential",
+    "render_figure",
+    "render_stats",
+    "reset_metrics",
+    "simulate_monitored",
+    "simulate_orbit",
+    "span",
+    "spherical_to_cartesian",
+    "turning_points_exact",
+    "well_turning_points",
+    "write_metrics",
+    "ConservationError",
+    "CostAccuracy",
+    "CurveSet",
+    "Histogram",
+    "IMAGE_CACHE",
+    "LeviCivitaResult",
+    "MonitoredOrbit",
+    "OrbitalElements",
+    "OrbitResult",
+    "OrbitShape",
+    "Potential",
+    "POTENTIALS",
+    "RadialQuadrature",
+    "RenderStats",
+    "SphericalResult",
+    "StepComparison",
+    "SymplecticResult",
+    "THEMES",
+    "Trajectory",
+    "TurningPoints",
+]
@@ -0,0 +1,122 @@
+"""Figuras Plotly animadas en el navegador (frames + controles), sin bucles en el servidor."""
+import numpy as np
+import plotly.graph_objects as go
+
+
+def _play_controls(frame_names, frame_ms):
+    """Botones ▶/⏸ y slider de frames; la reproducción ocurre en el cliente"""
+    play = dict(label="▶️ Play", method="animate",
+                args=[None, dict(frame=dict(duration=frame_ms, redraw=False),
+                                 transition=dict(duration=0), fromcurrent=True, mode="immediate")])
+    pause = dict(label="⏸ Pausa", method="animate",
+                 args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")])
+    updatemenus = [dict(type="buttons", direction="left", x=0.0, y=-0.12, xanchor="left",
+                        yanchor="top", showactive=False, buttons=[play, pause])]
+    sliders = [dict(
+        active=0, x=0.2, y=-0.08, len=0.8, currentvalue=dict(prefix="Paso: "),
+        steps=[dict(label=name, method="animate",
+                    args=[[name], dict(frame=dict(duration=0, redraw=False), mode="immediate")])
+               for name in frame_names],
+    )]
+    return updatemenus, sliders
+
+
+def phase_animation_figure(r_plot, pr_plot, steps=100, frame_ms=50,
+                           x_range=(0, 8), y_range=(-4, 4), height=450):
+    """Una sola figura con la trayectoria de fase y un marcador animado por frames.
+
+    La curva completa se envía una vez; cada frame solo actualiza el marcador
+    (traza 1), así que el servidor no vuelve a serializar la trayectoria.
+    """
+    indices = np.linspace(0, len(r_plot) - 1, steps, dtype=int)
+    names = [str(i + 1) for i in range(len(indices))]
+
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=r_plot, y=pr_plot,
+                mode='lines',
+                name='Trayectoria de Fase',
+                line=dict(color='#7c3aed', width=3),
+                fill='toself',
+                fillcolor='rgba(124, 58, 237, 0.1)'
+            ),
+            go.Scatter(
+                x=[r_plot[indices[0]]], y=[pr_plot[indices[0]]],
+                mode='markers+text',
+                marker=dict(color='#db2777', size=15, line=dict(color='white', width=2)),
+                text=["t=0"], textposition="top center",
+                name='Estado Actual'
+            ),
+        ],
+        frames=[
+            go.Frame(
+                name=name,
+                traces=[1],
+                data=[go.Scatter(x=[r_plot[idx]], y=[pr_plot[idx]], text=[f"t={i}"])],
+            )
+            for i, (name, idx) in enumerate(zip(names, indices))
+        ],
+    )
+
+    updatemenus, sliders = _play_controls(names, frame_ms)
+    fig.update_layout(
+        title="<b>Evolución Temporal</b>",
+        xaxis_title="r",
+        yaxis_title="p_r",
+        xaxis_range=list(x_range),
+        yaxis_range=list(y_range),
+        height=height,
+        margin=dict(l=20, r=20, t=60, b=80),
+        showlegend=True,
+        updatemenus=updatemenus,
+        sliders=sliders,
+    )
+    return fig
+
+
+def orbit_animation_figure(x, y, start=50, stride=10, trail=50, frame_ms=100, height=650):
+    """Órbita en el plano (x, y) animada en el cliente: una sola serialización por simulación.
+
+    La órbita completa se dibuja tenue una vez; cada frame solo envía la estela
+    de las últimas `trail` muestras y la posición actual, así que el tamaño del
+    payload crece linealmente con la trayectoria y no cuadráticamente.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    ends = list(range(min(start, len(x)), len(x) + 1, stride)) or [len(x)]
+    names = [str(k + 1) for k in range(len(ends))]
+    lim_x = max(np.max(np.abs(x)), 5)
+    lim_y = max(np.max(np.abs(y)), 5)
+
+    def _moving(i):
+        lo = max(0, i - trail)
+        return [go.Scatter(x=x[lo:i], y=y[lo:i]),
+                go.Scatter(x=[x[i - 1]], y=[y[i - 1]])]
+
+    first_trail, first_marker = _moving(ends[0])
+    fig = go.Figure(
+        data=[
+            go.Scatter(x=x, y=y, mode='lines', name='Órbita',
+                       line=dict(color='rgba(37, 99, 235, 0.25)', width=1.5)),
+            go.Scatter(x=[0], y=[0], mode='markers', name='Centro de fuerza',
+                       marker=dict(color='gold', size=14)),
+            first_trail.update(mode='lines', name='Trayectoria',
+                               line=dict(color='#2563eb', width=2.5)),
+            first_marker.update(mode='markers', name='Partícula',
+                                marker=dict(color='red', size=11)),
+        ],
+        frames=[go.Frame(name=name, traces=[2, 3], data=_moving(i)) for name, i in zip(names, ends)],
+    )
+
+    updatemenus, sliders = _play_controls(names, frame_ms)
+    fig.update_layout(
+        title="<b>Órbita en el Espacio de Configuración</b>",
+        xaxis=dict(title="x", range=[-lim_x, lim_x]),
+        yaxis=dict(title="y", range=[-lim_y, lim_y], scaleanchor="x", scaleratio=1),
+        height=height,
+        margin=dict(l=20, r=20, t=60, b=80),
+        updatemenus=updatemenus,
+        sliders=sliders,
+    )
+    return fig
@@ -0,0 +1,126 @@
+"""Integración vectorizada de muchas órbitas a la vez (RK4 de paso fijo)."""
+import numpy as np
+
+
+def derivadas_orbita_batch(y, m, alpha):
+    """Versión vectorizada de derivadas_orbita: y tiene forma (N, 4)"""
+    r, pr, ptheta = y[:, 0], y[:, 2], y[:, 3]
+    inv_r = 1.0 / r
+    inv_mr2 = inv_r * inv_r / m
+    dydt = np.empty_like(y)
+    dydt[:, 0] = pr / m
+    dydt[:, 1] = ptheta * inv_mr2
+    dydt[:, 2] = (ptheta**2 * inv_r / m - alpha) * inv_r * inv_r
+    dydt[:, 3] = 0.0
+    return dydt
+
+
+def _as_column(value, n):
+    """Convierte un escalar o un vector de N parámetros en un array (N,)"""
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return np.full(n, float(value))
+    if value.shape != (n,):
+        raise ValueError(f"Se esperaban {n} valores por fila, se recibió la forma {value.shape}")
+    return value
+
+
+# Órbitas por bloque: los ~10 vectores de trabajo de un bloque caben en la caché L2
+CHUNK = 4096
+
+
+def _rk4_rows(state, inv_m, q, alpha, h, n_steps, save_steps, out):
+    """RK4 sobre un bloque en filas contiguas state (4, n), actualizado in situ.
+
+    Las derivadas solo dependen de r y p_r: con p_θ constante, dθ/dt = c/r² y
+    dp_r/dt = (q/r − α)/r² con c = p_θ/m y q = p_θ²/m, así que cada etapa
+    evalúa tres filas sobre búferes reservados una sola vez (ufuncs con out=).
+    out[k] recibe el estado tras save_steps[k] pasos con forma (n, 4).
+    """
+    r, theta, pr = state[0], state[1], state[2]
+    c = state[3] * inv_m
+    n = state.shape[1]
+    ks = np.empty((4, 3, n))          # k1..k4 en filas [dr, dθ, dp_r]
+    acc = np.empty((3, n))
+    rs, prs = np.empty(n), np.empty(n)
+    inv_r, inv_r2, tmp = np.empty(n), np.empty(n), np.empty(n)
+    coef = (0.5 * h, 0.5 * h, h)
+
+    def derivs(r, pr, k):
+        np.divide(1.0, r, out=inv_r)
+        np.multiply(inv_r, inv_r, out=inv_r2)
+        np.multiply(pr, inv_m, out=k[0])
+        np.multiply(c, inv_r2, out=k[1])
+        np.multiply(q, inv_r, out=tmp)
+        np.subtract(tmp, alpha, out=tmp)
+        np.multiply(tmp, inv_r2, out=k[2])
+
+    k = 0
+    if save_steps[0] == 0:
+        out[0] = state.T
+        k = 1
+    for step in range(1, n_steps + 1):
+        derivs(r, pr, ks[0])
+        for i in range(3):
+            # Estado intermedio y + a·k_i (solo hacen falta r y p_r)
+            np.multiply(ks[i, 0], coef[i], out=rs)
+            np.add(rs, r, out=rs)
+            np.multiply(ks[i, 2], coef[i], out=prs)
+            np.add(prs, pr, out=prs)
+            derivs(rs, prs, ks[i + 1])
+        # y += h/6 (k1 + 2(k2 + k3) + k4) sobre las filas r, θ, p_r
+        np.add(ks[1], ks[2], out=acc)
+        acc *= 2.0
+        acc += ks[0]
+        acc += ks[3]
+        acc *= h / 6.0
+        state[:3] += acc
+        if k < len(save_steps) and step == save_steps[k]:
+            out[k] = state.T
+            k += 1
+
+
+def integrate_batch(y0, m=1.0, alpha=1.0, t_span=(0, 20), n_steps=2000, n_save=None):
+    """Integra N órbitas en paralelo con RK4 de paso fijo.
+
+    y0 es un array (N, 4) con filas [r, θ, p_r, p_θ]; m y alpha pueden ser
+    escalares o arrays (N,). Devuelve (t, y): si n_save es None, y es el estado
+    final (N, 4); si no, y tiene forma (len(t), N, 4) con muestras equiespaciadas.
+
+    Las muestras caen siempre en pasos del integrador (el paso más cercano a
+    cada instante pedido), así que con n_save > n_steps + 1 se devuelven solo
+    los n_steps + 1 pasos: len(t) ≤ n_save y t son los tiempos reales de cada
+    muestra, no un linspace de n_save puntos.
+
+    Internamente el estado se guarda traspuesto, (4, N) con cada componente
+    contigua, y se integra por bloques de CHUNK órbitas que caben en caché.
+    """
+    y = np.array(y0, dtype=float, ndmin=2)
+    if y.shape[1] != 4:
+        raise ValueError("y0 debe tener forma (N, 4): [r, θ, p_r, p_θ]")
+    n = y.shape[0]
+    m = _as_column(m, n)
+    alpha = _as_column(alpha, n)
+
+    t0, t1 = t_span
+    h = (t1 - t0) / n_steps
+
+    if n_save is None:
+        save_steps = np.array([n_steps])
+    else:
+        # Con n_save ≤ n_steps + 1 el redondeo no repite pasos; si no, unique descarta los repetidos
+        save_steps = np.unique(np.linspace(0, n_steps, n_save).round().astype(int))
+    out = np.empty((len(save_steps), n, 4))
+
+    state = np.ascontiguousarray(y.T)
+    inv_m = 1.0 / m
+    q = state[3]**2 * inv_m
+    for lo in range(0, n, CHUNK):
+        block = slice(lo, lo + CHUNK)
+        _rk4_rows(np.ascontiguousarray(state[:, block]), inv_m[block], q[block], alpha[block], h,
+                  n_steps, save_steps, out[:, block])
+
+    t = t0 + h * save_steps
+    if n_save is None:
+        return t[-1], out[0]
+    return t, out
@@ -0,0 +1,222 @@
+"""Banco de tiempos de los caminos calientes, con línea base para detectar regresiones.
+
+    python -m central_force bench                       # todas las suites
+    python -m central_force bench --suite veff orbits --quick
+    python -m central_force bench --check               # falla si algo va más lento que benchmark_baseline.json
+    python -m central_force bench --update-baseline     # reescribe la línea base con esta máquina
+
+Cada caso se mide con las cachés de memoize saltadas (se llama a __wrapped__),
+así que el tiempo es el de calcular, no el de un acierto de caché.
+
+Los milisegundos dependen de la máquina: cada ejecución mide también un caso
+de calibración fijo (calibration/reference) y la comparación escala la línea
+base por el cociente entre la calibración actual y la guardada con ella.
+"""
+import csv
+import json
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .startup import APPS, REPO_ROOT
+
+BASELINE_PATH = REPO_ROOT / "benchmark_baseline.json"
+
+FIELDS = ("suite", "case", "n", "min_ms", "median_ms", "repeat")
+
+# Órbita de referencia para los integradores: elipse con e ≈ 0.55
+_Y0 = (2.0, 0.0, 0.0, 1.0)
+_M, _ALPHA = 1.0, 1.0
+
+
+def time_call(fn, repeat=5):
+    """(mínimo, mediana) en ms de repeat llamadas a fn, tras una de calentamiento"""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e3)
+    return min(samples), statistics.median(samples)
+
+
+CALIBRATION_KEY = "calibration/reference/1"
+
+
+def _calibration_workload():
+    """Trabajo fijo con la mezcla de los casos: bucle de floats de Python y NumPy vectorizado"""
+    x = 0.5
+    for _ in range(200_000):
+        x = x * 0.999 + 1.0 / (1.0 + x * x)
+    r = np.linspace(0.1, 8.0, 200_000)
+    for _ in range(20):
+        r = np.sqrt(r * r + 1e-3) - 1e-4 / r
+    return x + float(r[0])
+
+
+def calibrate(repeat=9):
+    """Resultado del caso de calibración (~50 ms por llamada); el factor de máquina usa su mediana"""
+    best, median = time_call(_calibration_workload, repeat)
+    return {"suite": "calibration", "case": "reference", "n": 1, "min_ms": best, "median_ms": median,
+            "repeat": repeat}
+
+
+def _veff_cases(quick):
+    from .physics import calculate_turning_points, get_veff, turning_points_exact
+
+    for n in (10_000,) if quick else (10_000, 1_000_000):
+        r = np.linspace(0.1, 8.0, n)
+        yield "get_veff", n, lambda r=r: get_veff(r, 1.0, _M, _ALPHA)
+        veff = get_veff(r, 1.0, _M, _ALPHA)
+        yield "calculate_turning_points", n, lambda r=r, veff=veff: calculate_turning_points(r, veff, -0.3)
+        E = np.linspace(-0.49, 0.5, n)
+        yield "turning_points_exact", n, lambda E=E: turning_points_exact(E, 1.0, _M, _ALPHA)
+
+
+def _orbit_cases(quick):
+    from .batch import integrate_batch
+    from .physics import initial_radial_momentum
+    from .simulation import METHODS
+    from .trajectory import orbit_trajectory
+
+    # N = horizonte de integración t_end; se integra y se remuestrea a 1000 puntos
+    integrate = orbit_trajectory.__wrapped__
+    for method in METHODS:
+        for t_end in (20.0,) if quick else (20.0, 100.0):
+            def run(method=method, t_end=t_end):
+                integrate(method, *_Y0, _M, _ALPHA, t_end=t_end)(np.linspace(0.0, t_end, 1000))
+
+            yield method, int(t_end), run
+
+    # N = órbitas integradas a la vez con RK4 de paso fijo
+    for n in (64,) if quick else (64, 1024, 10_000):
+        L = np.linspace(0.6, 1.2, n)
+        pr0 = initial_radial_momentum(2.0, -0.3, L, _M, _ALPHA)
+        y0 = np.column_stack([np.full(n, 2.0), np.zeros(n), pr0, L])
+        yield "batch", n, lambda y0=y0: integrate_batch(y0, _M, _ALPHA, t_span=(0, 20), n_steps=2000)
+
+
+def _phase_cases(quick):
+    from .curves import curve_set
+    from .potentials import get_potential
+    from .quadrature import radial_quadrature
+
+    build = curve_set.__wrapped__
+    for n in (600, 10_000):
+        yield "curve_set", n, lambda n=n: build(-0.3, 1.0, _M, _ALPHA, n=n)
+    yield "curve_set_adaptive", 1, lambda: build(-0.3, 1.0, _M, _ALPHA, tol=1e-3)
+
+    # N = pares (E, L) con periodo radial y Δθ por cuadratura (malla de 101 valores de L)
+    kepler = get_potential("kepler", alpha=_ALPHA)
+    for n_E in (10,) if quick else (10, 121):
+        E, L = np.meshgrid(np.linspace(-0.45, -0.05, n_E), np.linspace(0.5, 1.5, 101))
+        yield "radial_quadrature", E.size, lambda E=E, L=L: radial_quadrature(E, L, _M, kepler)
+
+
+SUITES = {
+    "veff": _veff_cases,
+    "orbits": _orbit_cases,
+    "phase": _phase_cases,
+}
+
+
+def _app_results(reruns):
+    """Primer run y reruns completos de cada app con AppTest (N = número de reruns)"""
+    from .startup import measure_reruns
+
+    results = []
+    for app in APPS:
+        m = measure_reruns(app, reruns=reruns)
+        results.append({"suite": "apps", "case": f"{app}:first_run", "n": 1,
+                        "min_ms": m["first_run_ms"], "median_ms": m["first_run_ms"], "repeat": 1})
+        results.append({"suite": "apps", "case": f"{app}:rerun", "n": reruns,
+                        "min_ms": min(m["rerun_ms"]), "median_ms": statistics.median(m["rerun_ms"]),
+                        "repeat": reruns})
+    return results
+
+
+def run_benchmarks(suites=None, quick=False, repeat=5, reruns=3, progress=None):
+    """Lista de resultados {suite, case, n, min_ms, median_ms, repeat}; suites None = todas y apps.
+
+    El primer resultado es siempre el de calibración (ver compare_baseline).
+    """
+    suites = list(SUITES) + ["apps"] if suites is None else list(suites)
+    results = []
+    calibration = calibrate()
+    if progress is not None:
+        progress(calibration)
+    results.append(calibration)
+    for suite in suites:
+        if suite == "apps":
+            batch = _app_results(reruns)
+        else:
+            batch = []
+            for case, n, fn in SUITES[suite](quick):
+                best, median = time_call(fn, repeat)
+                batch.append({"suite": suite, "case": case, "n": n,
+                              "min_ms": best, "median_ms": median, "repeat": repeat})
+        for result in batch:
+            if progress is not None:
+                progress(result)
+        results.extend(batch)
+    return results
+
+
+def result_key(result):
+    return f"{result['suite']}/{result['case']}/{result['n']}"
+
+
+def write_results(results, json_path=None, csv_path=None):
+    if json_path is not None:
+        Path(json_path).write_text(json.dumps(results, indent=2))
+    if csv_path is not None:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Línea base como {suite/caso/N: min_ms}"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Guarda el mínimo de cada caso (de la calibración, su mediana, como usa machine_factor)"""
+    baseline = {result_key(r): round(r["median_ms" if result_key(r) == CALIBRATION_KEY else "min_ms"], 3)
+                for r in results}
+    Path(path).write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def machine_factor(results, baseline):
+    """Cuánto más lenta es esta máquina que la de la línea base según la calibración (1 si falta)"""
+    now = next((r["median_ms"] for r in results if result_key(r) == CALIBRATION_KEY), None)
+    then = baseline.get(CALIBRATION_KEY)
+    if not now or not then:
+        return 1.0
+    return now / then
+
+
+def compare_baseline(results, baseline, tolerance=0.5, slack_ms=1.0):
+    """Regresiones: casos cuyo mínimo supera la línea base en más de tolerance (relativo) y slack_ms.
+
+    Se compara el mínimo de las repeticiones, que es la medida menos ruidosa;
+    slack_ms evita falsos positivos en casos de microsegundos. La línea base
+    se escala antes por machine_factor, así que una máquina uniformemente más
+    lenta no cuenta como regresión.
+    """
+    factor = machine_factor(results, baseline)
+    problems = []
+    for result in results:
+        key = result_key(result)
+        reference = baseline.get(key)
+        if reference is None or key == CALIBRATION_KEY:
+            continue
+        reference *= factor
+        limit = max(reference * (1 + tolerance), reference + slack_ms)
+        if result["min_ms"] > limit:
+            problems.append(f"{key}: {result['min_ms']:.2f} ms > {limit:.2f} ms "
+                            f"(línea base {reference:.2f} ms, ×{factor:.2f} por calibración)")
+    return problems
@@ -0,0 +1,154 @@
+"""Caché LRU/TTL en memoria para resultados de física, con clave cuantizada y contadores."""
+import functools
+import inspect
+import math
+import threading
+import time
+from collections import OrderedDict
+
+# Resolución con la que se cuantizan los parámetros reales al formar la clave
+DEFAULT_QUANTUM = 1e-6
+
+# Todas las cachés creadas con memoize, por nombre, para consultar sus contadores
+_REGISTRY = {}
+
+
+def quantize(value, quantum=DEFAULT_QUANTUM):
+    """Redondea reales a múltiplos de quantum (0.30000000000000004 y 0.3 comparten clave).
+
+    Las tuplas se cuantizan elemento a elemento; NaN e infinito se rechazan con
+    ValueError porque no tienen un múltiplo de quantum con el que formar la clave.
+    """
+    if isinstance(value, tuple):
+        return tuple(quantize(v, quantum) for v in value)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        try:
+            hash(value)
+        except TypeError:
+            raise TypeError(f"Argumento no cacheable de tipo {type(value).__name__}") from None
+        return value
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"Argumento no finito ({value}): la caché solo admite parámetros finitos")
+    return round(value / quantum)
+
+
+class LRUCache:
+    """Diccionario acotado con expulsión LRU, caducidad opcional y contadores de aciertos.
+
+    Con maxbytes se acota además la suma de sizeof(valor) (por defecto len, pensado
+    para bytes ya codificados): se expulsan entradas antiguas hasta caber.
+    """
+
+    def __init__(self, maxsize=256, ttl=None, maxbytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof if maxbytes is not None else (lambda value: 0)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                stamp, value, size = entry
+                if self.ttl is None or time.monotonic() - stamp < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.nbytes -= size
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[2]
+            self._data[key] = (time.monotonic(), value, size)
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (
+                    self.maxbytes is not None and self.nbytes > self.maxbytes and len(self._data) > 1):
+                _, (_, _, evicted) = self._data.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self.nbytes,
+                "maxbytes": self.maxbytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+_MISSING = object()
+
+
+def memoize(maxsize=256, ttl=None, quantum=DEFAULT_QUANTUM, name=None):
+    """Decorador: memoiza una función pura de parámetros escalares con clave cuantizada.
+
+    La función decorada expone .cache (LRUCache), .stats() y .cache_clear().
+    La caché vive en el módulo que define la función, así que sobrevive a las
+    reejecuciones de Streamlit y se comparte entre sesiones del mismo proceso.
+
+    La clave se forma con la llamada normalizada por la firma (posicionales,
+    por nombre y valores por defecto), así que f(0.3), f(0.3, 1.0) y
+    f(0.3, b=1.0) comparten entrada si b=1.0 es el valor por defecto.
+    """
+    def decorator(func):
+        cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        signature = inspect.signature(func)
+
+        def _key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = []
+            for name, value in bound.arguments.items():
+                if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+                    value = tuple(sorted(value.items()))
+                key.append((name, quantize(value, quantum)))
+            return tuple(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _key(args, kwargs)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.stats = cache.stats
+        wrapper.cache_clear = cache.clear
+        _REGISTRY[name or f"{func.__module__}.{func.__qualname__}"] = cache
+        return wrapper
+
+    return decorator
+
+
+def cache_stats():
+    """Contadores de todas las cachés registradas, por nombre"""
+    return {name: cache.stats() for name, cache in _REGISTRY.items()}
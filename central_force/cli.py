@@ -0,0 +1,330 @@
+"""Línea de comandos sin navegador: barridos de órbitas y espacio de fases a disco.
+
+Ejemplos:
+
+    python -m central_force orbits --E=-0.5:-0.1:0.1 --L 1.0,1.2 --out salida/
+    python -m central_force phase --E=-2:2:0.1 --L 0.5:3:0.5 --out salida/
+    python -m central_force lookup --out data/lookup
+    python -m central_force startup --reruns 2 --check
+    python -m central_force steps --L 1,0.5,0.1,0.01,0.001 --json pasos.json
+    python -m central_force bench --quick --json bench.json --check
+    python -m central_force conservation --E=-0.3 --L 1.0 --target 1e-8
+
+Los rangos negativos se pasan con "=" para que argparse no los tome por opciones.
+"""
+import argparse
+import csv
+import itertools
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from .batch import integrate_batch
+from .physics import (
+    calculate_turning_points,
+    energy_scale,
+    get_veff,
+    hamiltonian,
+    initial_radial_momentum,
+    orbital_type,
+    turning_points_exact,
+)
+from .quadrature import radial_integrals
+from .simulation import METHODS, simulate_orbit
+
+
+def parse_range(text):
+    """'a:b:paso' (extremos incluidos), 'v1,v2,...' o un único valor -> array"""
+    if ":" in text:
+        start, stop, step = (float(v) for v in text.split(":"))
+        n = int(round((stop - start) / step)) + 1
+        return np.round(start + step * np.arange(n), 12)
+    return np.array([float(v) for v in text.split(",")])
+
+
+def _add_parameter_args(parser):
+    parser.add_argument("--E", type=parse_range, default=parse_range("-0.5"), help="Energía total")
+    parser.add_argument("--L", type=parse_range, default=parse_range("1.0"), help="Momento angular")
+    parser.add_argument("--m", type=parse_range, default=parse_range("1.0"), help="Masa")
+    parser.add_argument("--alpha", type=parse_range, default=parse_range("1.0"), help="Constante α")
+    parser.add_argument("--out", type=Path, required=True, help="Directorio de salida")
+
+
+def _grid(args):
+    """Producto cartesiano de los rangos como array (N, 4) de (E, L, m, α)"""
+    return np.array(list(itertools.product(args.E, args.L, args.m, args.alpha)), dtype=float)
+
+
+def _write_csv(path, header, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def run_orbits(args):
+    """Integra una órbita por combinación de parámetros y guarda trayectorias y resumen"""
+    params = _grid(args)
+    E, L, m, alpha = params.T
+    with np.errstate(invalid="ignore"):
+        pr0 = initial_radial_momentum(args.r0, E, L, m, alpha)
+    ok = np.isfinite(pr0)
+    tp = turning_points_exact(E, L, m, alpha)
+
+    n_eval = args.n_eval
+    y = np.full((len(params), 4, n_eval), np.nan)
+    drift = np.full(len(params), np.nan)
+    if args.method == "batch":
+        # Todas las órbitas en paralelo con RK4 de paso fijo
+        y0 = np.column_stack([np.full(ok.sum(), args.r0), np.full(ok.sum(), args.theta0), pr0[ok], L[ok]])
+        n_steps = max(1, int(np.ceil(args.t_end / args.dt)))
+        t, ys = integrate_batch(y0, m[ok], alpha[ok], t_span=(0, args.t_end), n_steps=n_steps, n_save=n_eval)
+        # Con menos pasos que muestras pedidas integrate_batch devuelve solo los pasos (len(t) < n_eval)
+        y = np.full((len(params), 4, len(t)), np.nan)
+        y[ok] = ys.transpose(1, 2, 0)
+        H = hamiltonian(ys, m[ok], alpha[ok])
+        drift[ok] = np.max(np.abs(H - H[0]), axis=0) / energy_scale(ys[0], m[ok], alpha[ok])
+    else:
+        t = np.linspace(0, args.t_end, n_eval)
+        for i in np.flatnonzero(ok):
+            res = simulate_orbit(args.method, args.r0, args.theta0, pr0[i], L[i], m[i], alpha[i],
+                                 t_end=args.t_end, n_eval=n_eval, dt=args.dt)
+            y[i, :, :res.y.shape[1]] = res.y
+            drift[i] = res.energy_drift
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(args.out / "orbits.npz", params=params, t=t, y=y, pr0=pr0,
+                        r_min=tp.r_min, r_max=tp.r_max, energy_drift=drift)
+    _write_csv(
+        args.out / "orbits.csv",
+        ["E", "L", "m", "alpha", "r0", "pr0", "tipo", "r_min", "r_max", "energy_drift"],
+        [[*p, args.r0, pr0[i], orbital_type(p[0], p[1]) if ok[i] else "Prohibida",
+          tp.r_min[i], tp.r_max[i], drift[i]] for i, p in enumerate(params)],
+    )
+    print(f"{ok.sum()}/{len(params)} órbitas escritas en {args.out}")
+
+
+def run_phase(args):
+    """V_eff, curvas de fase, puntos de retorno (exactos y por malla), T_r y Δθ para cada combinación"""
+    params = _grid(args)
+    E, L, m, alpha = params.T
+    r = np.linspace(args.r_min, args.r_max, args.n_r)
+    veff = get_veff(r, L[:, None], m[:, None], alpha[:, None])
+    kinetic = E[:, None] - veff
+    pr = np.where(kinetic >= 0, np.sqrt(2 * m[:, None] * np.maximum(kinetic, 0)), np.nan)
+    tp = turning_points_exact(E, L, m, alpha)
+    # Periodo radial y Δθ por cuadratura, todas las órbitas ligadas a la vez
+    period, delta_theta = np.full(len(params), np.nan), np.full(len(params), np.nan)
+    b = tp.bound & (tp.r_max > tp.r_min)
+    if b.any():
+        period[b], delta_theta[b] = radial_integrals(
+            E[b], L[b], m[b], lambda x: get_veff(x, L[b, None], m[b, None], alpha[b, None]),
+            tp.r_min[b], tp.r_max[b])
+
+    rows = []
+    for i, p in enumerate(params):
+        grid_tp = calculate_turning_points(r, veff[i], p[0])
+        tipo = orbital_type(p[0], p[1]) if np.isfinite(tp.r_min[i]) else "Prohibida"
+        rows.append([*p, tipo, tp.r_min[i], tp.r_max[i], tp.bound[i], period[i], delta_theta[i],
+                     ";".join(f"{x:.6g}" for x in grid_tp)])
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(args.out / "phase.npz", params=params, r=r, veff=veff, pr=pr,
+                        r_min=tp.r_min, r_max=tp.r_max, bound=tp.bound,
+                        period=period, delta_theta=delta_theta)
+    _write_csv(args.out / "phase.csv",
+               ["E", "L", "m", "alpha", "tipo", "r_min", "r_max", "ligada", "periodo_radial",
+                "delta_theta", "retorno_malla"], rows)
+    print(f"{len(params)} curvas de fase escritas en {args.out}")
+
+
+def run_lookup(args):
+    from .lookup import build_lookup_table
+
+    out = build_lookup_table(args.out)
+    size = sum(f.stat().st_size for f in out.iterdir())
+    print(f"Tabla escrita en {out} ({size / 1e6:.1f} MB)")
+
+
+def run_startup(args):
+    """Importación en frío (y reruns con AppTest) por app, comparados con startup_budget.json"""
+    from .startup import check_budget, load_budget, startup_report
+
+    report = startup_report(reruns=args.reruns)
+    for app, result in report.items():
+        line = f"{app}: importación {result['import_ms']:.0f} ms, pesados {result['heavy']}"
+        if "rerun_ms" in result:
+            line += (f", primer run {result['first_run_ms']:.0f} ms, "
+                     f"reruns {[round(x) for x in result['rerun_ms']]} ms")
+        print(line)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    if args.check:
+        problems = check_budget(report, load_budget())
+        for problem in problems:
+            print(f"✗ {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+def run_steps(args):
+    """Evaluaciones de RK45 en polares frente a Levi-Civita al bajar L (órbitas cada vez más excéntricas)"""
+    from .levicivita import StepComparison, compare_step_counts
+
+    rows = compare_step_counts(args.L, r0=args.r0, m=args.m, alpha=args.alpha, t_end=args.t_end,
+                               rtol=args.rtol, atol=args.atol)
+    print(f"{'L':>8} {'e':>10} {'nfev polar':>11} {'nfev LC':>8} {'error polar':>12} {'error LC':>10}")
+    for row in rows:
+        print(f"{row.L:8.3g} {row.e:10.6f} {row.nfev_polar:11d} {row.nfev_regularized:8d} "
+              f"{row.error_polar:12.2e} {row.error_regularized:10.2e}")
+    if args.csv:
+        _write_csv(args.csv, StepComparison._fields, rows)
+    if args.json:
+        args.json.write_text(json.dumps([row._asdict() for row in rows], indent=2))
+
+
+def run_bench(args):
+    """Tiempos de los caminos calientes, a JSON/CSV y comparados con benchmark_baseline.json"""
+    from .benchmarks import (
+        compare_baseline,
+        load_baseline,
+        result_key,
+        run_benchmarks,
+        save_baseline,
+        write_results,
+    )
+
+    def progress(result):
+        print(f"{result_key(result):60s} {result['min_ms']:10.2f} ms (mediana {result['median_ms']:.2f})")
+
+    results = run_benchmarks(args.suite, quick=args.quick, repeat=args.repeat, reruns=args.reruns,
+                             progress=progress)
+    write_results(results, args.json, args.csv)
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Línea base escrita en {args.baseline}")
+    if args.check:
+        problems = compare_baseline(results, load_baseline(args.baseline), tolerance=args.tolerance)
+        for problem in problems:
+            print(f"✗ {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+def run_conservation(args):
+    """Tiempo frente a error de H y L de cada integrador y el más barato que cumple el objetivo"""
+    from .conservation import CostAccuracy, cheapest, cost_accuracy
+
+    pr0 = float(initial_radial_momentum(args.r0, args.E, args.L, args.m, args.alpha))
+    if not np.isfinite(pr0):
+        print(f"r0 = {args.r0} está en la zona prohibida para E = {args.E}, L = {args.L}")
+        return 1
+    rows = cost_accuracy(args.r0, 0.0, pr0, args.L, args.m, args.alpha, t_end=args.t_end,
+                         dt=args.dt, levels=args.levels)
+    print(f"{'método':>10} {'rtol':>6} {'dt':>8} {'ms':>9} {'|ΔH/H0|':>9} {'|ΔL/L0|':>9}")
+    for row in rows:
+        digits = "-" if row.tol_digits is None else f"1e-{row.tol_digits}"
+        print(f"{row.method:>10} {digits:>6} {row.dt:8.4g} {row.seconds * 1e3:9.2f} "
+              f"{row.energy_error:9.1e} {row.momentum_error:9.1e}")
+    best = cheapest(rows, args.target)
+    if best is None:
+        print(f"Ningún integrador alcanza {args.target:g}")
+    else:
+        print(f"Más barato con error ≤ {args.target:g}: {best.method} ({best.seconds * 1e3:.2f} ms)")
+    if args.csv:
+        _write_csv(args.csv, CostAccuracy._fields, rows)
+    if args.json:
+        args.json.write_text(json.dumps([row._asdict() for row in rows], indent=2))
+    return 0 if best is not None else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m central_force", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    orbits = sub.add_parser("orbits", help="Trayectorias, puntos de retorno y clasificación")
+    _add_parameter_args(orbits)
+    orbits.add_argument("--r0", type=float, default=2.0, help="Radio inicial")
+    orbits.add_argument("--theta0", type=float, default=0.0, help="Ángulo inicial")
+    orbits.add_argument("--method", choices=METHODS + ("batch",), default="rk45", help="Integrador")
+    orbits.add_argument("--t-end", type=float, default=20.0, help="Tiempo final")
+    orbits.add_argument("--n-eval", type=int, default=1000, help="Muestras por trayectoria")
+    orbits.add_argument("--dt", type=float, default=0.01, help="Paso fijo (verlet, yoshida4, batch)")
+    orbits.set_defaults(func=run_orbits)
+
+    phase = sub.add_parser("phase", help="Potencial efectivo y espacio de fases")
+    _add_parameter_args(phase)
+    phase.add_argument("--r-min", type=float, default=0.1)
+    phase.add_argument("--r-max", type=float, default=8.0)
+    phase.add_argument("--n-r", type=int, default=600)
+    phase.set_defaults(func=run_phase)
+
+    lookup = sub.add_parser("lookup", help="Construye la tabla precalculada de sliders")
+    lookup.add_argument("--out", type=Path, default=None, help="Directorio de salida")
+    lookup.set_defaults(func=run_lookup)
+
+    startup = sub.add_parser("startup", help="Perfil de arranque y presupuesto de importación")
+    startup.add_argument("--reruns", type=int, default=0, help="Reruns a medir con AppTest (0 = solo importación)")
+    startup.add_argument("--json", type=Path, default=None, help="Guardar el informe en JSON")
+    startup.add_argument("--check", action="store_true", help="Salir con código 1 si se excede el presupuesto")
+    startup.set_defaults(func=run_startup)
+
+    steps = sub.add_parser("steps", help="Pasos de RK45 en polares frente a Levi-Civita para L pequeño")
+    steps.add_argument("--L", type=parse_range, default=parse_range("1,0.5,0.1,0.01,0.001"),
+                       help="Momentos angulares (la órbita parte del apoapsis r0)")
+    steps.add_argument("--r0", type=float, default=1.0, help="Radio inicial (apoapsis)")
+    steps.add_argument("--m", type=float, default=1.0, help="Masa")
+    steps.add_argument("--alpha", type=float, default=1.0, help="Constante α")
+    steps.add_argument("--t-end", type=float, default=20.0, help="Tiempo final")
+    steps.add_argument("--rtol", type=float, default=1e-8)
+    steps.add_argument("--atol", type=float, default=1e-10)
+    steps.add_argument("--csv", type=Path, default=None, help="Guardar la tabla en CSV")
+    steps.add_argument("--json", type=Path, default=None, help="Guardar la tabla en JSON")
+    steps.set_defaults(func=run_steps)
+
+    conservation = sub.add_parser("conservation", help="Coste frente a precisión (H y L) de los integradores")
+    conservation.add_argument("--E", type=float, default=-0.3, help="Energía total")
+    conservation.add_argument("--L", type=float, default=1.0, help="Momento angular")
+    conservation.add_argument("--m", type=float, default=1.0, help="Masa")
+    conservation.add_argument("--alpha", type=float, default=1.0, help="Constante α")
+    conservation.add_argument("--r0", type=float, default=2.0, help="Radio inicial")
+    conservation.add_argument("--t-end", type=float, default=20.0, help="Tiempo final")
+    conservation.add_argument("--dt", type=float, default=0.01, help="Paso inicial de los métodos de paso fijo")
+    conservation.add_argument("--levels", type=int, default=3, help="Niveles de refinamiento por método")
+    conservation.add_argument("--target", type=float, default=1e-6, help="Error relativo máximo admitido")
+    conservation.add_argument("--csv", type=Path, default=None, help="Guardar la tabla en CSV")
+    conservation.add_argument("--json", type=Path, default=None, help="Guardar la tabla en JSON")
+    conservation.set_defaults(func=run_conservation)
+
+    from .benchmarks import BASELINE_PATH, SUITES
+
+    bench = sub.add_parser("bench", help="Banco de tiempos con comparación contra la línea base")
+    bench.add_argument("--suite", nargs="+", choices=list(SUITES) + ["apps"], default=None,
+                       help="Suites a medir (por defecto todas)")
+    bench.add_argument("--quick", action="store_true", help="Solo los tamaños pequeños")
+    bench.add_argument("--repeat", type=int, default=5, help="Repeticiones por caso")
+    bench.add_argument("--reruns", type=int, default=3, help="Reruns de AppTest por app")
+    bench.add_argument("--json", type=Path, default=None, help="Guardar resultados en JSON")
+    bench.add_argument("--csv", type=Path, default=None, help="Guardar resultados en CSV")
+    bench.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Fichero de línea base")
+    bench.add_argument("--tolerance", type=float, default=0.5,
+                       help="Margen relativo antes de contar una regresión")
+    bench.add_argument("--check", action="store_true", help="Salir con código 1 si hay regresiones")
+    bench.add_argument("--update-baseline", action="store_true", help="Reescribir la línea base")
+    bench.set_defaults(func=run_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "lookup" and args.out is None:
+        from .lookup import DEFAULT_PATH
+
+        args.out = DEFAULT_PATH
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
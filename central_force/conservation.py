@@ -0,0 +1,152 @@
+"""Monitor de conservación: error relativo de H y L sobre las trayectorias de cualquier integrador.
+
+Las trayectorias van con la forma de sol.y: componentes en el eje −2 y tiempo
+en el último, (..., 4, T) en polares [r, θ, p_r, p_θ] o (..., 6, T) en
+cartesianas [x, y, z, p_x, p_y, p_z]; todas las órbitas se comprueban a la vez.
+
+En polares p_θ es una variable del estado y ningún integrador del paquete la
+cambia (dp_θ/dt = 0 exactamente), así que el error de L es nulo salvo que se
+corrompa el estado; en cartesianas (spherical, batch 3D) L = q × p sí deriva.
+
+simulate_monitored repite la simulación afinando la tolerancia (o Δt) hasta
+cumplir el objetivo, y si el integrador no llega cambia al siguiente;
+cost_accuracy mide tiempo frente a error para elegir el más barato.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import memoize
+from .physics import energy_scale, hamiltonian
+from .simulation import METHODS, simulate_orbit
+
+ConservationError = namedtuple("ConservationError", ["energy", "angular_momentum"])
+CostAccuracy = namedtuple("CostAccuracy", ["method", "tol_digits", "dt", "seconds",
+                                           "energy_error", "momentum_error"])
+MonitoredOrbit = namedtuple("MonitoredOrbit", ["result", "method", "tol_digits", "dt",
+                                               "energy_error", "momentum_error", "attempts"])
+
+# Cifras de rtol por defecto de cada método adaptativo (rk45 usa la de solve_ivp, 1e-3)
+DEFAULT_TOL_DIGITS = {"rk45": 3, "events": 8, "levicivita": 8}
+FIXED_STEP = ("verlet", "yoshida4")
+
+
+def _momentum_scale(L0, r0, m, alpha):
+    """|L0|, o √(mα r0) si la órbita es casi radial (L0 ≈ 0)"""
+    natural = np.sqrt(np.abs(m * alpha * r0))
+    return np.where(np.abs(L0) > 1e-9 * natural, np.abs(L0), natural)
+
+
+def conservation_errors(y, m, alpha, coords="polar"):
+    """Errores relativos |H − H0|/escala y |L − L0|/escala por muestra, forma (..., T).
+
+    m y alpha pueden ser escalares o arrays con la forma de las órbitas (...).
+    """
+    y = np.asarray(y, dtype=float)
+    states = np.moveaxis(y, -2, -1)
+    m = np.asarray(m, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    m_t, alpha_t = m[..., None], alpha[..., None]
+    if coords == "polar":
+        H = hamiltonian(states, m_t, alpha_t)
+        H_scale = energy_scale(states[..., 0, :], m, alpha)
+        Lz = y[..., 3, :]
+        L_error = np.abs(Lz - Lz[..., :1])
+        r0 = y[..., 0, 0]
+        L0 = Lz[..., 0]
+    elif coords == "cartesian":
+        q, p = states[..., :3], states[..., 3:]
+        r = np.sqrt(np.sum(q * q, axis=-1))
+        H = np.sum(p * p, axis=-1) / (2 * m_t) - alpha_t / r
+        H_scale = np.where(np.abs(H[..., 0]) > 1e-9 * np.abs(alpha / r[..., 0]), np.abs(H[..., 0]),
+                           np.abs(alpha / r[..., 0]))
+        Lvec = np.cross(q, p)
+        L_error = np.sqrt(np.sum((Lvec - Lvec[..., :1, :])**2, axis=-1))
+        r0 = r[..., 0]
+        L0 = np.sqrt(np.sum(Lvec[..., 0, :]**2, axis=-1))
+    else:
+        raise ValueError(f"Coordenadas desconocidas '{coords}'; opciones: ['polar', 'cartesian']")
+    energy = np.abs(H - H[..., :1]) / H_scale[..., None]
+    momentum = L_error / _momentum_scale(L0, r0, m, alpha)[..., None]
+    return ConservationError(energy, momentum)
+
+
+def max_conservation_error(y, m, alpha, coords="polar"):
+    """Máximo en el tiempo de cada error, forma (...)"""
+    errors = conservation_errors(y, m, alpha, coords)
+    return ConservationError(np.max(errors.energy, axis=-1), np.max(errors.angular_momentum, axis=-1))
+
+
+def refinement_ladder(method, dt=0.01, levels=4):
+    """Ajustes (tol_digits, dt) de más barato a más preciso: +2 cifras de rtol o Δt/2 por nivel"""
+    if method in FIXED_STEP:
+        return [(None, dt / 2**k) for k in range(levels)]
+    if method in DEFAULT_TOL_DIGITS:
+        base = DEFAULT_TOL_DIGITS[method]
+        return [(None, dt)] + [(min(base + 2 * k, 13), dt) for k in range(1, levels)]
+    return [(None, dt)]
+
+
+def _row(method, tol_digits, dt, seconds, y, m, alpha):
+    errors = max_conservation_error(y, m, alpha)
+    return CostAccuracy(method, tol_digits, dt, seconds, float(errors.energy),
+                        float(errors.angular_momentum))
+
+
+def simulate_monitored(method, r0, theta0, pr0, L, m, alpha, t_end=20.0, n_eval=1000, dt=0.01,
+                       target=1e-6, levels=4, fallback=("levicivita", "kepler")):
+    """simulate_orbit con comprobación de H y L: afina y, si no basta, cambia de integrador.
+
+    Recorre refinement_ladder del método pedido y después la de cada método de
+    fallback hasta que el máximo de ambos errores relativos sea ≤ target. Si
+    ninguno llega, devuelve el intento con menor error. attempts guarda cada
+    intento como CostAccuracy (los aciertos de caché cuestan ~0 s).
+    """
+    attempts = []
+    best = None
+    for candidate in (method,) + tuple(f for f in fallback if f != method):
+        for tol_digits, step in refinement_ladder(candidate, dt, levels):
+            t0 = time.perf_counter()
+            result = simulate_orbit(candidate, r0, theta0, pr0, L, m, alpha, t_end=t_end,
+                                    n_eval=n_eval, dt=step, tol_digits=tol_digits)
+            row = _row(candidate, tol_digits, step, time.perf_counter() - t0, result.y, m, alpha)
+            attempts.append(row)
+            error = max(row.energy_error, row.momentum_error)
+            # Un intento NaN (integración rota) nunca desplaza a uno finito
+            if best is None or (np.isfinite(error) and not best[0] <= error):
+                best = (error, result, row)
+            if error <= target:
+                return MonitoredOrbit(result, candidate, tol_digits, step, row.energy_error,
+                                      row.momentum_error, attempts)
+    _, result, row = best
+    return MonitoredOrbit(result, row.method, row.tol_digits, row.dt, row.energy_error,
+                          row.momentum_error, attempts)
+
+
+@memoize(maxsize=16, ttl=3600)
+def cost_accuracy(r0, theta0, pr0, L, m, alpha, t_end=20.0, n_eval=1000, dt=0.01, levels=3,
+                  methods=METHODS):
+    """Tiempo de integración (sin caché) y error de conservación de cada método en cada nivel"""
+    import scipy.integrate  # noqa: F401  (la importación no cuenta como coste del primer método)
+    import scipy.interpolate  # noqa: F401
+
+    from .trajectory import orbit_trajectory
+
+    integrate = orbit_trajectory.__wrapped__
+    t = np.linspace(0.0, t_end, n_eval)
+    rows = []
+    for method in methods:
+        for tol_digits, step in refinement_ladder(method, dt, levels):
+            t0 = time.perf_counter()
+            trajectory = integrate(method, r0, theta0, pr0, L, m, alpha, t_end=t_end, dt=step,
+                                   tol_digits=tol_digits)
+            y = trajectory(t[t <= trajectory.t1])
+            rows.append(_row(method, tol_digits, step, time.perf_counter() - t0, y, m, alpha))
+    return tuple(rows)
+
+
+def cheapest(rows, target):
+    """La fila más rápida cuyo error máximo cumple target (None si ninguna)"""
+    ok = [row for row in rows if max(row.energy_error, row.momentum_error) <= target]
+    return min(ok, key=lambda row: row.seconds) if ok else None
@@ -0,0 +1,67 @@
+"""Curvas de potencial efectivo y espacio de fases listas para graficar (memoizadas)."""
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import memoize
+from .metrics import instrumented
+from .physics import (
+    calculate_turning_points,
+    get_veff,
+    phase_space_loop,
+    radial_momentum,
+    turning_points_exact,
+)
+from .potentials import from_expression, get_potential
+from .sampling import adaptive_phase, adaptive_veff
+
+CurveSet = namedtuple("CurveSet", ["r", "veff", "r_valid", "pr_pos", "r_plot", "pr_plot", "turning_points"])
+
+
+def _readonly(*arrays):
+    """Marca los arrays como de solo lectura: se comparten entre sesiones vía caché"""
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays
+
+
+@memoize(maxsize=1024, ttl=3600)
+@instrumented("compute.curve_set")
+def curve_set(E, L, m, alpha, r_lo=0.1, r_hi=8.0, n=600, tol=None, y_clip=(-10.0, 15.0)):
+    """V_eff, p_r(r), ciclo de fase cerrado y puntos de retorno exactos para (E, L, m, α).
+
+    Con tol=None se usa una malla uniforme de n puntos; con tol se muestrea de
+    forma adaptativa (ver sampling) y la curva de fase cierra en r_min y r_max.
+    """
+    if tol is None:
+        r = np.linspace(r_lo, r_hi, n)
+        veff = get_veff(r, L, m, alpha)
+        r_valid, pr_pos = radial_momentum(r, veff, E, m)
+    else:
+        r, veff = adaptive_veff(L, m, alpha, r_lo, r_hi, tol=tol, y_clip=y_clip)
+        r_valid, pr_pos = adaptive_phase(E, L, m, alpha, r_lo, r_hi, tol=tol)
+    r_plot, pr_plot = phase_space_loop(r_valid, pr_pos)
+    tp = turning_points_exact(E, L, m, alpha)
+    turning_points = tuple(x for x in (tp.r_min, tp.r_max) if np.isfinite(x))
+    _readonly(r, veff, r_valid, pr_pos, r_plot, pr_plot)
+    return CurveSet(r, veff, r_valid, pr_pos, r_plot, pr_plot, turning_points)
+
+
+@memoize(maxsize=256, ttl=3600)
+@instrumented("compute.potential_curve_set")
+def potential_curve_set(E, L, m, name, params=(), expr=None, r_lo=0.1, r_hi=8.0, n=600):
+    """Como curve_set para cualquier potencial del registro (o una expresión de usuario).
+
+    params es una tupla ordenada de pares (nombre, valor) para que sirva de clave
+    de caché. Los puntos de retorno salen de la búsqueda en malla, que es el
+    respaldo general cuando no hay forma cerrada.
+    """
+    params = dict(params)
+    potential = from_expression(expr, **params) if expr is not None else get_potential(name, **params)
+    r = np.linspace(r_lo, r_hi, n)
+    veff = potential.veff(r, L, m)
+    r_valid, pr_pos = radial_momentum(r, veff, E, m)
+    r_plot, pr_plot = phase_space_loop(r_valid, pr_pos)
+    turning_points = tuple(float(x) for x in calculate_turning_points(r, veff, E))
+    _readonly(r, veff, r_valid, pr_pos, r_plot, pr_plot)
+    return CurveSet(r, veff, r_valid, pr_pos, r_plot, pr_plot, turning_points)
@@ -0,0 +1,68 @@
+"""Elementos orbitales y precesión apsidal sobre mallas (E, L), sin integrar en el tiempo.
+
+Para Kepler se usan las fórmulas cerradas; para cualquier otro potencial, la
+cuadratura radial de Gauss–Chebyshev (ver quadrature).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import memoize
+from .metrics import instrumented
+from .potentials import from_expression, get_potential
+from .quadrature import radial_quadrature
+
+OrbitalElements = namedtuple("OrbitalElements", ["E", "L", "e", "a", "period", "precession"])
+
+
+def kepler_orbital_elements(E, L, m, alpha):
+    """Excentricidad, semieje mayor, periodo y precesión (nula) de Kepler, vectorizados.
+
+    a y el periodo solo tienen sentido para E < 0; las órbitas con E por debajo
+    del mínimo de V_eff dan NaN en todo.
+    """
+    E, L = np.broadcast_arrays(np.asarray(E, dtype=float), np.asarray(L, dtype=float))
+    e2 = 1 + 2 * E * L**2 / (m * alpha**2)
+    allowed = e2 >= 0
+    bound = allowed & (E < 0)
+    e = np.where(allowed, np.sqrt(np.maximum(e2, 0.0)), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(allowed, -alpha / (2 * E), np.nan)
+        period = np.where(bound, 2 * np.pi * np.sqrt(m * np.abs(a)**3 / alpha), np.nan)
+    precession = np.where(bound, 0.0, np.nan)
+    return OrbitalElements(E, L, e, a, period, precession)
+
+
+def orbital_elements(E, L, m, potential, r_lo=1e-3, r_hi=100.0, n_scan=256, n_nodes=64):
+    """Elementos de las órbitas ligadas de un potencial cualquiera, todo vectorizado.
+
+    e = (r_max − r_min)/(r_max + r_min) y a = (r_min + r_max)/2; el periodo radial
+    y la precesión Δθ − 2π salen de radial_quadrature. Las combinaciones sin
+    pozo o no ligadas en [r_lo, r_hi] quedan en NaN.
+    """
+    E, L = np.broadcast_arrays(np.asarray(E, dtype=float), np.asarray(L, dtype=float))
+    q = radial_quadrature(E, L, m, potential, r_lo, r_hi, n_scan, n_nodes)
+    e = (q.r_max - q.r_min) / (q.r_max + q.r_min)
+    a = 0.5 * (q.r_min + q.r_max)
+    return OrbitalElements(E, L, e, a, q.period, q.delta_theta - 2 * np.pi)
+
+
+@memoize(maxsize=32, ttl=3600)
+@instrumented("compute.element_sweep")
+def element_sweep(m, name, params=(), expr=None, E_lo=-2.0, E_hi=2.0, L_lo=0.5, L_hi=3.0,
+                  n_E=121, n_L=101):
+    """Elementos orbitales en una malla (n_L, n_E) de (E, L) para un potencial del registro.
+
+    Mismo convenio de claves que potential_curve_set; Kepler sin expresión de
+    usuario usa las fórmulas cerradas y el resto la cuadratura.
+    """
+    E, L = np.meshgrid(np.linspace(E_lo, E_hi, n_E), np.linspace(L_lo, L_hi, n_L))
+    params = dict(params)
+    if name == "kepler" and expr is None:
+        result = kepler_orbital_elements(E, L, m, params.get("alpha", 1.0))
+    else:
+        potential = from_expression(expr, **params) if expr is not None else get_potential(name, **params)
+        result = orbital_elements(E, L, m, potential)
+    for a in result:
+        a.flags.writeable = False
+    return result
@@ -0,0 +1,121 @@
+"""Integración dirigida por eventos: periapsis, apoapsis, escape y colisión.
+
+Para órbitas ligadas se integra como mucho hasta completar un periodo radial
+(de un ápside al mismo ápside, pasando por el opuesto) y el resto de la trayectoria se obtiene
+repitiendo ese tramo con θ desplazado Δθ por vuelta.
+"""
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from .physics import derivadas_orbita, hamiltonian, turning_points_exact
+
+
+def _event(func, terminal, direction):
+    func.terminal = terminal
+    func.direction = direction
+    return func
+
+
+def _make_events(r_escape, r_collision):
+    """Funciones de evento de solve_ivp; p_r cruza 0 hacia arriba en el periapsis"""
+    periapsis = _event(lambda t, y, m, alpha: y[2], True, 1)
+    apoapsis = _event(lambda t, y, m, alpha: y[2], True, -1)
+    escape = _event(lambda t, y, m, alpha: y[0] - r_escape, True, 1)
+    collision = _event(lambda t, y, m, alpha: y[0] - r_collision, True, -1)
+    return periapsis, apoapsis, escape, collision
+
+
+def integrate_events(y0, m, alpha, t_end=20.0, r_escape=50.0, r_collision=1e-3,
+                     rtol=1e-8, atol=1e-10):
+    """Integra hasta t_end, escape, colisión o un periodo radial completo.
+
+    Solo una órbita no ligada (H ≥ 0) puede escapar: el evento de escape se
+    activa únicamente en ese caso, al cruzar hacia fuera max(r_escape, 2·r0).
+    Una órbita ligada con r_max > r_escape sigue siendo ligada.
+
+    Devuelve un dict con el evaluador denso `sol(t)` (acepta cualquier t en
+    [0, t_end], extendiendo periódicamente si la órbita se cerró), el estado
+    final alcanzado (`status`: 't_end', 'escape', 'colisión' o 'periódica'),
+    `t_stop`, los instantes de periapsis/apoapsis, el periodo radial, Δθ por
+    periodo y el número de evaluaciones de la derivada.
+    """
+    y0 = np.asarray(y0, dtype=float)
+    r0, _, pr0, L = y0
+    tp = turning_points_exact(hamiltonian(y0, m, alpha), L, m, alpha)
+    periapsis, apoapsis, escape, collision = _make_events(max(r_escape, 2 * r0), r_collision)
+    if tp.bound:
+        escape = None
+    # En una órbita circular p_r ≈ 0 oscila con el ruido numérico: sin eventos de ápsides
+    circular = tp.bound and tp.r_max - tp.r_min <= 1e-6 * tp.r_circular
+    # Primero el ápside hacia el que se mueve la partícula, luego el opuesto y de nuevo el primero
+    outward = pr0 > 0 or (pr0 == 0 and r0 < tp.r_circular)
+    first, second = (apoapsis, periapsis) if outward else (periapsis, apoapsis)
+    targets = () if circular else (first, second, first)
+    segments = []
+    nfev = 0
+    t0, y = 0.0, y0
+    apse_times = []
+
+    for target in targets or (None,):
+        active = [(name, event) for name, event in
+                  (("ápside", target), ("escape", escape), ("colisión", collision)) if event is not None]
+        sol = solve_ivp(derivadas_orbita, (t0, t_end), y, args=(m, alpha), method="RK45",
+                        events=[event for _, event in active], dense_output=True, rtol=rtol, atol=atol)
+        nfev += sol.nfev
+        segments.append((t0, sol.t[-1], sol.sol))
+        t0, y = sol.t[-1], sol.y[:, -1]
+        fired = {name for (name, _), times in zip(active, sol.t_events) if len(times)}
+        if "escape" in fired:
+            status = "escape"
+            break
+        if "colisión" in fired:
+            status = "colisión"
+            break
+        if "ápside" not in fired:
+            status = "t_end"
+            break
+        apse_times.append(t0)
+    else:
+        status = "periódica"
+
+    info = {"status": status, "t_stop": t0, "nfev": nfev, "period": None, "delta_theta": None}
+    if status == "periódica":
+        t1, t2, t3 = apse_times
+        period = t3 - t1
+        delta_theta = float(segments[2][2](t3)[1] - segments[1][2](t1)[1])
+        info.update(period=period, delta_theta=delta_theta, t_stop=t_end)
+        apse_times = [t1 + period * np.arange(int((t_end - t1) // period) + 1),
+                      t2 + period * np.arange(int(max(0.0, t_end - t2) // period) + 1)]
+    else:
+        apse_times = [apse_times[0::2], apse_times[1::2]]
+    peri_times, apo_times = (apse_times[1], apse_times[0]) if outward else apse_times
+    info["periapsis"] = [float(t) for t in peri_times]
+    info["apoapsis"] = [float(t) for t in apo_times]
+
+    def evaluate(t):
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        out = np.empty((4, t.size))
+        shift = np.zeros(t.size)
+        tau = t.copy()
+        if info["period"] is not None:
+            t1 = segments[1][0]
+            k = np.maximum(0, np.floor((t - t1) / info["period"]))
+            tau = np.where(t > t1, t - k * info["period"], t)
+            shift = k * info["delta_theta"]
+        for s0, s1, dense in segments:
+            mask = (tau >= s0) & (tau <= s1)
+            if mask.any():
+                out[:, mask] = dense(tau[mask])
+        out[1] += shift
+        return out
+
+    info["sol"] = evaluate
+    return info
+
+
+def propagate_events(t_eval, y0, m, alpha, **kwargs):
+    """(t, y) como solve_ivp, recortado en el instante de escape/colisión, más la info de eventos"""
+    info = integrate_events(y0, m, alpha, t_end=float(np.max(t_eval)), **kwargs)
+    t = np.asarray(t_eval, dtype=float)
+    t = t[t <= info["t_stop"]]
+    return t, info["sol"](t), info
@@ -0,0 +1,107 @@
+"""Propagador analítico de Kepler para U(r) = -α/r (sin integración numérica)."""
+import numpy as np
+
+# Tolerancia relativa en |ε| por debajo de la cual la órbita se trata como parabólica
+PARABOLIC_TOL = 1e-10
+
+
+def solve_kepler_elliptic(M, e, tol=1e-13, max_iter=50):
+    """Resuelve E − e·sin E = M (vectorizado, Halley) conservando las vueltas completas"""
+    M = np.asarray(M, dtype=float)
+    turns = np.floor((M + np.pi) / (2 * np.pi))
+    Mr = M - 2 * np.pi * turns  # Reducido a [-π, π)
+    E = Mr + 0.85 * e * np.sign(np.sin(Mr))  # Arranque de Danby
+    for _ in range(max_iter):
+        s, c = np.sin(E), np.cos(E)
+        f = E - e * s - Mr
+        f1 = 1 - e * c
+        f2 = e * s
+        dE = f / (f1 - 0.5 * f * f2 / f1)
+        E -= dE
+        if np.max(np.abs(dE), initial=0.0) < tol:
+            break
+    return E + 2 * np.pi * turns
+
+
+def solve_kepler_hyperbolic(M, e, tol=1e-13, max_iter=50):
+    """Resuelve e·sinh F − F = M (vectorizado, Halley)"""
+    M = np.asarray(M, dtype=float)
+    F = np.arcsinh(M / e)
+    for _ in range(max_iter):
+        s, c = np.sinh(F), np.cosh(F)
+        f = e * s - F - M
+        f1 = e * c - 1
+        f2 = e * s
+        dF = f / (f1 - 0.5 * f * f2 / f1)
+        F -= dF
+        if np.max(np.abs(dF), initial=0.0) < tol * max(1.0, np.max(np.abs(F), initial=0.0)):
+            break
+    return F
+
+
+def solve_barker(B):
+    """Resuelve D + D³/3 = B (ecuación de Barker) en forma cerrada"""
+    B = np.asarray(B, dtype=float)
+    w = np.cbrt(1.5 * B + np.sqrt(2.25 * B**2 + 1))
+    return w - 1 / w
+
+
+def kepler_elements(y0, m, alpha):
+    """Elementos (p, e, ε, k, h) a partir del estado inicial [r, θ, p_r, p_θ]"""
+    r0, _, pr0, L = (float(v) for v in y0)
+    if not np.isfinite([r0, pr0, L]).all():
+        raise ValueError("Estado inicial no finito: r0 está en la zona clásicamente prohibida")
+    if L == 0:
+        raise ValueError("El propagador de Kepler requiere L ≠ 0 (órbita radial)")
+    k = alpha / m  # Parámetro gravitacional por unidad de masa
+    h = L / m  # Momento angular específico
+    eps = (pr0 / m)**2 / 2 + h**2 / (2 * r0**2) - k / r0  # Energía específica
+    p = h**2 / k
+    e = np.sqrt(max(0.0, 1 + 2 * eps * h**2 / k**2))
+    return p, e, eps, k, h
+
+
+def propagate_kepler(t_eval, y0, m, alpha, t0=0.0):
+    """Estado [r, θ, p_r, p_θ] en los instantes t_eval, con la forma (4, T) de sol.y de solve_ivp.
+
+    Acepta las mismas entradas que la llamada a solve_ivp con derivadas_orbita:
+    y0 = [r0, θ0, p_r0, L] y los parámetros (m, α). Cada muestra cuesta O(1),
+    independientemente de lo lejos que esté de t0.
+    """
+    t = np.asarray(t_eval, dtype=float) - t0
+    r0, theta0, pr0, L = (float(v) for v in y0)
+    p, e, eps, k, h = kepler_elements(y0, m, alpha)
+    vr0 = pr0 / m
+    habs = abs(h)
+
+    if abs(eps) <= PARABOLIC_TOL * k / r0:
+        # Rama parabólica: D = tan(ν/2)
+        D0 = np.sign(vr0) * np.sqrt(max(0.0, 2 * r0 / p - 1))
+        B0 = D0 + D0**3 / 3
+        D = solve_barker(B0 + 2 * t * np.sqrt(k / p**3))
+        nu, nu0 = 2 * np.arctan(D), 2 * np.arctan(D0)
+        r = p * (1 + D**2) / 2
+        e = 1.0
+    elif eps < 0:
+        # Rama elíptica
+        a = -k / (2 * eps)
+        n = np.sqrt(k / a**3)
+        E0 = np.arctan2(r0 * vr0 / np.sqrt(k * a), 1 - r0 / a)  # (e sin E0, e cos E0)
+        E = solve_kepler_elliptic(E0 - e * np.sin(E0) + n * t, e)
+        beta = e / (1 + np.sqrt(1 - e**2))
+        nu = E + 2 * np.arctan(beta * np.sin(E) / (1 - beta * np.cos(E)))
+        nu0 = E0 + 2 * np.arctan(beta * np.sin(E0) / (1 - beta * np.cos(E0)))
+        r = a * (1 - e * np.cos(E))
+    else:
+        # Rama hiperbólica
+        a = k / (2 * eps)
+        n = np.sqrt(k / a**3)
+        F0 = np.arcsinh(r0 * vr0 / (e * np.sqrt(k * a)))
+        F = solve_kepler_hyperbolic(e * np.sinh(F0) - F0 + n * t, e)
+        g = np.sqrt((e + 1) / (e - 1))
+        nu, nu0 = 2 * np.arctan(g * np.tanh(F / 2)), 2 * np.arctan(g * np.tanh(F0 / 2))
+        r = a * (e * np.cosh(F) - 1)
+
+    theta = theta0 + np.sign(h) * (nu - nu0)
+    pr = m * (k / habs) * e * np.sin(nu)
+    return np.vstack([r, theta, pr, np.full_like(r, L)])
@@ -0,0 +1,169 @@
+"""Tabla precalculada sobre la malla de sliders: V_eff, región permitida y puntos de retorno.
+
+Se construye una vez fuera de línea:
+
+    python -m central_force.lookup --out data/lookup
+
+y las apps la abren con np.load(mmap_mode="r"), de modo que cada render es un
+acceso por índice en lugar de un recálculo. La curva de fase se reconstruye con
+una sola raíz cuadrada sobre el tramo [inicio, fin) de V_eff ya almacenado.
+"""
+import argparse
+import functools
+import json
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from .curves import CurveSet, curve_set
+from .physics import get_veff, phase_space_loop, turning_points_exact
+
+Axis = namedtuple("Axis", ["start", "stop", "step"])
+
+# Malla de sliders del Laboratorio Virtual (classical_mechanics_quizzes/main.py)
+MAIN_LATTICE = {
+    "E": Axis(-2.0, 2.0, 0.1),
+    "L": Axis(0.5, 3.0, 0.1),
+    "m": Axis(0.5, 2.0, 0.1),
+    "alpha": Axis(0.5, 3.0, 0.1),
+}
+MAIN_R_GRID = (0.1, 8.0, 600)
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "lookup"
+
+_AXES = ("E", "L", "m", "alpha")
+
+
+def axis_values(axis):
+    """Valores de un eje de slider (incluye el extremo superior)"""
+    n = int(round((axis.stop - axis.start) / axis.step)) + 1
+    return axis.start + axis.step * np.arange(n)
+
+
+def build_lookup_table(out, lattice=MAIN_LATTICE, r_grid=MAIN_R_GRID):
+    """Precalcula la tabla para toda la malla y la escribe en el directorio out"""
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    E, L, m, alpha = (axis_values(lattice[k]) for k in _AXES)
+    r = np.linspace(*r_grid)
+
+    # V_eff no depende de E: (nL, nm, nα, nr)
+    Lg, mg, ag = np.meshgrid(L, m, alpha, indexing="ij")
+    veff = get_veff(r, Lg[..., None], mg[..., None], ag[..., None])
+    np.save(out / "veff.npy", veff.astype(np.float32))
+
+    # Región permitida E >= V_eff como tramo contiguo [inicio, fin) de la malla en r
+    span = np.zeros((len(E),) + Lg.shape + (2,), dtype=np.int16)
+    for i, e in enumerate(E):
+        allowed = e >= veff
+        any_allowed = allowed.any(axis=-1)
+        start = np.argmax(allowed, axis=-1)
+        stop = len(r) - np.argmax(allowed[..., ::-1], axis=-1)
+        span[i, ..., 0] = np.where(any_allowed, start, 0)
+        span[i, ..., 1] = np.where(any_allowed, stop, 0)
+    np.save(out / "span.npy", span)
+
+    tp = turning_points_exact(E[:, None, None, None], Lg, mg, ag)
+    np.save(out / "turning.npy", np.stack([tp.r_min, tp.r_max], axis=-1))
+
+    meta = {"lattice": {k: list(lattice[k]) for k in _AXES}, "r_grid": list(r_grid)}
+    (out / "meta.json").write_text(json.dumps(meta, indent=2))
+    return out
+
+
+class LookupTable:
+    """Tabla mapeada en memoria; curve_set devuelve lo mismo que curves.curve_set"""
+
+    def __init__(self, path):
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        self.lattice = {k: Axis(*meta["lattice"][k]) for k in _AXES}
+        self.r_grid = tuple(meta["r_grid"])
+        self.r = np.linspace(*self.r_grid)
+        self.r.flags.writeable = False
+        self.veff = np.load(path / "veff.npy", mmap_mode="r")
+        self.span = np.load(path / "span.npy", mmap_mode="r")
+        self.turning = np.load(path / "turning.npy", mmap_mode="r")
+
+    def index(self, E, L, m, alpha):
+        """Índices (iE, iL, im, iα) de un punto de la malla, o None si está fuera"""
+        idx = []
+        for key, value in zip(_AXES, (E, L, m, alpha)):
+            axis = self.lattice[key]
+            i = int(round((value - axis.start) / axis.step))
+            n = int(round((axis.stop - axis.start) / axis.step)) + 1
+            if not 0 <= i < n or abs(axis.start + i * axis.step - value) > 1e-6:
+                return None
+            idx.append(i)
+        return tuple(idx)
+
+    def curve_set(self, E, L, m, alpha):
+        """Curvas para (E, L, m, α) por acceso directo, o None fuera de la malla.
+
+        La rama de fase se cierra con p_r = 0 en los puntos de retorno exactos
+        guardados que caen dentro de la malla en r, como curve_set con tol.
+        """
+        idx = self.index(E, L, m, alpha)
+        if idx is None:
+            return None
+        iE, rest = idx[0], idx[1:]
+        veff = self.veff[rest].astype(float)
+        start, stop = self.span[(iE,) + rest]
+        r_valid = self.r[start:stop]
+        pr_pos = np.sqrt(2 * m * np.maximum(E - veff[start:stop], 0.0))
+        r_min, r_max = (float(x) for x in self.turning[idx])
+        if start < stop:
+            # Sin los nodos que el redondeo de V_eff a float32 deja fuera de [r_min, r_max]
+            inside = (r_valid > r_min) & (r_valid < r_max)
+            r_valid, pr_pos = r_valid[inside], pr_pos[inside]
+            if self.r[0] <= r_min:
+                r_valid, pr_pos = np.r_[r_min, r_valid], np.r_[0.0, pr_pos]
+            if r_max <= self.r[-1]:
+                r_valid, pr_pos = np.r_[r_valid, r_max], np.r_[pr_pos, 0.0]
+        r_plot, pr_plot = phase_space_loop(r_valid, pr_pos)
+        turning_points = tuple(float(x) for x in self.turning[idx] if np.isfinite(x))
+        return CurveSet(self.r, veff, r_valid, pr_pos, r_plot, pr_plot, turning_points)
+
+
+@functools.lru_cache(maxsize=None)
+def load_lookup_table(path=DEFAULT_PATH):
+    """Abre (una vez por proceso) la tabla en path; None si no se ha construido"""
+    path = Path(path)
+    if not (path / "meta.json").exists():
+        return None
+    return LookupTable(path)
+
+
+def lattice_covers(E, L, m, alpha, r_lo=0.1, r_hi=8.0, n=600, path=DEFAULT_PATH):
+    """True si lattice_curve_set serviría el punto desde la tabla (y no desde la caché de curve_set)"""
+    table = load_lookup_table(path)
+    return (table is not None and table.r_grid == (r_lo, r_hi, n)
+            and table.index(E, L, m, alpha) is not None)
+
+
+def lattice_curve_set(E, L, m, alpha, r_lo=0.1, r_hi=8.0, n=600, path=DEFAULT_PATH, tol=1e-3,
+                      y_clip=(-10.0, 15.0)):
+    """Sirve las curvas desde la tabla si existe y cubre el punto; si no, usa curve_set.
+
+    Fuera de la tabla se muestrea de forma adaptativa con tol e y_clip (tol=None
+    usa la malla uniforme de n puntos). En ambos casos la curva de fase cierra
+    con p_r = 0 en los puntos de retorno exactos; la tabla guarda V_eff en su
+    malla uniforme, que es la que fija n.
+    """
+    if lattice_covers(E, L, m, alpha, r_lo, r_hi, n, path):
+        return load_lookup_table(path).curve_set(E, L, m, alpha)
+    return curve_set(E, L, m, alpha, r_lo, r_hi, n, tol=tol, y_clip=y_clip)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construye la tabla precalculada de la malla de sliders")
+    parser.add_argument("--out", default=str(DEFAULT_PATH), help="Directorio de salida")
+    args = parser.parse_args(argv)
+    out = build_lookup_table(args.out)
+    size = sum(f.stat().st_size for f in out.iterdir())
+    print(f"Tabla escrita en {out} ({size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
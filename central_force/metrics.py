@@ -0,0 +1,206 @@
+"""Instrumentación opcional: tramos con tiempo (spans) agregados en histogramas por nombre.
+
+Se activa con CENTRAL_FORCE_METRICS=1 (o enable_metrics()). Desactivada,
+span() devuelve siempre el mismo contexto vacío, observe() vuelve al instante
+e instrumented() solo añade una comprobación de booleano por llamada.
+
+Con CENTRAL_FORCE_METRICS_FILE=ruta.prom (o .json) write_metrics() vuelca los
+histogramas a ese fichero en formato de texto de Prometheus (apto para el
+textfile collector de node_exporter) o en JSON; las apps lo llaman al final
+de cada ejecución completa.
+"""
+import bisect
+import contextlib
+import functools
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+
+ENV_FLAG = "CENTRAL_FORCE_METRICS"
+ENV_FILE = "CENTRAL_FORCE_METRICS_FILE"
+
+# Límites superiores de los cubos en segundos (los de prometheus_client, ampliados a 0.5 ms)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+           math.inf)
+
+clock = time.perf_counter
+
+
+class Histogram:
+    """Cuenta de duraciones por cubo, suma, máximo y número de observaciones"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        i = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += seconds
+            self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """Cuantil estimado interpolando dentro del cubo (como histogram_quantile de Prometheus), ≤ máximo"""
+        with self._lock:
+            if self.count == 0:
+                return math.nan
+            rank = q * self.count
+            cumulative, lower = 0, 0.0
+            for upper, n in zip(self.buckets, self.counts):
+                if n and cumulative + n >= rank:
+                    if math.isinf(upper):
+                        return self.max
+                    return min(lower + (upper - lower) * (rank - cumulative) / n, self.max)
+                cumulative += n
+                lower = upper
+            return self.max
+
+    def snapshot(self):
+        with self._lock:
+            cumulative = 0
+            buckets = []
+            for upper, n in zip(self.buckets, self.counts):
+                cumulative += n
+                buckets.append(["+Inf" if math.isinf(upper) else upper, cumulative])
+            return {"count": self.count, "sum": self.sum, "max": self.max, "buckets": buckets}
+
+
+_ENABLED = os.environ.get(ENV_FLAG, "").lower() not in ("", "0", "false", "no")
+_HISTOGRAMS = {}
+_LOCK = threading.Lock()
+_NULL = contextlib.nullcontext()
+
+
+def metrics_enabled():
+    return _ENABLED
+
+
+def enable_metrics(flag=True):
+    global _ENABLED
+    _ENABLED = bool(flag)
+
+
+def reset_metrics():
+    with _LOCK:
+        _HISTOGRAMS.clear()
+
+
+def histogram(name):
+    """Histograma del tramo name (se crea la primera vez)"""
+    hist = _HISTOGRAMS.get(name)
+    if hist is None:
+        with _LOCK:
+            hist = _HISTOGRAMS.setdefault(name, Histogram())
+    return hist
+
+
+def observe(name, seconds):
+    """Suma una duración ya medida (p. ej. clock() al principio y al final de un script)"""
+    if _ENABLED:
+        histogram(name).observe(seconds)
+
+
+class _Span:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = clock()
+        return self
+
+    def __exit__(self, *exc):
+        histogram(self.name).observe(clock() - self.t0)
+        return False
+
+
+def span(name):
+    """Contexto que mide su bloque en el histograma name (vacío si la instrumentación está apagada)"""
+    if not _ENABLED:
+        return _NULL
+    return _Span(name)
+
+
+def instrumented(name=None):
+    """Decorador: cada llamada es un tramo (por defecto con el nombre calificado de la función)"""
+    def decorator(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            with _Span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def metrics_summary():
+    """Filas por tramo (de más a menos tiempo total): llamadas, total, media, p50, p95 y máximo en ms"""
+    with _LOCK:
+        items = list(_HISTOGRAMS.items())
+    rows = []
+    for name, hist in items:
+        snap = hist.snapshot()
+        if not snap["count"]:
+            continue
+        rows.append({
+            "span": name,
+            "count": snap["count"],
+            "total_ms": snap["sum"] * 1e3,
+            "mean_ms": snap["sum"] / snap["count"] * 1e3,
+            "p50_ms": hist.quantile(0.5) * 1e3,
+            "p95_ms": hist.quantile(0.95) * 1e3,
+            "max_ms": snap["max"] * 1e3,
+        })
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+
+def export_json():
+    with _LOCK:
+        items = sorted(_HISTOGRAMS.items())
+    return {"spans": {name: hist.snapshot() for name, hist in items}}
+
+
+def export_prometheus():
+    """Histogramas en formato de exposición de texto de Prometheus"""
+    metric = "central_force_span_seconds"
+    lines = [f"# HELP {metric} Duración de los tramos instrumentados de las apps",
+             f"# TYPE {metric} histogram"]
+    for name, snap in export_json()["spans"].items():
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        for upper, cumulative in snap["buckets"]:
+            lines.append(f'{metric}_bucket{{span="{label}",le="{upper}"}} {cumulative}')
+        lines.append(f'{metric}_sum{{span="{label}"}} {snap["sum"]:.9g}')
+        lines.append(f'{metric}_count{{span="{label}"}} {snap["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path=None):
+    """Vuelca los histogramas a path (o a $CENTRAL_FORCE_METRICS_FILE): JSON si acaba en .json.
+
+    La escritura es atómica (fichero temporal y rename), así que un
+    recolector nunca lee un fichero a medias. Devuelve la ruta o None.
+    """
+    path = path or os.environ.get(ENV_FILE)
+    if not _ENABLED or not path:
+        return None
+    path = Path(path)
+    text = json.dumps(export_json(), indent=2) if path.suffix == ".json" else export_prometheus()
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return path
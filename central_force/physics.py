@@ -0,0 +1,108 @@
+"""Física del problema de fuerza central U(r) = -α/r (NumPy puro, sin Streamlit)."""
+from collections import namedtuple
+
+import numpy as np
+
+TurningPoints = namedtuple("TurningPoints", ["r_min", "r_max", "r_circular", "bound"])
+
+
+# --- Potencial efectivo ---
+def get_veff(r, L, m, alpha):
+    """Calcula el potencial efectivo evitando división por cero"""
+    r = np.maximum(r, 1e-10)  # Mejor protección contra división por cero
+    return (L**2) / (2 * m * r**2) - (alpha / r)
+
+
+def turning_points_exact(E, L, m, alpha):
+    """Puntos de retorno exactos de E = L²/2mr² − α/r (cuadrática en u = 1/r), vectorizado.
+
+    Devuelve TurningPoints(r_min, r_max, r_circular, bound) con la forma de la
+    difusión de (E, L, m, α): r_max = inf para órbitas no ligadas (E >= 0) y
+    r_min = r_max = NaN cuando E está por debajo del mínimo de V_eff.
+    """
+    E, L, m, alpha = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (E, L, m, alpha)))
+    l2m = L**2 / m
+    disc = alpha**2 + 2 * E * l2m
+    allowed = disc >= 0
+    sq = np.sqrt(np.where(allowed, disc, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # r_min = 1/u_+ y r_max = 1/u_- con u_- = −2E/(α + √disc) para evitar cancelación
+        r_min = np.where(allowed, l2m / (alpha + sq), np.nan)
+        r_max = np.where(allowed & (E < 0), -(alpha + sq) / (2 * E), np.inf)
+        r_max = np.where(allowed, r_max, np.nan)
+        r_circular = l2m / alpha
+    bound = allowed & (E < 0)
+    if r_min.ndim == 0:
+        return TurningPoints(float(r_min), float(r_max), float(r_circular), bool(bound))
+    return TurningPoints(r_min, r_max, r_circular, bound)
+
+
+def calculate_turning_points(r, veff, E):
+    """Calcula los puntos de retorno donde E = V_eff sobre una malla (para potenciales arbitrarios)"""
+    crossings = np.where(np.diff(np.sign(E - veff)))[0]
+    turning_points = []
+    for idx in crossings:
+        if idx + 1 < len(r):
+            # Interpolación lineal para mayor precisión
+            r1, r2 = r[idx], r[idx + 1]
+            v1, v2 = veff[idx], veff[idx + 1]
+            if v1 != v2:
+                t_point = r1 + (r2 - r1) * (E - v1) / (v2 - v1)
+                turning_points.append(t_point)
+    return turning_points
+
+
+# --- Espacio de fases radial ---
+def radial_momentum(r, veff, E, m):
+    """Devuelve (r, p_r >= 0) sobre la región clásicamente permitida E >= V_eff"""
+    kinetic = E - veff
+    valid_mask = kinetic >= 0
+    return r[valid_mask], np.sqrt(2 * m * kinetic[valid_mask])
+
+
+def phase_space_loop(r_valid, pr_pos):
+    """Cierra la curva de fase concatenando la rama p_r > 0 y la rama p_r < 0"""
+    r_plot = np.concatenate([r_valid, r_valid[::-1]])
+    pr_plot = np.concatenate([pr_pos, -pr_pos[::-1]])
+    return r_plot, pr_plot
+
+
+def initial_radial_momentum(r0, E, L, m, alpha):
+    """p_r inicial compatible con la energía E en r0 (NaN si r0 está en zona prohibida)"""
+    return np.sqrt(2 * m * (E - get_veff(r0, L, m, alpha)))
+
+
+# --- Dinámica ---
+def derivadas_orbita(t, y, m, alpha):
+    """Ecuaciones de Hamilton en el plano ecuatorial para (r, θ, p_r, p_θ)"""
+    r, theta, pr, ptheta = y
+    drdt = pr/m
+    dthetadt = ptheta/(m*r**2)
+    dprdt = ptheta**2/(m*r**3) - alpha/r**2
+    dpthetadt = 0
+    return [drdt, dthetadt, dprdt, dpthetadt]
+
+
+def orbital_type(E, L):
+    """Clasifica la órbita según el signo de la energía"""
+    if E < 0:
+        return "Elíptica"
+    elif E == 0:
+        return "Parabólica"
+    else:
+        return "Hiperbólica"
+
+
+def hamiltonian(y, m, alpha):
+    """H = p_r²/2m + p_θ²/2mr² − α/r evaluado sobre estados [r, θ, p_r, p_θ] (último eje)"""
+    y = np.asarray(y, dtype=float)
+    r, pr, ptheta = y[..., 0], y[..., 2], y[..., 3]
+    return pr**2 / (2 * m) + get_veff(r, ptheta, m, alpha)
+
+
+def energy_scale(y, m, alpha):
+    """Escala para errores relativos de energía: |H|, o α/r si H ≈ 0 (órbita parabólica)"""
+    y = np.asarray(y, dtype=float)
+    H = np.abs(hamiltonian(y, m, alpha))
+    U = np.abs(alpha / y[..., 0])
+    return np.where(H > 1e-9 * U, H, U)
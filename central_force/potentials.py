@@ -0,0 +1,228 @@
+"""Registro de potenciales centrales U(r) con U, dU/dr y V_eff vectorizados.
+
+Los potenciales simbólicos (expresiones de usuario) se convierten una sola vez
+en funciones NumPy con sympy.lambdify y se guardan en caché por expresión.
+"""
+import ast
+import functools
+import math
+import operator
+import re
+
+import numpy as np
+
+
+class Potential:
+    """Potencial central con parámetros fijados: U(r), dU/dr y V_eff(r; L, m)"""
+
+    def __init__(self, name, U, dU, params=None, latex=""):
+        self.name = name
+        self.params = dict(params or {})
+        self.latex = latex
+        self._U = U
+        self._dU = dU
+
+    def U(self, r):
+        r = np.maximum(r, 1e-10)
+        return self._U(r, **self.params)
+
+    def dU(self, r):
+        r = np.maximum(r, 1e-10)
+        return self._dU(r, **self.params)
+
+    def veff(self, r, L, m):
+        """V_eff = L²/2mr² + U(r)"""
+        r = np.maximum(r, 1e-10)
+        return (L**2) / (2 * m * r**2) + self.U(r)
+
+    def derivadas(self, t, y, m):
+        """Ecuaciones de Hamilton en el plano para [r, θ, p_r, p_θ] (análogo a derivadas_orbita)"""
+        r, theta, pr, ptheta = y
+        return [pr/m, ptheta/(m*r**2), ptheta**2/(m*r**3) - self.dU(r), 0]
+
+    def derivadas_batch(self, y, m):
+        """Versión vectorizada para estados (N, 4)"""
+        r, pr, ptheta = y[:, 0], y[:, 2], y[:, 3]
+        dydt = np.empty_like(y)
+        dydt[:, 0] = pr / m
+        dydt[:, 1] = ptheta / (m * r**2)
+        dydt[:, 2] = ptheta**2 / (m * r**3) - self.dU(r)
+        dydt[:, 3] = 0.0
+        return dydt
+
+    def with_params(self, **params):
+        """Copia con algunos parámetros sustituidos"""
+        return Potential(self.name, self._U, self._dU, {**self.params, **params}, self.latex)
+
+    def __repr__(self):
+        args = ", ".join(f"{k}={v!r}" for k, v in self.params.items())
+        return f"Potential({self.name!r}, {args})"
+
+
+# --- Registro ---
+POTENTIALS = {}
+
+
+def register_potential(potential):
+    """Añade (o reemplaza) un potencial en el registro por su nombre"""
+    POTENTIALS[potential.name] = potential
+    return potential
+
+
+def get_potential(name, **params):
+    """Potencial registrado `name` con los parámetros dados sobre sus valores por defecto"""
+    try:
+        base = POTENTIALS[name]
+    except KeyError:
+        raise KeyError(f"Potencial desconocido '{name}'; opciones: {sorted(POTENTIALS)}") from None
+    return base.with_params(**params) if params else base
+
+
+register_potential(Potential(
+    "kepler",
+    lambda r, alpha: -alpha / r,
+    lambda r, alpha: alpha / r**2,
+    {"alpha": 1.0}, r"-\frac{\alpha}{r}",
+))
+register_potential(Potential(
+    "power",
+    lambda r, k, n: k * r**n,
+    lambda r, k, n: k * n * r**(n - 1),
+    {"k": 1.0, "n": 2.0}, r"k\,r^{n}",
+))
+register_potential(Potential(
+    "yukawa",
+    lambda r, alpha, lam: -alpha * np.exp(-r / lam) / r,
+    lambda r, alpha, lam: alpha * np.exp(-r / lam) * (1 / r**2 + 1 / (lam * r)),
+    {"alpha": 1.0, "lam": 5.0}, r"-\frac{\alpha e^{-r/\lambda}}{r}",
+))
+register_potential(Potential(
+    "harmonic",
+    lambda r, k: 0.5 * k * r**2,
+    lambda r, k: k * r,
+    {"k": 1.0}, r"\frac{1}{2}k r^2",
+))
+register_potential(Potential(
+    "gr",
+    lambda r, alpha, beta: -alpha / r - beta / r**3,
+    lambda r, alpha, beta: alpha / r**2 + 3 * beta / r**4,
+    {"alpha": 1.0, "beta": 0.05}, r"-\frac{\alpha}{r} - \frac{\beta}{r^3}",
+))
+
+
+# --- Expresiones de usuario ---
+_ALLOWED_NAMES = {"r", "exp", "log", "sqrt", "sin", "cos", "tan", "sinh", "cosh", "tanh",
+                  "atan", "pi", "E"}
+_TOKEN = re.compile(r"\s*(?:([A-Za-z_]\w*)|(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+)|(\*\*|[-+*/^(),]))")
+# Límites que impiden que sympy se quede calculando enteros gigantes (p. ej. 9**9**9)
+MAX_EXPRESSION_LENGTH = 200
+MAX_LITERAL_LENGTH = 15
+MAX_EXPONENT = 100.0
+_CONSTANTS = {"pi": math.pi, "E": math.e}
+_BINARY_OPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+               ast.Div: operator.truediv, ast.Pow: operator.pow}
+
+
+def _constant_value(node):
+    """Valor en coma flotante de un subárbol constante (None si depende de r o de un parámetro).
+
+    Cada potencia con exponente constante exige |exponente| ≤ MAX_EXPONENT y
+    cada subárbol constante tiene que ser finito: así se rechazan 9**9**9 o 1/0
+    antes de que los vea sympy.
+    """
+    if isinstance(node, ast.Constant):
+        return float(node.value)
+    if isinstance(node, ast.Name):
+        return _CONSTANTS.get(node.id)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _constant_value(node.operand)
+        return None if value is None else (-value if isinstance(node.op, ast.USub) else value)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        left, right = _constant_value(node.left), _constant_value(node.right)
+        if isinstance(node.op, ast.Pow) and right is not None and abs(right) > MAX_EXPONENT:
+            raise ValueError(f"Exponente demasiado grande en la expresión (máximo {MAX_EXPONENT:g})")
+        if left is None or right is None:
+            return None
+        try:
+            value = _BINARY_OPS[type(node.op)](left, right)
+        except (ZeroDivisionError, OverflowError) as exc:
+            raise ValueError("La expresión contiene una constante infinita o indefinida") from exc
+        if isinstance(value, complex) or not math.isfinite(value):
+            raise ValueError("La expresión contiene una constante infinita, indefinida o compleja")
+        return value
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        for arg in node.args:
+            _constant_value(arg)
+        return None
+    raise ValueError("La expresión tiene que ser una única expresión escalar en r")
+
+
+def _validate_expression(expr, param_names):
+    """Rechaza cualquier cosa que no sea aritmética acotada sobre r, parámetros y funciones elementales"""
+    if not expr:
+        raise ValueError("La expresión de U(r) está vacía")
+    if len(expr) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"Expresión demasiado larga (máximo {MAX_EXPRESSION_LENGTH} caracteres)")
+    pos = 0
+    allowed = _ALLOWED_NAMES | set(param_names)
+    while pos < len(expr):
+        match = _TOKEN.match(expr, pos)
+        if match is None or match.end() == pos:
+            if expr[pos:].strip() == "":
+                break
+            raise ValueError(f"Carácter no permitido en la expresión: {expr[pos:pos + 10]!r}")
+        name, literal = match.group(1), match.group(2)
+        if name is not None and name not in allowed:
+            raise ValueError(f"Nombre no permitido en la expresión: {name!r}")
+        if literal is not None and len(literal) > MAX_LITERAL_LENGTH:
+            raise ValueError(f"Número demasiado largo en la expresión: {literal[:10]!r}…")
+        pos = match.end()
+    try:
+        tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Expresión mal formada: {exc.msg}") from exc
+    _constant_value(tree.body)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_expression(expr, param_names):
+    """Parsea una vez la expresión con sympy y devuelve (U, dU, latex) como funciones NumPy.
+
+    Cualquier fallo de sympy (al parsear, derivar o generar el código) se
+    devuelve como ValueError, igual que los de _validate_expression.
+    """
+    import sympy as sp
+
+    _validate_expression(expr, param_names)
+    symbols = sp.symbols(("r",) + param_names, positive=True)
+    namespace = {s.name: s for s in symbols}
+    try:
+        U_sym = sp.sympify(expr.replace("^", "**"), locals=namespace, evaluate=False)
+        if not isinstance(U_sym, sp.Expr):
+            raise ValueError("La expresión tiene que ser una única expresión escalar en r")
+        U_sym = U_sym.doit()
+        if U_sym.has(sp.zoo, sp.oo, -sp.oo, sp.nan):
+            raise ValueError("La expresión contiene un término infinito o indefinido")
+        dU_sym = sp.diff(U_sym, symbols[0])
+        U_num = sp.lambdify(symbols, U_sym, "numpy")
+        dU_num = sp.lambdify(symbols, dU_sym, "numpy")
+        latex = sp.latex(U_sym)
+    except ValueError:
+        raise
+    except Exception as exc:
+        raise ValueError(f"No se pudo compilar la expresión {expr!r}: {exc}") from exc
+    return U_num, dU_num, latex
+
+
+def from_expression(expr, name=None, **params):
+    """Potencial a partir de una expresión en r y parámetros, p. ej. '-alpha*exp(-r)/r'"""
+    param_names = tuple(sorted(params))
+    U_num, dU_num, latex = _compile_expression(expr.strip(), param_names)
+
+    def U(r, **kw):
+        return U_num(r, *(kw[p] for p in param_names)) + np.zeros_like(r)
+
+    def dU(r, **kw):
+        return dU_num(r, *(kw[p] for p in param_names)) + np.zeros_like(r)
+
+    return Potential(name or expr.strip(), U, dU, params, latex)
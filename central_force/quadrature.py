@@ -0,0 +1,134 @@
+"""Cuadratura radial: periodo T_r, ángulo Δθ por periodo y ecuación de la órbita θ(r).
+
+Entre los radios de retorno r1 < r2 se escribe E − V_eff = (r − r1)(r2 − r)·g(r)
+con g suave y positiva, y el cambio r = c − h·cos φ (c, h = centro y semiancho)
+convierte dr/√((r − r1)(r2 − r)) en dφ. Las singularidades 1/√ de los extremos
+desaparecen y la regla de Gauss–Chebyshev converge exponencialmente:
+
+    T_r = 2∫ m dr/p_r = 2∫₀^π m/√(2mg) dφ,   Δθ = 2∫ L dr/(r² p_r) = 2∫₀^π L/(r²√(2mg)) dφ
+
+Todo se evalúa por lotes sobre muchas (E, L) a la vez y no depende de ningún
+horizonte temporal.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+RadialQuadrature = namedtuple("RadialQuadrature", ["r_min", "r_max", "period", "delta_theta"])
+OrbitShape = namedtuple("OrbitShape", ["r", "theta", "t"])
+
+
+def _bisect(f, lo, hi, n_iter=60):
+    """Raíz de f en [lo, hi] por bisección vectorizada (f(lo) y f(hi) de signo opuesto)"""
+    f_lo = f(lo)
+    for _ in range(n_iter):
+        mid = 0.5 * (lo + hi)
+        f_mid = f(mid)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+    return 0.5 * (lo + hi)
+
+
+def well_turning_points(E, L, m, potential, r_lo=1e-3, r_hi=100.0, n_scan=256):
+    """Radios de retorno (r_min, r_max) del pozo más profundo de V_eff, vectorizados en E y L.
+
+    Se busca el mínimo local interior más profundo de V_eff en una malla
+    logarítmica y se amplía hasta donde V_eff ≥ E; los extremos se refinan por
+    bisección. Sin pozo, sin radio interior (caída al centro) o sin cerrar
+    antes de r_hi, ambos quedan en NaN.
+    """
+    E, L = np.broadcast_arrays(np.asarray(E, dtype=float), np.asarray(L, dtype=float))
+    shape = E.shape
+    E, L = E.ravel(), L.ravel()
+    r = np.geomspace(r_lo, r_hi, n_scan)
+    veff = potential.veff(r, L[:, None], m)
+    interior = np.full(veff.shape, np.inf)
+    well = (veff[:, 1:-1] < veff[:, :-2]) & (veff[:, 1:-1] <= veff[:, 2:])
+    interior[:, 1:-1] = np.where(well, veff[:, 1:-1], np.inf)
+    i_min = np.argmin(interior, axis=1)
+    has_well = np.isfinite(interior[np.arange(E.size), i_min])
+
+    j = np.arange(n_scan)
+    blocked = veff >= E[:, None]
+    left = np.where(blocked & (j <= i_min[:, None]), j, -1).max(axis=1)
+    right = np.where(blocked & (j >= i_min[:, None]), j, n_scan).min(axis=1) - 1
+    ok = has_well & (left >= 0) & (right < n_scan - 1) & (right - left >= 1)
+
+    def kinetic(x):
+        return E[ok] - potential.veff(x, L[ok], m)
+
+    r_min, r_max = np.full(E.size, np.nan), np.full(E.size, np.nan)
+    r_min[ok] = _bisect(kinetic, r[left[ok]], r[left[ok] + 1])
+    r_max[ok] = _bisect(kinetic, r[right[ok]], r[right[ok] + 1])
+    return r_min.reshape(shape), r_max.reshape(shape)
+
+
+def _reduced_momentum(E, L, m, veff, r_min, r_max, phi):
+    """r(φ) y √(2m·g(r)) en los nodos φ (filas = órbitas); g por diferencias si la órbita es circular"""
+    c, h = (0.5 * (r_min + r_max))[:, None], (0.5 * (r_max - r_min))[:, None]
+    r = c - h * np.cos(phi)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g = (E[:, None] - veff(r)) / (h**2 * np.sin(phi)**2)
+    # Casi circular: E − V_eff ≈ ½V_eff''(c)(r − r1)(r2 − r)
+    circular = h[:, 0] <= 1e-6 * c[:, 0]
+    if circular.any():
+        d = 1e-4 * c
+        v2 = (veff(c + d) - 2 * veff(c) + veff(c - d)) / d**2
+        g[circular] = np.broadcast_to(0.5 * v2, g.shape)[circular]
+    return r, np.sqrt(2 * m * np.maximum(g, 0.0))
+
+
+def radial_integrals(E, L, m, veff, r_min, r_max, n_nodes=64):
+    """(T_r, Δθ) para órbitas 1-D dadas sus V_eff y radios de retorno.
+
+    veff(r) recibe r de forma (N, k) y debe devolver la misma forma (los
+    parámetros de cada órbita van como columnas (N, 1) en la clausura), así se
+    puede usar con cualquier potencial o con m y α distintos por órbita.
+    """
+    E, L, r_min, r_max = (np.asarray(x, dtype=float) for x in (E, L, r_min, r_max))
+    m = np.asarray(m, dtype=float)
+    m_col = m[:, None] if m.ndim else m
+    phi = (2 * np.arange(1, n_nodes + 1) - 1) * np.pi / (2 * n_nodes)
+    r, p = _reduced_momentum(E, L, m_col, veff, r_min, r_max, phi)
+    with np.errstate(divide="ignore"):
+        period = 2 * np.pi / n_nodes * np.sum(m_col / p, axis=1)
+        delta_theta = 2 * np.pi / n_nodes * np.sum(L[:, None] / (r**2 * p), axis=1)
+    return period, delta_theta
+
+
+def radial_quadrature(E, L, m, potential, r_lo=1e-3, r_hi=100.0, n_scan=256, n_nodes=64):
+    """Radios de retorno, periodo radial y Δθ por periodo de un Potential para E y L de cualquier forma"""
+    E, L = np.broadcast_arrays(np.asarray(E, dtype=float), np.asarray(L, dtype=float))
+    r_min, r_max = well_turning_points(E, L, m, potential, r_lo, r_hi, n_scan)
+    ok = np.isfinite(r_min)
+    period, delta_theta = np.full(E.shape, np.nan), np.full(E.shape, np.nan)
+    if ok.any():
+        Lb = L[ok]
+        period[ok], delta_theta[ok] = radial_integrals(
+            E[ok], Lb, m, lambda r: potential.veff(r, Lb[:, None], m), r_min[ok], r_max[ok], n_nodes)
+    return RadialQuadrature(r_min, r_max, period, delta_theta)
+
+
+def orbit_shape(E, L, m, potential, n=256, **kwargs):
+    """Media órbita de periapsis a apoapsis: r, θ(r) y t(r) con forma (..., n + 1).
+
+    θ y t son integrales acumuladas en φ con la regla del punto medio (nodos de
+    Chebyshev), así que en el último punto coinciden con Δθ/2 y T_r/2. El resto
+    de la órbita se obtiene por simetría: reflejar en el apoapsis y girar Δθ.
+    """
+    E, L = np.broadcast_arrays(np.asarray(E, dtype=float), np.asarray(L, dtype=float))
+    r_min, r_max = well_turning_points(E, L, m, potential, **kwargs)
+    ok = np.isfinite(r_min)
+    r_out, theta_out, t_out = (np.full(E.shape + (n + 1,), np.nan) for _ in range(3))
+    if ok.any():
+        Eb, Lb, r1, r2 = E[ok], L[ok], r_min[ok], r_max[ok]
+        phi = (np.arange(n) + 0.5) * np.pi / n
+        r, p = _reduced_momentum(Eb, Lb, m, lambda x: potential.veff(x, Lb[:, None], m), r1, r2, phi)
+        edges = np.arange(n + 1) * np.pi / n
+        zero = np.zeros((Eb.size, 1))
+        r_out[ok] = (0.5 * (r1 + r2))[:, None] - (0.5 * (r2 - r1))[:, None] * np.cos(edges)
+        theta_out[ok] = np.hstack([zero, np.cumsum(Lb[:, None] / (r**2 * p), axis=1) * np.pi / n])
+        t_out[ok] = np.hstack([zero, np.cumsum(m / p, axis=1) * np.pi / n])
+    return OrbitShape(r_out, theta_out, t_out)
@@ -0,0 +1,141 @@
+"""Renderizado de matplotlib sin pyplot: Figure orientadas a objetos, codificadas y liberadas.
+
+pyplot guarda cada figura en un gestor global que nunca se vacía si no se
+llama a plt.close, y no es seguro entre hilos. Aquí cada figura es un
+matplotlib.figure.Figure propio del hilo que la dibuja: se codifica a PNG/SVG
+y se suelta al salir del bloque, así que no queda nada vivo entre reruns.
+
+cached_figure guarda además los bytes codificados por (vista, parámetros,
+tema): la misma gráfica pedida por muchas sesiones se rasteriza una vez.
+"""
+import contextlib
+import io
+import threading
+
+from .cache import _REGISTRY, LRUCache, quantize
+from .metrics import span
+
+# Colores por tema de Streamlit: (fondo, texto y ejes, rejilla)
+THEMES = {
+    "light": ("#ffffff", "#262730", "#b0b0b0"),
+    "dark": ("#0e1117", "#fafafa", "#4a4a4a"),
+}
+
+# Imágenes ya codificadas, compartidas por todas las sesiones del proceso
+IMAGE_CACHE = LRUCache(maxsize=512, maxbytes=64 * 2**20)
+_REGISTRY["central_force.rendering.images"] = IMAGE_CACHE
+
+
+class RenderStats:
+    """Figuras creadas y abiertas, imágenes codificadas o servidas de caché y bytes entregados"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.created = 0
+        self.open = 0
+        self.encoded = 0
+        self.cached = 0
+        self.bytes = 0
+
+    def _add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def snapshot(self):
+        with self._lock:
+            return {"created": self.created, "open": self.open, "encoded": self.encoded,
+                    "cached": self.cached, "bytes": self.bytes}
+
+
+# Totales del proceso (todas las sesiones)
+_TOTALS = RenderStats()
+
+
+def render_stats():
+    """Contadores de renderizado de todo el proceso"""
+    return _TOTALS.snapshot()
+
+
+def _record(stats, **deltas):
+    _TOTALS._add(**deltas)
+    if stats is not None:
+        stats._add(**deltas)
+
+
+@contextlib.contextmanager
+def figure(figsize=(10, 6), nrows=1, ncols=1, stats=None, **subplot_kw):
+    """Figure nueva con sus ejes; al salir del bloque se vacía y se descuenta de las abiertas"""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    axes = fig.subplots(nrows, ncols, **subplot_kw)
+    _record(stats, created=1, open=1)
+    try:
+        yield fig, axes
+    finally:
+        fig.clear()
+        _record(stats, open=-1)
+
+
+def encode(fig, fmt="png", dpi=150, stats=None):
+    """Bytes PNG o SVG de la figura (recortada a su contenido)"""
+    buffer = io.BytesIO()
+    with span(f"render.encode.{fmt}"):
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+    data = buffer.getvalue()
+    _record(stats, encoded=1, bytes=len(data))
+    return data
+
+
+def apply_theme(fig, theme):
+    """Colorea fondo, ejes, textos, leyendas y rejilla de la figura según el tema"""
+    from matplotlib.colors import same_color
+
+    face, ink, grid = THEMES.get(theme, THEMES["light"])
+    fig.set_facecolor(face)
+    for ax in fig.axes:
+        ax.set_facecolor(face)
+        ax.tick_params(colors=ink)
+        for spine in ax.spines.values():
+            spine.set_color(ink)
+        for text in (ax.title, ax.xaxis.label, ax.yaxis.label):
+            text.set_color(ink)
+        for line in ax.get_xgridlines() + ax.get_ygridlines():
+            line.set_color(grid)
+        for line in ax.get_lines():
+            if same_color(line.get_color(), "black"):
+                line.set_color(ink)
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.get_frame().set_facecolor(face)
+            for text in legend.get_texts():
+                text.set_color(ink)
+
+
+def render_figure(draw, figsize=(10, 6), nrows=1, ncols=1, fmt="png", dpi=150, theme=None, stats=None):
+    """Llama a draw(fig, axes) sobre una figura nueva y devuelve la imagen codificada"""
+    with figure(figsize, nrows, ncols, stats=stats) as (fig, axes):
+        with span("render.draw"):
+            draw(fig, axes)
+        if theme is not None:
+            apply_theme(fig, theme)
+        return encode(fig, fmt, dpi, stats=stats)
+
+
+def cached_figure(key, draw, figsize=(10, 6), nrows=1, ncols=1, fmt="png", dpi=150, theme="light",
+                  stats=None):
+    """Como render_figure, pero cada imagen se dibuja una sola vez por proceso.
+
+    key debe identificar por completo lo que pinta draw (nombre de la vista y
+    sus parámetros); se cuantiza como en memoize y se combina con el tema, el
+    formato y el tamaño. La caché se acota en entradas y en bytes (LRU).
+    """
+    full_key = (tuple(quantize(k) for k in key), theme, fmt, dpi, tuple(figsize), nrows, ncols)
+    data = IMAGE_CACHE.get(full_key)
+    if data is None:
+        data = render_figure(draw, figsize, nrows, ncols, fmt, dpi, theme, stats=stats)
+        IMAGE_CACHE.put(full_key, data)
+    else:
+        _record(stats, cached=1, bytes=len(data))
+    return data
@@ -0,0 +1,85 @@
+"""Muestreo adaptativo de curvas: más puntos donde la curvatura lo exige, menos en las colas."""
+import numpy as np
+
+from .physics import get_veff, turning_points_exact
+
+
+def adaptive_sample(f, a, b, tol=1e-3, n_init=16, max_depth=16, scale=None):
+    """Muestrea la curva paramétrica f(t) -> array (k, n) en [a, b] por bisección vectorizada.
+
+    Cada intervalo se divide mientras el punto medio se aparte de la cuerda más
+    de tol (relativo a `scale` por componente; por defecto el rango de la
+    muestra inicial). Devuelve (t, valores) ordenados en t.
+    """
+    t = np.linspace(a, b, n_init + 1)
+    v = np.atleast_2d(f(t))
+    if scale is None:
+        scale = np.ptp(v, axis=1)
+    scale = np.where(np.asarray(scale, dtype=float) > 0, scale, 1.0)[:, None]
+    for _ in range(max_depth):
+        tm = 0.5 * (t[:-1] + t[1:])
+        vm = np.atleast_2d(f(tm))
+        err = np.max(np.abs(vm - 0.5 * (v[:, :-1] + v[:, 1:])) / scale, axis=0)
+        refine = np.flatnonzero(err > tol)
+        if refine.size == 0:
+            break
+        t = np.insert(t, refine + 1, tm[refine])
+        v = np.insert(v, refine + 1, vm[:, refine], axis=1)
+    return t, v
+
+
+def adaptive_veff(L, m, alpha, r_lo=0.1, r_hi=10.0, tol=1e-3, y_clip=(-10.0, 15.0)):
+    """(r, V_eff) con muestreo adaptativo en log r; la parte fuera de y_clip no se refina"""
+    lo, hi = y_clip
+
+    def curve(t):
+        r = np.exp(t)
+        return np.vstack([r, np.clip(get_veff(r, L, m, alpha), lo, hi)])
+
+    t, _ = adaptive_sample(curve, np.log(r_lo), np.log(r_hi), tol=tol,
+                           scale=(r_hi - r_lo, hi - lo))
+    r = np.exp(t)
+    r[0], r[-1] = r_lo, r_hi
+    return r, get_veff(r, L, m, alpha)
+
+
+def adaptive_phase(E, L, m, alpha, r_lo=0.1, r_hi=10.0, tol=1e-3):
+    """Rama p_r >= 0 de la curva de fase sobre [max(r_lo, r_min), min(r_hi, r_max)].
+
+    En cada extremo que sea un punto de retorno se usa un cambio de variable
+    (r = c − h·cos φ si ambos lo son, r = r_t ± h·s² si solo uno) que elimina la
+    singularidad √ de p_r, de modo que la curva empieza y termina exactamente en
+    p_r = 0. Devuelve arrays vacíos si la región permitida no toca [r_lo, r_hi].
+    """
+    tp = turning_points_exact(E, L, m, alpha)
+    if not np.isfinite(tp.r_min):
+        return np.array([]), np.array([])
+    lo, hi = max(r_lo, tp.r_min), min(r_hi, tp.r_max)
+    if lo >= hi:
+        return np.array([]), np.array([])
+    lo_turn, hi_turn = lo == tp.r_min, hi == tp.r_max
+
+    if lo_turn and hi_turn:
+        c, h = 0.5 * (lo + hi), 0.5 * (hi - lo)
+        to_r, a, b = (lambda s: c - h * np.cos(s)), 0.0, np.pi
+    elif lo_turn:
+        to_r, a, b = (lambda s: lo + (hi - lo) * s**2), 0.0, 1.0
+    elif hi_turn:
+        to_r, a, b = (lambda s: hi - (hi - lo) * s**2), 1.0, 0.0
+    else:
+        to_r, a, b = (lambda s: lo + (hi - lo) * s), 0.0, 1.0
+
+    def curve(s):
+        r = to_r(s)
+        return np.vstack([r, np.sqrt(2 * m * np.maximum(E - get_veff(r, L, m, alpha), 0.0))])
+
+    _, (r, pr) = adaptive_sample(curve, a, b, tol=tol)
+    # Según el cambio de variable s crece o decrece con r: se ordena siempre por r
+    order = np.argsort(r, kind="stable")
+    r, pr = r[order], pr[order]
+    # Cierre exacto en los puntos de retorno
+    if lo_turn:
+        r[0], pr[0] = tp.r_min, 0.0
+    if hi_turn:
+        r[-1], pr[-1] = tp.r_max, 0.0
+    return r, pr
@@ -0,0 +1,42 @@
+"""Simulación de una órbita con el integrador elegido (remuestreo de la trayectoria memoizada)."""
+from collections import namedtuple
+
+import numpy as np
+
+from .physics import energy_scale, hamiltonian
+from .trajectory import orbit_trajectory
+
+OrbitResult = namedtuple("OrbitResult", ["t", "y", "energy_drift", "events"], defaults=(None,))
+
+# Integradores disponibles para simulate_orbit
+METHODS = ("rk45", "events", "verlet", "yoshida4", "levicivita", "kepler")
+
+
+def _relative_drift(y, m, alpha):
+    """max |H − H0| / |H0| a lo largo de una trayectoria (4, T)"""
+    H = hamiltonian(y.T, m, alpha)
+    return float(np.max(np.abs(H - H[0])) / energy_scale(y[:, 0], m, alpha))
+
+
+def simulate_orbit(method, r0, theta0, pr0, L, m, alpha, t_end=20.0, n_eval=1000, dt=0.01,
+                   tol_digits=None):
+    """Trayectoria [r, θ, p_r, p_θ] de forma (4, n_eval) en t ∈ [0, t_end] y su deriva de energía.
+
+    La integración se hace una vez por conjunto de parámetros (orbit_trajectory)
+    y aquí solo se remuestrea, así que pedir otra resolución no reintegra.
+    Con method='events' la trayectoria puede acabar antes (escape o colisión) y
+    `events` resume periapsis, apoapsis, periodo radial y motivo de parada.
+    tol_digits (rtol = 10**-tol_digits) solo afecta a los métodos adaptativos.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Método desconocido '{method}'; opciones: {list(METHODS)}")
+    trajectory = orbit_trajectory(method, r0, theta0, pr0, L, m, alpha, t_end=t_end, dt=dt,
+                                  tol_digits=tol_digits)
+    # Misma malla que sin parada temprana, recortada donde acabe la trayectoria
+    t = np.linspace(0.0, t_end, n_eval)
+    t = t[t <= trajectory.t1]
+    y = trajectory(t)
+    drift = trajectory.energy_drift
+    if drift is None:
+        drift = _relative_drift(y, m, alpha)
+    return OrbitResult(t, y, drift, trajectory.events)
@@ -0,0 +1,156 @@
+"""Órbitas en 3D con las seis ecuaciones de Hamilton en esféricas (r, θ, φ, p_r, p_θ, p_φ).
+
+Las ecuaciones en esféricas tienen sen θ en el denominador: cerca del eje
+(θ → 0, π) el término p_φ² cos θ / (m r² sen³ θ) se dispara y un integrador
+adaptativo se queda dando pasos diminutos. Por eso integrate_spherical pasa
+internamente a cartesianas, donde H = |p|²/2m − α/|q| no tiene polos, integra
+todas las órbitas a la vez y vuelve a esféricas solo en las muestras guardadas.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import _as_column
+from .symplectic import YOSHIDA4_WEIGHTS
+
+SphericalResult = namedtuple("SphericalResult", ["t", "y", "cartesian", "energy_drift"])
+
+
+def derivadas_esfericas(t, y, m, alpha):
+    """Ecuaciones de Hamilton para [r, θ, φ, p_r, p_θ, p_φ] con U = −α/r (firma de solve_ivp)"""
+    r, theta, phi, pr, ptheta, pphi = y
+    s, c = np.sin(theta), np.cos(theta)
+    drdt = pr / m
+    dthetadt = ptheta / (m * r**2)
+    dphidt = pphi / (m * r**2 * s**2)
+    dprdt = (ptheta**2 + pphi**2 / s**2) / (m * r**3) - alpha / r**2
+    dpthetadt = pphi**2 * c / (m * r**2 * s**3)
+    dpphidt = 0.0
+    return [drdt, dthetadt, dphidt, dprdt, dpthetadt, dpphidt]
+
+
+def spherical_to_cartesian(y):
+    """Estados (..., 6) [r, θ, φ, p_r, p_θ, p_φ] -> (..., 6) [x, y, z, p_x, p_y, p_z]"""
+    y = np.asarray(y, dtype=float)
+    r, theta, phi, pr, ptheta, pphi = np.moveaxis(y, -1, 0)
+    st, ct, sp, cp = np.sin(theta), np.cos(theta), np.sin(phi), np.cos(phi)
+    # p = p_r r̂ + (p_θ/r) θ̂ + (p_φ/(r sen θ)) φ̂; sobre el eje p_φ es 0
+    p_phi_hat = np.divide(pphi, r * st, out=np.zeros(np.broadcast(pphi, st).shape), where=st != 0)
+    p_theta_hat = ptheta / r
+    out = np.empty(y.shape)
+    out[..., 0] = r * st * cp
+    out[..., 1] = r * st * sp
+    out[..., 2] = r * ct
+    out[..., 3] = pr * st * cp + p_theta_hat * ct * cp - p_phi_hat * sp
+    out[..., 4] = pr * st * sp + p_theta_hat * ct * sp + p_phi_hat * cp
+    out[..., 5] = pr * ct - p_theta_hat * st
+    return out
+
+
+def cartesian_to_spherical(q):
+    """Estados (..., 6) [x, y, z, p_x, p_y, p_z] -> (..., 6) [r, θ, φ, p_r, p_θ, p_φ]"""
+    q = np.asarray(q, dtype=float)
+    x, y, z, px, py, pz = np.moveaxis(q, -1, 0)
+    rho = np.hypot(x, y)
+    r = np.hypot(rho, z)
+    out = np.empty(q.shape)
+    out[..., 0] = r
+    out[..., 1] = np.arctan2(rho, z)
+    out[..., 2] = np.arctan2(y, x)
+    out[..., 3] = (x * px + y * py + z * pz) / r
+    # p_θ = r (p · θ̂) con θ̂ = (cos θ cos φ, cos θ sen φ, −sen θ)
+    out[..., 4] = np.divide(z * (x * px + y * py), rho, out=np.zeros(rho.shape), where=rho != 0) - rho * pz
+    out[..., 5] = x * py - y * px
+    return out
+
+
+def _acceleration(q, alpha):
+    """−α q/|q|³ por fila"""
+    r = np.sqrt(np.sum(q * q, axis=1))
+    return -(alpha / r**3)[:, None] * q
+
+
+def _cartesian_energy(s, m, alpha):
+    """H = |p|²/2m − α/|q| sobre el último eje de estados (..., 6)"""
+    q, p = s[..., :3], s[..., 3:]
+    return np.sum(p * p, axis=-1) / (2 * m) - alpha / np.sqrt(np.sum(q * q, axis=-1))
+
+
+def _rk4_step(s, h, m, alpha):
+    def f(state):
+        return np.concatenate([state[:, 3:] / m[:, None],
+                               _acceleration(state[:, :3], alpha)], axis=1)
+
+    k1 = f(s)
+    k2 = f(s + 0.5 * h * k1)
+    k3 = f(s + 0.5 * h * k2)
+    k4 = f(s + h * k3)
+    s += (h / 6.0) * (k1 + 2.0 * (k2 + k3) + k4)
+
+
+def _verlet_step(s, h, m, alpha):
+    """Kick-drift-kick en cartesianas: cada subflujo es exacto"""
+    s[:, 3:] += 0.5 * h * _acceleration(s[:, :3], alpha)
+    s[:, :3] += h * s[:, 3:] / m[:, None]
+    s[:, 3:] += 0.5 * h * _acceleration(s[:, :3], alpha)
+
+
+def _yoshida4_step(s, h, m, alpha):
+    for w in YOSHIDA4_WEIGHTS:
+        _verlet_step(s, w * h, m, alpha)
+
+
+_STEPPERS = {
+    "rk4": _rk4_step,
+    "verlet": _verlet_step,
+    "yoshida4": _yoshida4_step,
+}
+
+
+def integrate_spherical(y0, m=1.0, alpha=1.0, t_span=(0, 20), dt=0.01, method="yoshida4",
+                        n_save=None):
+    """Integra N órbitas 3D en paralelo con paso fijo, en cartesianas.
+
+    y0 es [r, θ, φ, p_r, p_θ, p_φ] o un array (N, 6); m y alpha pueden ser
+    escalares o arrays (N,). Devuelve un SphericalResult con los tiempos, los
+    estados en esféricas (n_save, N, 6) con φ desenrollado, los mismos estados
+    en cartesianas y la deriva relativa máxima de energía por órbita
+    (|H − H0| / |H0|, o relativa a α/r0 si H0 ≈ 0).
+    """
+    if method not in _STEPPERS:
+        raise ValueError(f"Método desconocido '{method}'; opciones: {sorted(_STEPPERS)}")
+    step = _STEPPERS[method]
+
+    y0 = np.array(y0, dtype=float, ndmin=2)
+    if y0.shape[1] != 6:
+        raise ValueError("y0 debe tener forma (N, 6): [r, θ, φ, p_r, p_θ, p_φ]")
+    n = y0.shape[0]
+    m = _as_column(m, n)
+    alpha = _as_column(alpha, n)
+    s = spherical_to_cartesian(y0)
+
+    t0, t1 = t_span
+    n_steps = max(1, int(np.ceil((t1 - t0) / dt)))
+    h = (t1 - t0) / n_steps
+    if n_save is None:
+        save_steps = np.array([0, n_steps])
+    else:
+        save_steps = np.unique(np.linspace(0, n_steps, n_save).round().astype(int))
+    cartesian = np.empty((len(save_steps), n, 6))
+    cartesian[0] = s
+    k = 1
+
+    for i in range(1, n_steps + 1):
+        step(s, h, m, alpha)
+        if k < len(save_steps) and i == save_steps[k]:
+            cartesian[k] = s
+            k += 1
+
+    y = cartesian_to_spherical(cartesian)
+    y[..., 2] = np.unwrap(y[..., 2], axis=0)
+    energy = _cartesian_energy(cartesian, m, alpha)
+    # Escala |H0|, o α/r0 si la órbita es parabólica (H0 ≈ 0), como energy_scale en polares
+    U0 = np.abs(alpha / y[0, :, 0])
+    scale = np.where(np.abs(energy[0]) > 1e-9 * U0, np.abs(energy[0]), U0)
+    drift = np.max(np.abs(energy - energy[0]), axis=0) / scale
+    return SphericalResult(t0 + h * save_steps, y, cartesian, drift)
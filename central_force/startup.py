@@ -0,0 +1,100 @@
+"""Perfil de arranque de las apps: coste de importación en frío y módulos pesados por rerun.
+
+    python -m central_force startup            # informe
+    python -m central_force startup --check    # falla si se excede startup_budget.json
+"""
+import ast
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BUDGET_PATH = REPO_ROOT / "startup_budget.json"
+
+APPS = (
+    "classical_v2/app.py",
+    "classical_mechanics_quizzes/app.py",
+    "classical_mechanics_quizzes/main.py",
+)
+
+# Módulos cuyo coste de importación domina el arranque
+HEAVY_MODULES = ("scipy", "sympy", "matplotlib", "plotly")
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - t0
+heavy = sorted({{m.split('.')[0] for m in sys.modules}} & set({heavy!r}))
+print(json.dumps({{"import_ms": elapsed * 1e3, "heavy": heavy}}))
+"""
+
+
+def top_level_imports(app_path):
+    """Sentencias import del nivel superior del script (lo que paga cada arranque en frío)"""
+    source = Path(app_path).read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.get_source_segment(source, n) for n in nodes)
+
+
+def measure_cold_imports(app_path, python=sys.executable):
+    """Importa en un intérprete nuevo las dependencias de nivel superior del script"""
+    probe = _PROBE.format(root=str(REPO_ROOT), imports=top_level_imports(app_path),
+                          heavy=HEAVY_MODULES)
+    out = subprocess.run([python, "-c", probe], capture_output=True, text=True, check=True,
+                         cwd=REPO_ROOT)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure_reruns(app_path, reruns=2, timeout=120):
+    """Ejecuta el script con AppTest: tiempo del primer run, de los reruns y módulos pesados cargados"""
+    from streamlit.testing.v1 import AppTest
+
+    before = {m.split('.')[0] for m in sys.modules}
+    at = AppTest.from_file(str(REPO_ROOT / app_path), default_timeout=timeout)
+    t0 = time.perf_counter()
+    at.run()
+    first_ms = (time.perf_counter() - t0) * 1e3
+    loaded = sorted(({m.split('.')[0] for m in sys.modules} - before) & set(HEAVY_MODULES))
+    rerun_ms = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        rerun_ms.append((time.perf_counter() - t0) * 1e3)
+    return {"first_run_ms": first_ms, "rerun_ms": rerun_ms, "heavy_first_run": loaded}
+
+
+def load_budget(path=BUDGET_PATH):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def check_budget(report, budget):
+    """Lista de incumplimientos del presupuesto (vacía si todo está dentro)"""
+    problems = []
+    for app, limits in budget.items():
+        result = report.get(app)
+        if result is None:
+            continue
+        if result["import_ms"] > limits.get("import_ms", float("inf")):
+            problems.append(f"{app}: importación en frío {result['import_ms']:.0f} ms "
+                            f"> {limits['import_ms']} ms")
+        forbidden = set(result["heavy"]) & set(limits.get("lazy", ()))
+        if forbidden:
+            problems.append(f"{app}: {sorted(forbidden)} se importan al arrancar y deberían ser diferidos")
+        if "rerun_ms" in result and max(result["rerun_ms"]) > limits.get("rerun_ms", float("inf")):
+            problems.append(f"{app}: rerun {max(result['rerun_ms']):.0f} ms > {limits['rerun_ms']} ms")
+    return problems
+
+
+def startup_report(apps=APPS, reruns=0):
+    """Informe por app; con reruns > 0 también mide ejecuciones completas con AppTest"""
+    report = {}
+    for app in apps:
+        report[app] = measure_cold_imports(REPO_ROOT / app)
+        if reruns:
+            report[app].update(measure_reruns(app, reruns=reruns))
+    return report
@@ -0,0 +1,136 @@
+"""Integradores simplécticos de paso fijo (Störmer–Verlet y Yoshida 4) para H(r, p_r; L)."""
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import _as_column
+from .physics import energy_scale, hamiltonian
+
+SymplecticResult = namedtuple("SymplecticResult", ["t", "y", "energy", "energy_drift"])
+
+# Coeficientes de la composición de Yoshida de 4º orden
+_CBRT2 = 2.0 ** (1.0 / 3.0)
+_W1 = 1.0 / (2.0 - _CBRT2)
+_W0 = -_CBRT2 / (2.0 - _CBRT2)
+YOSHIDA4_WEIGHTS = (_W1, _W0, _W1)
+
+
+def _kick(y, h, m, alpha):
+    """Flujo exacto de V = p_θ²/2mr² − α/r: r fijo, avanzan p_r y θ"""
+    inv_r = 1.0 / y[:, 0]
+    ptheta = y[:, 3]
+    y[:, 2] += h * (ptheta**2 * inv_r / m - alpha) * inv_r * inv_r
+    y[:, 1] += h * ptheta * inv_r * inv_r / m
+
+
+def _drift(y, h, m):
+    """Flujo exacto de T = p_r²/2m: avanza r"""
+    y[:, 0] += h * y[:, 2] / m
+
+
+def _verlet_step(y, h, m, alpha):
+    """Paso kick-drift-kick de Störmer–Verlet (2º orden)"""
+    _kick(y, 0.5 * h, m, alpha)
+    _drift(y, h, m)
+    _kick(y, 0.5 * h, m, alpha)
+
+
+def _yoshida4_step(y, h, m, alpha):
+    """Composición triple de Verlet (4º orden)"""
+    for w in YOSHIDA4_WEIGHTS:
+        _verlet_step(y, w * h, m, alpha)
+
+
+_STEPPERS = {
+    "verlet": _verlet_step,
+    "yoshida4": _yoshida4_step,
+}
+# Pesos de los subpasos de Verlet de cada esquema (para el camino escalar)
+_COMPOSITIONS = {
+    "verlet": (1.0,),
+    "yoshida4": YOSHIDA4_WEIGHTS,
+}
+
+
+def _integrate_single(y, h, m, alpha, weights, n_steps, every, out):
+    """Mismo esquema que _STEPPERS para una sola órbita, con floats de Python.
+
+    Con N = 1 cada operación de NumPy sobre arrays (1, 4) cuesta más en
+    sobrecarga que en cálculo; en floats el paso de Yoshida 4 es ~50 veces más
+    rápido. Guarda el estado en out cada `every` pasos.
+    """
+    r, theta, pr, ptheta = (float(v) for v in y)
+    m, alpha = float(m), float(alpha)
+    substeps = [(0.5 * w * h, w * h) for w in weights]
+    k = 1
+    for i in range(1, n_steps + 1):
+        for half, full in substeps:
+            inv_r = 1.0 / r
+            pr += half * (ptheta * ptheta * inv_r / m - alpha) * inv_r * inv_r
+            theta += half * ptheta * inv_r * inv_r / m
+            r += full * pr / m
+            inv_r = 1.0 / r
+            pr += half * (ptheta * ptheta * inv_r / m - alpha) * inv_r * inv_r
+            theta += half * ptheta * inv_r * inv_r / m
+        if i % every == 0:
+            out[k] = r, theta, pr, ptheta
+            k += 1
+
+
+def integrate_symplectic(y0, m=1.0, alpha=1.0, t_span=(0, 20), dt=0.01,
+                         method="yoshida4", n_save=None):
+    """Integra una o varias órbitas con un esquema simpléctico de paso fijo.
+
+    y0 es [r, θ, p_r, p_θ] o un array (N, 4). El paso efectivo h ≤ dt se ajusta
+    para cubrir t_span con un número entero de pasos que, si se pide n_save,
+    es además múltiplo de n_save − 1: las muestras caen exactamente en
+    linspace(t0, t1, n_save) (a costa de hasta n_save − 2 pasos de más).
+    Devuelve un SymplecticResult con los tiempos guardados, los estados, la
+    energía en cada muestra y la deriva relativa máxima |H − H0| / |H0| por
+    órbita (ver energy_scale).
+
+    Una sola órbita se integra con floats de Python (~20 ms para Yoshida 4 con
+    t = 100 y dt = 0.01); con N > 1 cada paso es una operación de NumPy sobre
+    las N órbitas a la vez.
+    """
+    if method not in _STEPPERS:
+        raise ValueError(f"Método desconocido '{method}'; opciones: {sorted(_STEPPERS)}")
+    if n_save is not None and n_save < 2:
+        raise ValueError("n_save debe ser al menos 2 (estado inicial y final)")
+
+    y0 = np.asarray(y0, dtype=float)
+    single = y0.ndim == 1
+    y = np.array(y0, dtype=float, ndmin=2)
+    n = y.shape[0]
+    m = _as_column(m, n)
+    alpha = _as_column(alpha, n)
+
+    t0, t1 = t_span
+    n_steps = max(1, int(np.ceil((t1 - t0) / dt)))
+    if n_save is None:
+        every = n_steps
+    else:
+        every = -(-n_steps // (n_save - 1))
+        n_steps = every * (n_save - 1)
+    h = (t1 - t0) / n_steps
+
+    out = np.empty((n_steps // every + 1, n, 4))
+    out[0] = y
+    if n == 1:
+        _integrate_single(y[0], h, m[0], alpha[0], _COMPOSITIONS[method], n_steps, every, out[:, 0])
+    else:
+        step = _STEPPERS[method]
+        for i in range(1, n_steps + 1):
+            step(y, h, m, alpha)
+            if i % every == 0:
+                out[i // every] = y
+
+    energy = hamiltonian(out, m, alpha)
+    drift = np.max(np.abs(energy - energy[0]), axis=0) / energy_scale(out[0], m, alpha)
+
+    t = t0 + h * every * np.arange(len(out))
+    if n_save is None:
+        t, out, energy = t[-1], out[-1], energy[-1]
+    if single:
+        out, energy, drift = out[..., 0, :], energy[..., 0], drift[0]
+    return SymplecticResult(t, out, energy, drift)
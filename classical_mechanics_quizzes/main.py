@@ -1,8 +1,47 @@
 #---------------------------------------------------------
+import sys
+from pathlib import Path
+
 import streamlit as st
-import numpy as np
 import plotly.graph_objects as go
-import time
+
+# Hacer importable el núcleo de física compartido (raíz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from central_force.animation import phase_animation_figure  # noqa: E402
+from central_force.curves import curve_set, potential_curve_set  # noqa: E402
+from central_force.elements import element_sweep  # noqa: E402
+from central_force.lookup import lattice_covers, lattice_curve_set  # noqa: E402
+from central_force.metrics import (  # noqa: E402
+    clock,
+    export_prometheus,
+    instrumented,
+    metrics_enabled,
+    metrics_summary,
+    observe,
+    span,
+    write_metrics,
+)
+
+# Inicio de la ejecución completa (tramo main.rerun)
+_inicio_ejecucion = clock()
+
+# Potenciales disponibles en el laboratorio (ver central_force.potentials)
+POTENCIALES = {
+    "Kepler  −α/r": "kepler",
+    "Yukawa  −α·e^(−r/λ)/r": "yukawa",
+    "Tipo relativista  −α/r − β/r³": "gr",
+    "Armónico  ½·k·r²": "harmonic",
+    "Ley de potencias  k·rⁿ": "power",
+    "Expresión personalizada": "custom",
+}
+
+# Magnitudes del barrido en (E, L): (campo de OrbitalElements, escala de color)
+MAGNITUDES_BARRIDO = {
+    "Excentricidad e": ("e", "Viridis"),
+    "Semieje mayor a": ("a", "Cividis"),
+    "Periodo radial T_r": ("period", "Plasma"),
+    "Precesión por vuelta Δθ − 2π": ("precession", "RdBu"),
+}
 
 # --- Configuración de la Página ---
 st.set_page_config(
@@ -65,26 +104,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# --- Funciones de Física ---
-def get_veff(r, L, m, alpha):
-    """Calcula el potencial efectivo evitando división por cero"""
-    r = np.maximum(r, 1e-10)  # Mejor protección contra división por cero
-    return (L**2) / (2 * m * r**2) - (alpha / r)
-
-def calculate_turning_points(r, veff, E):
-    """Calcula los puntos de retorno donde E = V_eff"""
-    crossings = np.where(np.diff(np.sign(E - veff)))[0]
-    turning_points = []
-    for idx in crossings:
-        if idx + 1 < len(r):
-            # Interpolación lineal para mayor precisión
-            r1, r2 = r[idx], r[idx + 1]
-            v1, v2 = veff[idx], veff[idx + 1]
-            if v1 != v2:
-                t_point = r1 + (r2 - r1) * (E - v1) / (v2 - v1)
-                turning_points.append(t_point)
-    return turning_points
-
 # --- Inicialización de Estado ---
 if 'quiz_answers' not in st.session_state:
     st.session_state.quiz_answers = {}
@@ -93,17 +112,24 @@ if 'show_results' not in st.session_state:
 if 'animation_running' not in st.session_state:
     st.session_state.animation_running = False
 
+
+def ocultar_animacion():
+    st.session_state.animation_running = False
+
 # --- Encabezado ---
 st.markdown('<div class="main-header">Mecánica Clásica</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">El Problema de los Dos Cuerpos y Fuerzas Centrales</div>', unsafe_allow_html=True)
 
 # --- Pestañas ---
+# Cada pestaña es un fragmento (st.fragment): sus widgets solo re-ejecutan esa pestaña
 tab1, tab2, tab3 = st.tabs(["📖 Teoría Avanzada", "❓ Quiz Conceptual", "📈 Laboratorio Virtual"])
 
 # ==========================================
 # PESTAÑA 1: TEORÍA (CORREGIDA Y ROBUSTA)
 # ==========================================
-with tab1:
+@st.fragment
+@instrumented("main.fragment.teoria")
+def pestana_teoria():
     st.markdown('<div class="theory-text">', unsafe_allow_html=True)
     
     st.markdown("### 1. Formalismo Hamiltoniano en Campos Centrales")
@@ -183,10 +209,16 @@ with tab1:
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+with tab1:
+    pestana_teoria()
+
+
 # ==========================================
 # PESTAÑA 2: QUIZ
 # ==========================================
-with tab2:
+@st.fragment
+@instrumented("main.fragment.quiz")
+def pestana_quiz():
     st.markdown("### Test de Conceptos")
     st.caption("Selecciona la respuesta correcta para validar tu comprensión.")
 
@@ -264,60 +296,75 @@ with tab2:
         if score == len(questions):
             st.balloons()
 
+
+with tab2:
+    pestana_quiz()
+
 # ==========================================
 # PESTAÑA 3: SIMULACIÓN
 # ==========================================
-with tab3:
-    with st.sidebar:
-        st.header("🎛️ Controles de Laboratorio")
-        st.markdown("Modifica las constantes de movimiento:")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            E_val = st.slider("Energía Total (E)", -2.0, 2.0, -0.5, 0.1)
-        with col2:
-            L_val = st.slider("Momento Angular (L)", 0.5, 3.0, 1.2, 0.1)
-        
-        st.markdown("Parámetros del Sistema:")
-        col3, col4 = st.columns(2)
-        with col3:
-            m_val = st.slider("Masa (m)", 0.5, 2.0, 1.0, 0.1)
-        with col4:
-            alpha_val = st.slider("Fuerza del Potencial (α)", 0.5, 3.0, 1.5, 0.1)
-        
-        st.info("""
-        **Interpretación:**
-        * La línea roja discontinua es tu Energía Total.
-        * La partícula solo puede existir donde $E \\geq V_{eff}$ (zona verde).
-        * Los puntos negros muestran los radios de retorno.
-        """)
-
-    # Cálculos
-    r = np.linspace(0.1, 8.0, 600)
-    veff = get_veff(r, L_val, m_val, alpha_val)
+# Controles en la barra lateral: un fragmento no puede escribir fuera de su pestaña,
+# así que se leen en el script principal y llegan al laboratorio como argumentos
+with st.sidebar:
+    st.header("🎛️ Controles de Laboratorio")
+    st.markdown("Modifica las constantes de movimiento:")
     
-    # Cálculo de p_r
-    kinetic = E_val - veff
-    valid_mask = kinetic >= 0
+    col1, col2 = st.columns(2)
+    with col1:
+        E_val = st.slider("Energía Total (E)", -2.0, 2.0, -0.5, 0.1)
+    with col2:
+        L_val = st.slider("Momento Angular (L)", 0.5, 3.0, 1.2, 0.1)
     
-    r_valid = r[valid_mask]
+    st.markdown("Parámetros del Sistema:")
+    col3, col4 = st.columns(2)
+    with col3:
+        m_val = st.slider("Masa (m)", 0.5, 2.0, 1.0, 0.1)
+    with col4:
+        alpha_val = st.slider("Fuerza del Potencial (α)", 0.5, 3.0, 1.5, 0.1)
     
-    if len(r_valid) > 0:
-        pr_pos = np.sqrt(2 * m_val * kinetic[valid_mask])
-        pr_neg = -pr_pos
-        
-        # Crear ciclo cerrado para visualización
-        r_plot = np.concatenate([r_valid, r_valid[::-1]])
-        pr_plot = np.concatenate([pr_pos, pr_neg[::-1]])
-    else:
-        r_valid = np.array([])
-        pr_pos = np.array([])
-        pr_neg = np.array([])
-        r_plot = np.array([])
-        pr_plot = np.array([])
+    # Potencial central: α hace de constante de acoplamiento (k en armónico y potencias)
+    potencial = st.selectbox("Potencial U(r)", list(POTENCIALES))
+    nombre_pot = POTENCIALES[potencial]
+    params_pot = {"alpha": alpha_val}
+    expr_pot = None
+    if nombre_pot == "yukawa":
+        params_pot["lam"] = st.slider("Alcance de Yukawa (λ)", 0.5, 10.0, 3.0, 0.5)
+    elif nombre_pot == "gr":
+        params_pot["beta"] = st.slider("Corrección relativista (β)", 0.0, 0.5, 0.05, 0.01)
+    elif nombre_pot == "harmonic":
+        params_pot = {"k": alpha_val}
+    elif nombre_pot == "power":
+        params_pot = {"k": alpha_val, "n": st.slider("Exponente (n)", -1.5, 3.0, 1.0, 0.5)}
+    elif nombre_pot == "custom":
+        expr_pot = st.text_input("U(r) en función de r y alpha", "-alpha/r + 0.1/r**2")
+    
+    st.info("""
+    **Interpretación:**
+    * La línea roja discontinua es tu Energía Total.
+    * La partícula solo puede existir donde $E \\geq V_{eff}$ (zona verde).
+    * Los puntos negros muestran los radios de retorno.
+    """)
 
-    # Calcular puntos de retorno
-    turning_points = calculate_turning_points(r, veff, E_val)
+
+@st.fragment
+@instrumented("main.fragment.laboratorio")
+def pestana_laboratorio(E_val, L_val, m_val, alpha_val, nombre_pot, params_pot, expr_pot):
+    # Cálculos: tabla precalculada de la malla de sliders si existe, si no caché por parámetros
+    # (respaldo con muestreo adaptativo: menos puntos y la curva de fase cierra en r_min y r_max)
+    if nombre_pot == "kepler":
+        curvas = lattice_curve_set(E_val, L_val, m_val, alpha_val, 0.1, 8.0, 600,
+                                   tol=1e-3, y_clip=(-4.0, 4.0))
+    else:
+        try:
+            curvas = potential_curve_set(E_val, L_val, m_val, nombre_pot,
+                                         tuple(sorted(params_pot.items())), expr_pot, 0.1, 8.0, 600)
+        except (ValueError, TypeError, SyntaxError) as exc:
+            st.error(f"No se pudo evaluar el potencial: {exc}")
+            st.stop()
+    r, veff = curvas.r, curvas.veff
+    r_valid, pr_pos = curvas.r_valid, curvas.pr_pos
+    r_plot, pr_plot = curvas.r_plot, curvas.pr_plot
+    turning_points = curvas.turning_points
 
     col_graph1, col_graph2 = st.columns(2)
 
@@ -374,7 +421,8 @@ with tab3:
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
             hovermode='x unified'
         )
-        st.plotly_chart(fig_pot, use_container_width=True)
+        with span("main.plotly_chart.potencial"):
+            st.plotly_chart(fig_pot, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
     # Gráfica 2: Espacio Fase
@@ -429,7 +477,8 @@ with tab3:
             margin=dict(l=20, r=20, t=60, b=20),
             hovermode='closest'
         )
-        st.plotly_chart(fig_phase, use_container_width=True)
+        with span("main.plotly_chart.fases"):
+            st.plotly_chart(fig_phase, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
     # Animación
@@ -444,64 +493,13 @@ with tab3:
         
         with col_anim2:
             if st.session_state.animation_running:
-                # Crear placeholder para la animación
-                anim_placeholder = st.empty()
-                prog_bar = st.progress(0)
-                
-                # Interpolación para animación suave
-                steps = 100
-                indices = np.linspace(0, len(r_plot)-1, steps, dtype=int)
+                # Una sola figura con frames: la animación se reproduce en el navegador
+                fig_anim = phase_animation_figure(r_plot, pr_plot, steps=100, frame_ms=50)
+                with span("main.plotly_chart.animacion"):
+                    st.plotly_chart(fig_anim, use_container_width=True)
                 
-                for i, idx in enumerate(indices):
-                    # Crear figura actualizada
-                    fig_anim = go.Figure()
-                    
-                    # Trayectoria completa
-                    fig_anim.add_trace(go.Scatter(
-                        x=r_plot, y=pr_plot, 
-                        mode='lines', 
-                        name='Trayectoria de Fase',
-                        line=dict(color='#7c3aed', width=3), 
-                        fill='toself', 
-                        fillcolor='rgba(124, 58, 237, 0.1)'
-                    ))
-                    
-                    # Punto actual
-                    fig_anim.add_trace(go.Scatter(
-                        x=[r_plot[idx]], y=[pr_plot[idx]], 
-                        mode='markers+text',
-                        marker=dict(color='#db2777', size=15, line=dict(color='white', width=2)),
-                        text=[f"t={i}"], textposition="top center",
-                        name='Estado Actual'
-                    ))
-                    
-                    fig_anim.update_layout(
-                        title=f"<b>Evolución Temporal - Paso {i+1}/{steps}</b>", 
-                        xaxis_title="r", 
-                        yaxis_title="p_r",
-                        xaxis_range=[0, 8], 
-                        yaxis_range=[-4, 4], 
-                        height=400, 
-                        margin=dict(l=20, r=20, t=60, b=20),
-                        showlegend=True
-                    )
-                    
-                    # Actualizar placeholder
-                    anim_placeholder.plotly_chart(fig_anim, use_container_width=True)
-                    
-                    # Actualizar barra de progreso
-                    prog_bar.progress((i + 1) / steps)
-                    
-                    time.sleep(0.05)  # Control de velocidad
-                
-                prog_bar.empty()
-                st.success("✅ Animación completada")
-                st.session_state.animation_running = False
-                
-                # Botón para reiniciar
-                if st.button("🔄 Reiniciar Animación"):
-                    st.session_state.animation_running = True
-                    st.rerun()
+                # Callback: el estado cambia antes de que el fragmento se vuelva a ejecutar
+                st.button("⏹️ Ocultar Animación", on_click=ocultar_animacion)
     else:
         st.warning("No se puede animar: no hay región clásicamente permitida con los parámetros actuales.")
 
@@ -520,10 +518,23 @@ with tab3:
                 st.write("**Puntos de Retorno:**")
                 for i, tp in enumerate(turning_points):
                     st.write(f"- r_{i+1} = {tp:.3f}")
+            
+            # Contadores de la caché que ha servido estas curvas (ver el comienzo de la pestaña)
+            if nombre_pot == "kepler" and lattice_covers(E_val, L_val, m_val, alpha_val, 0.1, 8.0, 600):
+                st.caption("Curvas servidas desde la tabla precalculada (acceso directo, sin caché)")
+            else:
+                stats = (curve_set if nombre_pot == "kepler" else potential_curve_set).stats()
+                st.caption(f"Caché de cálculo: {stats['hits']} aciertos / {stats['misses']} fallos "
+                           f"({stats['size']}/{stats['maxsize']} entradas)")
         
         with col_info2:
             st.write("**Análisis de Órbita:**")
-            if E_val < 0 and len(turning_points) >= 2:
+            if nombre_pot != "kepler":
+                if len(turning_points) >= 2:
+                    st.success("Órbita LIGADA entre dos radios de retorno")
+                else:
+                    st.info("Sin segundo radio de retorno en [0.1, 8]: órbita no ligada en esta ventana")
+            elif E_val < 0 and len(turning_points) >= 2:
                 st.success("Órbita ELÍPTICA (ligada)")
                 st.write(f"- Radio mínimo: {min(turning_points):.3f}")
                 st.write(f"- Radio máximo: {max(turning_points):.3f}")
@@ -532,4 +543,54 @@ with tab3:
             elif E_val == 0:
                 st.warning("Órbita PARABÓLICA (caso límite)")
             else:
-                st.error("Configuración no física o sin puntos de retorno")
\ No newline at end of file
+                st.error("Configuración no física o sin puntos de retorno")
+
+    # Barrido de elementos orbitales sobre toda la malla de sliders (E, L)
+    with st.expander("🗺️ Barrido de Precesión y Elementos Orbitales"):
+        # Cada malla nueva (m, α, parámetros) cuesta de 0.1 s a más de medio segundo con
+        # cuadratura: solo se calcula si se pide, no en cada rerun del laboratorio
+        calcular = st.toggle("Calcular el barrido sobre la malla (E, L)", key="barrido_activo")
+        if not calcular:
+            st.caption("Activa el barrido para ver e, a, T_r y la precesión en toda la malla de sliders.")
+        else:
+            magnitud = st.radio("Magnitud", list(MAGNITUDES_BARRIDO), horizontal=True)
+            campo, escala = MAGNITUDES_BARRIDO[magnitud]
+            barrido = element_sweep(m_val, nombre_pot, tuple(sorted(params_pot.items())), expr_pot,
+                                    -2.0, 2.0, 0.5, 3.0, 121, 101)
+            z = getattr(barrido, campo)
+
+            fig_sweep = go.Figure(go.Heatmap(
+                x=barrido.E[0], y=barrido.L[:, 0], z=z,
+                colorscale=escala, zmid=0 if campo == "precession" else None,
+                colorbar=dict(title=magnitud.split()[-1]),
+                hovertemplate="E: %{x:.2f}<br>L: %{y:.2f}<br>%{z:.4g}<extra></extra>"
+            ))
+            fig_sweep.add_trace(go.Scatter(
+                x=[E_val], y=[L_val], mode='markers', name='Órbita actual',
+                marker=dict(color='black', size=12, symbol='x')
+            ))
+            fig_sweep.update_layout(
+                title=f"<b>{magnitud}</b> (solo órbitas ligadas; en blanco, no ligadas o prohibidas)",
+                xaxis_title="Energía E", yaxis_title="Momento angular L",
+                height=500, margin=dict(l=20, r=20, t=60, b=20)
+            )
+            with span("main.plotly_chart.barrido"):
+                st.plotly_chart(fig_sweep, use_container_width=True)
+            if nombre_pot == "kepler":
+                st.caption("Kepler: e = √(1 + 2EL²/mα²), a = −α/2E, T = 2π√(ma³/α) y precesión nula.")
+            else:
+                st.caption("Periodo radial y Δθ por cuadratura de Gauss–Chebyshev entre los radios de retorno.")
+
+
+with tab3:
+    pestana_laboratorio(E_val, L_val, m_val, alpha_val, nombre_pot, params_pot, expr_pot)
+
+
+# Tiempos por etapa (solo con CENTRAL_FORCE_METRICS=1, ver central_force.metrics)
+observe("main.rerun", clock() - _inicio_ejecucion)
+if metrics_enabled():
+    with st.sidebar.expander("⏱️ Tiempos por etapa (depuración)"):
+        st.dataframe(metrics_summary(), hide_index=True, use_container_width=True)
+        st.download_button("Exportar (Prometheus)", export_prometheus(), "central_force.prom",
+                           key="exportar_metricas")
+    write_metrics()
@@ -1,9 +1,60 @@
+import sys
+from pathlib import Path
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-from scipy.integrate import solve_ivp
-import time
+
+# Hacer importable el núcleo de física compartido (raíz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from central_force import (  # noqa: E402
+    initial_radial_momentum,
+    orbital_type,
+)
+from central_force.conservation import cheapest, cost_accuracy, simulate_monitored  # noqa: E402
+from central_force.curves import curve_set  # noqa: E402
+from central_force.metrics import (  # noqa: E402
+    clock,
+    export_prometheus,
+    instrumented,
+    metrics_enabled,
+    metrics_summary,
+    observe,
+    span,
+    write_metrics,
+)
+from central_force.rendering import RenderStats, cached_figure  # noqa: E402
+
+# Inicio de la ejecución completa (tramo v2.rerun)
+_inicio_ejecucion = clock()
+
+# Opciones de integración para la simulación de órbitas (ver central_force.simulation)
+INTEGRADORES = {
+    "RK45 (adaptativo)": "rk45",
+    "RK45 con eventos (parada temprana y periodicidad)": "events",
+    "Störmer–Verlet (simpléctico)": "verlet",
+    "Yoshida 4 (simpléctico)": "yoshida4",
+    "Levi-Civita (regularizado, L pequeño)": "levicivita",
+    "Kepler analítico": "kepler",
+}
+
+# Contadores de figuras y bytes renderizados en esta sesión (ver central_force.rendering)
+if 'render_stats' not in st.session_state:
+    st.session_state.render_stats = RenderStats()
+
+
+def tema_actual():
+    """'dark' o 'light' según el tema activo en el navegador (claro si Streamlit no lo expone)"""
+    theme = getattr(getattr(st, "context", None), "theme", None)
+    return getattr(theme, "type", None) or "light"
+
+
+def describir_ajuste(metodo, tol_digits, dt):
+    """Paso o tolerancia con que se integró (ver central_force.conservation.refinement_ladder)"""
+    if metodo in ("verlet", "yoshida4"):
+        return f"Δt = {dt:g}"
+    if metodo == "kepler":
+        return "exacto"
+    return "tolerancia por defecto" if tol_digits is None else f"rtol = 1e-{tol_digits}"
 
 
 # 1. Inyección de CSS para "Tarjetas de Vidrio" (Glassmorphism)
@@ -44,6 +95,7 @@ st.markdown("""
 st.title("🔭 Mecánica Clásica")
 
 # Crear pestañas
+# Cada pestaña es un fragmento (st.fragment): sus widgets solo re-ejecutan esa pestaña
 tab1, tab2, tab3, tab4 = st.tabs([
     "📚 Teoría", 
     "🧪 Tests Órbitas", 
@@ -54,7 +106,9 @@ tab1, tab2, tab3, tab4 = st.tabs([
 # =============================================
 # PESTAÑA 1: TEORÍA AVANZADA
 # =============================================
-with tab1:
+@st.fragment
+@instrumented("v2.fragment.teoria")
+def pestana_teoria():
     st.header("Hamiltoniano en Coordenadas Esféricas para Potencial Central")
     
     st.markdown(r"""
@@ -136,10 +190,16 @@ with tab1:
     Note que $p_\phi$ es constante, lo que refleja la conservación del momento angular en la dirección z.
     """)
 
+
+with tab1:
+    pestana_teoria()
+
 # =============================================
 # PESTAÑA 2: TESTS INTERACTIVOS
 # =============================================
-with tab2:
+@st.fragment
+@instrumented("v2.fragment.tests")
+def pestana_tests():
     st.header("🧪 Tests Interactivos de Mecánica Clásica")
     
     # Pregunta 1
@@ -171,32 +231,27 @@ with tab2:
     angular_momentum = st.slider("Momento angular", 0.1, 2.0, 1.0, 0.1, key="ang_mom_slider")
     
     # Cálculo de parámetros orbitales
-    def orbital_type(E, L):
-        if E < 0:
-            return "Elíptica"
-        elif E == 0:
-            return "Parabólica"
-        else:
-            return "Hiperbólica"
-    
     tipo_orbita = orbital_type(energy, angular_momentum)
     
-    # Gráfica simple de potencial efectivo
-    fig, ax = plt.subplots(figsize=(10, 6))
-    r = np.linspace(0.1, 10, 1000)
-    U_eff = -1/r + angular_momentum**2/(2*r**2)  # Potencial efectivo
-    
-    ax.plot(r, U_eff, 'b-', linewidth=2, label='Potencial efectivo')
-    ax.axhline(y=energy, color='r', linestyle='--', label=f'Energía = {energy}')
-    ax.set_xlim(0, 10)
-    ax.set_ylim(-2, 2)
-    ax.set_xlabel('r')
-    ax.set_ylabel('Energía')
-    ax.set_title(f'Potencial Efectivo - Órbita {tipo_orbita}')
-    ax.legend()
-    ax.grid(True)
-    
-    st.pyplot(fig)
+    # Gráfica simple de potencial efectivo (matplotlib se carga al usarlo por primera vez)
+    # Potencial efectivo (m = α = 1), muestreado de forma adaptativa
+    r, U_eff = curve_set(energy, angular_momentum, 1.0, 1.0, 0.1, 10, tol=1e-3, y_clip=(-2.0, 2.0))[:2]
+
+    def dibujar_potencial(fig, ax):
+        ax.plot(r, U_eff, 'b-', linewidth=2, label='Potencial efectivo')
+        ax.axhline(y=energy, color='r', linestyle='--', label=f'Energía = {energy}')
+        ax.set_xlim(0, 10)
+        ax.set_ylim(-2, 2)
+        ax.set_xlabel('r')
+        ax.set_ylabel('Energía')
+        ax.set_title(f'Potencial Efectivo - Órbita {tipo_orbita}')
+        ax.legend()
+        ax.grid(True)
+
+    # Imagen compartida entre sesiones: solo se dibuja la primera vez que alguien pide estos valores
+    st.image(cached_figure(("v2.potencial_quiz", energy, angular_momentum), dibujar_potencial,
+                           figsize=(10, 6), theme=tema_actual(), stats=st.session_state.render_stats),
+             use_container_width=True)
     
     opcion2 = st.selectbox("Selecciona el tipo de órbita:",
                           ["Solo órbitas circulares", 
@@ -210,10 +265,16 @@ with tab2:
         else:
             st.error("❌ Incorrecto. Revisa la teoría de órbitas en potenciales centrales.")
 
+
+with tab2:
+    pestana_tests()
+
 # =============================================
 # PESTAÑA 3: ESPACIO DE FASES
 # =============================================
-with tab3:
+@st.fragment
+@instrumented("v2.fragment.espacio_fases")
+def pestana_espacio_fases():
     st.header("📊 Espacio de Fases y Potencial Efectivo")
     st.markdown("Explora el espacio de fases para una partícula en un potencial central $U(r) = -\\alpha/r$ con momento angular $L$. Ajusta los parámetros para ver cómo cambian las órbitas y el espacio de fases.")
     
@@ -229,107 +290,139 @@ with tab3:
 
 
     # Gráfica del potencial efectivo
-    fig1, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
-    
-    r = np.linspace(0.1, 10, 1000)
+    r, U_eff = curve_set(energia, L, masa, alpha, 0.1, 10, tol=1e-3, y_clip=(-10.0, 15.0))[:2]
     U = -alpha/r
     U_centrifuga = L**2/(2*masa*r**2)
-    U_eff = U + U_centrifuga
-    
-    # Potencial efectivo
-    ax1.plot(r, U, 'r--', alpha=0.7, label=r'$-\alpha/r$')
-    ax1.plot(r, U_centrifuga, 'g--', alpha=0.7, label=r'$L^2/(2mr^2)$')
-    ax1.plot(r, U_eff, 'b-', linewidth=2, label='Potencial efectivo')
-    ax1.axhline(y=energia, color='k', linestyle='--', label=f'E = {energia}')
-    ax1.set_xlabel('r')
-    ax1.set_ylabel('Energía Potencial')
-    ax1.set_title('Potencial Efectivo')
-    ax1.legend()
-    ax1.grid(True)
-    ax1.set_ylim(-10, 15)
-    ax1.set_xlim(0, 1.5)
-    
+
     # Espacio de fases (r vs p_r)
     # Para una energía dada E, p_r = ±√[2m(E - U_eff(r))]
-    r_min = 0.3
-    r_vals = np.linspace(r_min, 25, 500)
-    U_eff_vals = -alpha/r_vals + L**2/(2*masa*r_vals**2)
-    
-    # Solo graficar donde E >= U_eff
-    valid_indices = energia >= U_eff_vals
-    r_valid = r_vals[valid_indices]
-    
-    if len(r_valid) > 0:
-        p_r_pos = np.sqrt(2*masa*(energia - (-alpha/r_valid + L**2/(2*masa*r_valid**2))))
-        p_r_neg = -p_r_pos
-        
-        ax2.plot(r_valid, p_r_pos, 'b-', linewidth=2, label='Espacio de fases')
-        ax2.plot(r_valid, p_r_neg, 'b-', linewidth=2)
-        ax2.set_xlabel('$r$')
-        ax2.set_ylabel('$p_r$')
-        ax2.set_xlim(p_r_pos.min()-1, r_valid.max()+1)
-        ax2.set_title('Espacio de Fases $(r, p_r)$')
-        ax2.grid(True)
-        ax2.legend()
-    
-    st.pyplot(fig1)
+    # Solo graficar donde E >= U_eff (curvas memoizadas por parámetros)
+    fase = curve_set(energia, L, masa, alpha, 0.3, 25, tol=1e-3)
+    r_valid, p_r_pos = fase.r_valid, fase.pr_pos
+
+    def dibujar_fases(fig, axes):
+        ax1, ax2 = axes
+
+        # Potencial efectivo
+        ax1.plot(r, U, 'r--', alpha=0.7, label=r'$-\alpha/r$')
+        ax1.plot(r, U_centrifuga, 'g--', alpha=0.7, label=r'$L^2/(2mr^2)$')
+        ax1.plot(r, U_eff, 'b-', linewidth=2, label='Potencial efectivo')
+        ax1.axhline(y=energia, color='k', linestyle='--', label=f'E = {energia}')
+        ax1.set_xlabel('r')
+        ax1.set_ylabel('Energía Potencial')
+        ax1.set_title('Potencial Efectivo')
+        ax1.legend()
+        ax1.grid(True)
+        ax1.set_ylim(-10, 15)
+        ax1.set_xlim(0, 1.5)
+
+        if len(r_valid) > 0:
+            p_r_neg = -p_r_pos
+
+            ax2.plot(r_valid, p_r_pos, 'b-', linewidth=2, label='Espacio de fases')
+            ax2.plot(r_valid, p_r_neg, 'b-', linewidth=2)
+            ax2.set_xlabel('$r$')
+            ax2.set_ylabel('$p_r$')
+            ax2.set_xlim(p_r_pos.min()-1, r_valid.max()+1)
+            ax2.set_title('Espacio de Fases $(r, p_r)$')
+            ax2.grid(True)
+            ax2.legend()
+
+    st.image(cached_figure(("v2.fases", energia, L, masa, alpha), dibujar_fases, figsize=(15, 5), ncols=2,
+                           theme=tema_actual(), stats=st.session_state.render_stats),
+             use_container_width=True)
+    stats = curve_set.stats()
+    st.caption(f"Caché de curvas: {stats['hits']} aciertos / {stats['misses']} fallos "
+               f"({stats['size']}/{stats['maxsize']} entradas)")
+    figuras = st.session_state.render_stats.snapshot()
+    st.caption(f"Figuras en esta sesión: {figuras['created']} creadas, {figuras['open']} abiertas, "
+               f"{figuras['cached']} servidas de caché · {figuras['bytes'] / 1e3:.0f} kB servidos")
     st.markdown("---")
     # Gráfica de órbitas
     st.subheader("Simulación de Órbitas")
     
-    def derivadas_orbita(t, y, m, alpha):
-        r, theta, pr, ptheta = y
-        drdt = pr/m
-        dthetadt = ptheta/(m*r**2)
-        dprdt = ptheta**2/(m*r**3) - alpha/r**2
-        dpthetadt = 0
-        return [drdt, dthetadt, dprdt, dpthetadt]
-    
     # Condiciones iniciales
     r0 = st.slider("Radio inicial r₀", 0.5, 5.0, 2.0, 0.1)
     theta0 = st.slider("Ángulo inicial θ₀", 0.0, 2*np.pi, 0.0, 0.1)
     
     # Calcular pr0 para la energía seleccionada
-    U_eff0 = -alpha/r0 + L**2/(2*masa*r0**2)
-    pr0 = np.sqrt(2*masa*(energia - U_eff0))
-    
-    if st.button("Simular Órbita"):
-        # Resolver ecuaciones diferenciales
-        t_span = (0, 20)
-        t_eval = np.linspace(0, 20, 1000)
-        sol = solve_ivp(derivadas_orbita, t_span, [r0, theta0, pr0, L], 
-                       args=(masa, alpha), t_eval=t_eval, method='RK45')
+    pr0 = initial_radial_momentum(r0, energia, L, masa, alpha)
+    
+    # Integrador: RK45 adaptativo o esquemas simplécticos de paso fijo
+    metodo = st.selectbox("Integrador", list(INTEGRADORES), key="integrador")
+    dt = 0.01
+    if INTEGRADORES[metodo] in ("verlet", "yoshida4"):
+        dt = st.select_slider("Paso de tiempo Δt", options=[0.001, 0.002, 0.005, 0.01, 0.02, 0.05],
+                              value=0.01, key="dt_simplectico")
+    # Si H o L derivan más que esto se afina la tolerancia (o Δt) y, si no basta, se cambia de integrador
+    objetivo = st.select_slider("Error relativo máximo de H y L", options=[1e-3, 1e-4, 1e-5, 1e-6, 1e-8, 1e-10],
+                                value=1e-6, format_func=lambda x: f"{x:.0e}", key="objetivo_conservacion")
+    
+    simular = st.button("Simular Órbita")
+    if simular and not np.isfinite(pr0):
+        st.warning("r₀ está en la zona clásicamente prohibida (E < U_eff(r₀)): elige otro radio inicial.")
+    elif simular:
+        # Resolver ecuaciones diferenciales (memoizado: repetir la simulación es instantáneo)
+        monitor = simulate_monitored(INTEGRADORES[metodo], r0, theta0, pr0, L, masa, alpha,
+                                     t_end=20.0, n_eval=1000, dt=dt, target=objetivo)
+        orbita = monitor.result
+        r_t, theta_t = orbita.y[0], orbita.y[1]
+        st.caption(f"Conservación: |ΔH/H₀| máx = {monitor.energy_error:.2e}, "
+                   f"|ΔL/L₀| máx = {monitor.momentum_error:.2e}")
+        if len(monitor.attempts) > 1:
+            ajuste = describir_ajuste(monitor.method, monitor.tol_digits, monitor.dt)
+            nombre = next(k for k, v in INTEGRADORES.items() if v == monitor.method)
+            cumple = max(monitor.energy_error, monitor.momentum_error) <= objetivo
+            st.info(f"La deriva superaba {objetivo:.0e}: tras {len(monitor.attempts)} intentos se usó "
+                    f"{nombre} con {ajuste}" + ("" if cumple else " (mejor resultado, sin alcanzar el objetivo)"))
+        if orbita.events is not None:
+            ev = orbita.events
+            resumen = f"Parada: {ev['status']} en t = {ev['t_stop']:.2f} · {ev['nfev']} evaluaciones"
+            if ev["period"] is not None:
+                resumen += f" · periodo radial T = {ev['period']:.3f}, Δθ = {ev['delta_theta']:.3f} rad"
+            resumen += f" · {len(ev['periapsis'])} periapsis, {len(ev['apoapsis'])} apoapsis"
+            st.caption(resumen)
         
         # Convertir a coordenadas cartesianas
-        x = sol.y[0] * np.cos(sol.y[1])
-        y = sol.y[0] * np.sin(sol.y[1])
-        
-        # Animación simple (mostrar progresivamente)
-        fig3, ax3 = plt.subplots(figsize=(8, 8))
+        x = r_t * np.cos(theta_t)
+        y = r_t * np.sin(theta_t)
         
-        placeholder = st.empty()
-        
-        for i in range(50, len(x), 10):
-            ax3.clear()
-            ax3.plot(x[:i], y[:i], 'b-', alpha=0.7)
-            ax3.plot(x[i-1], y[i-1], 'ro', markersize=8)
-            ax3.plot(0, 0, 'yo', markersize=10)  # Centro de fuerza
-            
-            ax3.set_xlim(-max(np.max(np.abs(x)), 5), max(np.max(np.abs(x)), 5))
-            ax3.set_ylim(-max(np.max(np.abs(y)), 5), max(np.max(np.abs(y)), 5))
-            ax3.set_xlabel('x')
-            ax3.set_ylabel('y')
-            ax3.set_title('Órbita en el Espacio de Configuración')
-            ax3.grid(True)
-            ax3.set_aspect('equal')
-            
-            placeholder.pyplot(fig3)
-            time.sleep(0.1)
+        # Animación en el navegador: una sola figura con frames en lugar de ~95 PNG
+        from central_force.animation import orbit_animation_figure
+        with span("v2.plotly_chart.orbita"):
+            st.plotly_chart(orbit_animation_figure(x, y, start=50, stride=10, frame_ms=100),
+                            use_container_width=True)
+
+    # Coste frente a precisión de todos los integradores para estas condiciones iniciales
+    with st.expander("⚖️ Coste frente a precisión de los integradores"):
+        if not np.isfinite(pr0):
+            st.caption("r₀ está en la zona prohibida: no hay órbita que comparar.")
+        elif st.button("Comparar integradores", key="comparar_integradores"):
+            filas = cost_accuracy(r0, theta0, pr0, L, masa, alpha, t_end=20.0, n_eval=1000, dt=dt)
+            nombres = {v: k for k, v in INTEGRADORES.items()}
+            st.dataframe([{"Integrador": nombres[f.method],
+                           "Ajuste": describir_ajuste(f.method, f.tol_digits, f.dt),
+                           "Tiempo (ms)": round(f.seconds * 1e3, 1),
+                           "|ΔH/H₀| máx": f"{f.energy_error:.1e}",
+                           "|ΔL/L₀| máx": f"{f.momentum_error:.1e}"} for f in filas],
+                         hide_index=True, use_container_width=True)
+            mejor = cheapest(filas, objetivo)
+            if mejor is None:
+                st.warning(f"Ningún integrador alcanza {objetivo:.0e} en estos niveles.")
+            else:
+                st.success(f"El más barato que cumple {objetivo:.0e}: {nombres[mejor.method]} "
+                           f"({mejor.seconds * 1e3:.1f} ms)")
+
+
+with tab3:
+    pestana_espacio_fases()
 
 # =============================================
 # PESTAÑA 4: EJERCICIOS MATEMÁTICOS
 # =============================================
-with tab4:
+@st.fragment
+@instrumented("v2.fragment.ejercicios")
+def pestana_ejercicios():
     st.markdown('<h2 class="section-header">Ejercicios</h2>', unsafe_allow_html=True)
     
 
@@ -512,6 +605,10 @@ with tab4:
             st.latex(r"H = \frac{p_r^2}{2m} + \frac{p_\theta^2}{2mr^2} + \frac{p_\phi^2}{2mr^2\sin^2\theta} + - \frac{\alpha}{r}")
 
 
+with tab4:
+    pestana_ejercicios()
+
+
 # Pie de página
 st.markdown("---")
 st.markdown("### 📚 Recursos Adicionales")
@@ -521,3 +618,12 @@ st.markdown("""
 - Marion, J. B., & Thornton, S. T. (1995). Classical Dynamics of Particles and Systems
 """)
 
+
+# Tiempos por etapa (solo con CENTRAL_FORCE_METRICS=1, ver central_force.metrics)
+observe("v2.rerun", clock() - _inicio_ejecucion)
+if metrics_enabled():
+    with st.sidebar.expander("⏱️ Tiempos por etapa (depuración)"):
+        st.dataframe(metrics_summary(), hide_index=True, use_container_width=True)
+        st.download_button("Exportar (Prometheus)", export_prometheus(), "central_force.prom",
+                           key="exportar_metricas")
+    write_metrics()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Igual que las apps: el núcleo de física se importa desde la raíz del repositorio
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from central_force import batch
+from central_force.batch import derivadas_orbita_batch, integrate_batch
+from central_force.physics import energy_scale, hamiltonian, initial_radial_momentum
+from central_force.simulation import simulate_orbit
+
+
+def _y0(n=8):
+    L = np.linspace(0.7, 1.2, n)
+    pr0 = initial_radial_momentum(2.0, -0.3, L, 1.0, 1.0)
+    return np.column_stack([np.full(n, 2.0), np.zeros(n), pr0, L])
+
+
+@pytest.mark.parametrize("n_steps, n_save, expected", [
+    (2000, 1000, 1000),
+    (400, 401, 401),
+    (400, 1000, 401),   # más muestras que pasos: solo los pasos
+    (10, 2, 2),
+])
+def test_save_count_and_real_times(n_steps, n_save, expected):
+    t, ys = integrate_batch(_y0(), t_span=(0, 20), n_steps=n_steps, n_save=n_save)
+    assert t.shape == (expected,)
+    assert ys.shape == (expected, 8, 4)
+    assert t[0] == 0.0 and t[-1] == pytest.approx(20.0)
+    # Cada tiempo devuelto es un múltiplo exacto del paso
+    steps = t / (20.0 / n_steps)
+    assert np.allclose(steps, np.round(steps))
+    assert np.all(np.diff(t) > 0)
+
+
+def test_final_state_and_energy_match_adaptive_integrator():
+    y0 = _y0(4)
+    t, y = integrate_batch(y0, t_span=(0, 10), n_steps=4000)
+    assert t == pytest.approx(10.0)
+    assert y.shape == (4, 4)
+    drift = np.abs(hamiltonian(y, 1.0, 1.0) - hamiltonian(y0, 1.0, 1.0)) / energy_scale(y0, 1.0, 1.0)
+    assert np.all(drift < 1e-8)
+    for row, final in zip(y0, y):
+        reference = simulate_orbit("kepler", *row, 1.0, 1.0, t_end=10.0, n_eval=2)
+        assert np.allclose(final, reference.y[:, -1], atol=1e-6)
+
+
+def test_per_orbit_parameters_must_match_rows():
+    with pytest.raises(ValueError):
+        integrate_batch(_y0(4), m=np.ones(3))
+
+
+def test_rows_kernel_matches_reference_rk4_step():
+    y0, h = _y0(5), 0.01
+    m, alpha = np.linspace(0.5, 2.0, 5), np.linspace(1.0, 3.0, 5)
+    k1 = derivadas_orbita_batch(y0, m, alpha)
+    k2 = derivadas_orbita_batch(y0 + 0.5 * h * k1, m, alpha)
+    k3 = derivadas_orbita_batch(y0 + 0.5 * h * k2, m, alpha)
+    k4 = derivadas_orbita_batch(y0 + h * k3, m, alpha)
+    expected = y0 + (h / 6.0) * (k1 + 2.0 * (k2 + k3) + k4)
+    _, y = integrate_batch(y0, m, alpha, t_span=(0, h), n_steps=1)
+    assert np.allclose(y, expected, rtol=1e-14, atol=0.0)
+
+
+def test_blocks_do_not_change_the_result(monkeypatch):
+    y0 = _y0(10)
+    t, ys = integrate_batch(y0, t_span=(0, 5), n_steps=500, n_save=11)
+    monkeypatch.setattr(batch, "CHUNK", 3)
+    t_blocks, ys_blocks = integrate_batch(y0, t_span=(0, 5), n_steps=500, n_save=11)
+    assert np.array_equal(t, t_blocks) and np.array_equal(ys, ys_blocks)
+    assert np.array_equal(ys[0], y0)
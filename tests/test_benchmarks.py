@@ -0,0 +1,72 @@
+import pytest
+
+from central_force.benchmarks import (
+    CALIBRATION_KEY,
+    compare_baseline,
+    load_baseline,
+    machine_factor,
+    result_key,
+    save_baseline,
+)
+
+
+def _result(case, min_ms, suite="orbits", n=20, median_ms=None):
+    return {"suite": suite, "case": case, "n": n, "min_ms": min_ms,
+            "median_ms": min_ms if median_ms is None else median_ms, "repeat": 5}
+
+
+def _calibration(median_ms):
+    return _result("reference", median_ms / 2, suite="calibration", n=1, median_ms=median_ms)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    results = [_calibration(50.0), _result("rk45", 2.34567), _result("batch", 100.0, n=64)]
+    save_baseline(results, path)
+    baseline = load_baseline(path)
+    # Los casos guardan su mínimo; la calibración, su mediana
+    assert baseline == {CALIBRATION_KEY: 50.0, "orbits/rk45/20": 2.346, "orbits/batch/64": 100.0}
+
+
+@pytest.mark.parametrize("measured, regressed", [
+    (150.0, False),      # justo en el límite: 100 · (1 + 0.5)
+    (150.01, True),
+    (90.0, False),
+])
+def test_tolerance_edge(measured, regressed):
+    baseline = {"orbits/batch/64": 100.0}
+    problems = compare_baseline([_result("batch", measured, n=64)], baseline, tolerance=0.5)
+    assert bool(problems) is regressed
+
+
+def test_slack_protects_tiny_cases():
+    baseline = {"veff/get_veff/10000": 0.1}
+    # 0.1 ms · 1.5 = 0.15 ms, pero el límite es 0.1 + slack_ms = 1.1 ms
+    assert compare_baseline([_result("get_veff", 1.0, suite="veff", n=10_000)], baseline) == []
+    assert compare_baseline([_result("get_veff", 1.2, suite="veff", n=10_000)], baseline)
+
+
+def test_unknown_cases_are_ignored():
+    assert compare_baseline([_result("nuevo", 1e6)], {"orbits/rk45/20": 1.0}) == []
+
+
+def test_baseline_is_scaled_by_calibration():
+    baseline = {CALIBRATION_KEY: 50.0, "orbits/batch/64": 100.0}
+    slow_machine = [_calibration(80.0), _result("batch", 200.0, n=64)]
+    assert machine_factor(slow_machine, baseline) == pytest.approx(1.6)
+    assert compare_baseline(slow_machine, baseline) == []   # límite 100 · 1.6 · 1.5 = 240
+    fast_machine = [_calibration(25.0), _result("batch", 100.0, n=64)]
+    assert compare_baseline(fast_machine, baseline)         # límite 100 · 0.5 · 1.5 = 75
+    # La calibración no se compara consigo misma
+    assert all(CALIBRATION_KEY not in p for p in compare_baseline(slow_machine, baseline))
+
+
+def test_baseline_without_calibration_uses_raw_milliseconds():
+    baseline = {"orbits/batch/64": 100.0}
+    results = [_calibration(80.0), _result("batch", 149.0, n=64)]
+    assert machine_factor(results, baseline) == 1.0
+    assert compare_baseline(results, baseline) == []
+
+
+def test_result_key():
+    assert result_key(_result("rk45", 1.0)) == "orbits/rk45/20"
@@ -0,0 +1,94 @@
+import math
+
+import pytest
+
+from central_force import cache as cache_module
+from central_force.cache import LRUCache, memoize, quantize
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_keeps_recently_used():
+    c = LRUCache(maxsize=2)
+    c.put("a", 1)
+    c.put("b", 2)
+    assert c.get("a") == 1          # "a" pasa a ser la más reciente
+    c.put("c", 3)                   # expulsa "b"
+    assert c.get("b") is None
+    assert c.get("a") == 1 and c.get("c") == 3
+    assert c.stats()["evictions"] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    c = LRUCache(maxsize=8, ttl=10.0)
+    c.put("a", 1)
+    clock.now += 9.9
+    assert c.get("a") == 1
+    clock.now += 0.2
+    assert c.get("a", "caducada") == "caducada"
+    stats = c.stats()
+    assert stats["expirations"] == 1 and stats["size"] == 0 and stats["hits"] == 1
+
+
+def test_maxbytes_eviction():
+    c = LRUCache(maxsize=100, maxbytes=10)
+    c.put("a", b"12345")
+    c.put("b", b"1234")
+    assert c.nbytes == 9
+    c.put("c", b"123")              # 12 bytes > 10: sale "a"
+    assert c.get("a") is None and c.nbytes == 7
+    c.put("d", b"x" * 50)           # una entrada mayor que el límite se queda sola
+    assert c.stats()["size"] == 1 and c.nbytes == 50
+    c.put("d", b"xy")               # reemplazar descuenta el tamaño anterior
+    assert c.nbytes == 2
+
+
+def test_quantized_keys():
+    assert quantize(0.1 + 0.2) == quantize(0.3)
+    assert quantize(0.3) != quantize(0.3 + 1e-5)
+    assert quantize((("alpha", 1.0 + 1e-12),)) == quantize((("alpha", 1.0),))
+    assert quantize(True) is True and quantize("rk45") == "rk45"
+    with pytest.raises(TypeError):
+        quantize([1.0])
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_values_are_rejected_clearly(value):
+    with pytest.raises(ValueError, match="no finito"):
+        quantize(value)
+
+
+def test_memoize_normalizes_the_call_signature():
+    calls = []
+
+    @memoize(maxsize=8, name="tests.f")
+    def f(a, b=1.0, *, c="x"):
+        calls.append((a, b, c))
+        return a + b
+
+    assert f(0.3) == f(0.3, 1.0) == f(0.3, b=1.0) == f(a=0.1 + 0.2, c="x")
+    assert len(calls) == 1
+    f(0.3, 2.0)
+    assert len(calls) == 2
+    stats = f.stats()
+    assert stats["hits"] == 3 and stats["misses"] == 2
+    f.cache_clear()
+    f(0.3)
+    assert len(calls) == 3
+
+
+def test_memoize_keys_var_keyword_arguments():
+    @memoize(maxsize=8, name="tests.g")
+    def g(a, **params):
+        return a, tuple(sorted(params.items()))
+
+    assert g(1.0, x=1.0, y=2.0) is g(1.0, y=2.0, x=1.0)
+    assert g.stats()["hits"] == 1
@@ -0,0 +1,43 @@
+import csv
+
+import numpy as np
+import pytest
+
+from central_force.cli import main, parse_range
+
+
+def test_parse_range():
+    assert np.allclose(parse_range("-0.5:-0.3:0.1"), [-0.5, -0.4, -0.3])
+    assert np.allclose(parse_range("1,2.5"), [1.0, 2.5])
+    assert np.allclose(parse_range("0.7"), [0.7])
+
+
+@pytest.mark.parametrize("method, dt, n_samples, max_drift", [
+    ("rk45", 0.01, 1000, 0.2),      # rtol por defecto de solve_ivp (1e-3)
+    ("batch", 0.01, 1000, 1e-6),
+    ("batch", 0.05, 401, 1e-3),     # 400 pasos: menos muestras que --n-eval
+])
+def test_orbits_writes_trajectories_and_drift(tmp_path, method, dt, n_samples, max_drift):
+    out = tmp_path / method
+    code = main(["orbits", "--E=-0.5,-0.3", "--L", "0.8,1.0", "--r0", "1.0", "--out", str(out),
+                 "--method", method, "--dt", str(dt)])
+    assert code == 0
+    data = np.load(out / "orbits.npz")
+    assert data["t"].shape == (n_samples,)
+    assert data["y"].shape == (4, 4, n_samples)
+    assert data["t"][-1] == pytest.approx(20.0)
+    assert np.all(np.isfinite(data["y"]))
+    assert np.all(data["energy_drift"] < max_drift)
+    with open(out / "orbits.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 4
+    assert all(np.isfinite(float(row["energy_drift"])) for row in rows)
+
+
+def test_orbits_marks_forbidden_combinations(tmp_path):
+    # E < V_eff(r0): sin p_r real en el punto de partida
+    main(["orbits", "--E", "-5", "--L", "1.0", "--out", str(tmp_path), "--method", "batch"])
+    data = np.load(tmp_path / "orbits.npz")
+    assert np.all(np.isnan(data["y"])) and np.isnan(data["energy_drift"][0])
+    with open(tmp_path / "orbits.csv", newline="") as f:
+        assert next(csv.DictReader(f))["tipo"] == "Prohibida"
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from central_force import conservation
+from central_force.conservation import refinement_ladder, simulate_monitored
+from central_force.physics import initial_radial_momentum, turning_points_exact
+
+
+def test_refinement_ladder_per_method_family():
+    assert refinement_ladder("verlet", 0.01, 3) == [(None, 0.01), (None, 0.005), (None, 0.0025)]
+    assert refinement_ladder("rk45", 0.01, 4) == [(None, 0.01), (5, 0.01), (7, 0.01), (9, 0.01)]
+    assert refinement_ladder("levicivita", 0.02, 4) == [(None, 0.02), (10, 0.02), (12, 0.02), (13, 0.02)]
+    assert refinement_ladder("kepler", 0.01, 4) == [(None, 0.01)]
+
+
+def test_returns_at_first_attempt_meeting_target():
+    # Órbita circular: rk45 por defecto ya conserva H de sobra para target = 1e-2
+    mo = simulate_monitored("rk45", 1.0, 0.0, 0.0, 1.0, 1.0, 1.0, target=1e-2)
+    assert (mo.method, mo.tol_digits) == ("rk45", None)
+    assert len(mo.attempts) == 1 and mo.energy_error <= 1e-2
+
+
+def _near_collision():
+    # E = −0.9, L = 0.1: e ≈ 0.991, r_min ≈ 0.005; arranca junto al apoápside
+    E, L = -0.9, 0.1
+    r0 = 0.999 * turning_points_exact(E, L, 1.0, 1.0).r_max
+    return r0, float(initial_radial_momentum(r0, E, L, 1.0, 1.0)), L
+
+
+def test_near_collision_falls_back_to_levicivita():
+    r0, pr0, L = _near_collision()
+    mo = simulate_monitored("rk45", r0, 0.0, pr0, L, 1.0, 1.0, n_eval=500)
+    assert mo.method == "levicivita" and mo.energy_error <= 1e-6
+    assert [a.method for a in mo.attempts[:4]] == ["rk45"] * 4
+
+
+def test_near_collision_escalates_to_kepler():
+    r0, pr0, L = _near_collision()
+    mo = simulate_monitored("verlet", r0, 0.0, pr0, L, 1.0, 1.0, n_eval=500, levels=2, target=1e-9)
+    assert [a.method for a in mo.attempts] == ["verlet"] * 2 + ["levicivita"] * 2 + ["kepler"]
+    assert mo.method == "kepler" and mo.energy_error <= 1e-9
+
+
+def test_nan_attempt_never_becomes_best(monkeypatch):
+    simulate_orbit = conservation.simulate_orbit
+
+    def broken_rk45(method, *args, **kwargs):
+        result = simulate_orbit(method, *args, **kwargs)
+        return result._replace(y=np.full_like(result.y, np.nan)) if method == "rk45" else result
+
+    monkeypatch.setattr(conservation, "simulate_orbit", broken_rk45)
+    mo = simulate_monitored("rk45", 1.0, 0.0, 0.1, 1.0, 1.0, 1.0, levels=1, target=0.0,
+                            fallback=("levicivita",))
+    assert np.isnan(mo.attempts[0].energy_error)
+    assert mo.method == "levicivita" and np.isfinite(mo.energy_error)
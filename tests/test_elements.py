@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from central_force.elements import element_sweep, kepler_orbital_elements
+
+sweep = element_sweep.__wrapped__
+
+
+@pytest.mark.parametrize("m, alpha", [(1.0, 1.0), (1.5, 2.0)])
+def test_kepler_elements_closed_form(m, alpha):
+    E, L = np.meshgrid([-0.8, -0.3, -0.05, 0.2], [0.5, 1.0, 2.0])
+    el = kepler_orbital_elements(E, L, m, alpha)
+    e2 = 1 + 2 * E * L**2 / (m * alpha**2)
+    ok = (e2 >= 0) & (E < 0)
+    assert np.allclose(el.e[e2 >= 0], np.sqrt(e2[e2 >= 0]))
+    assert np.all(np.isnan(el.e[e2 < 0]))
+    assert np.allclose(el.a[ok], -alpha / (2 * E[ok]))
+    assert np.allclose(el.period[ok], 2 * np.pi * np.sqrt(m * el.a[ok]**3 / alpha))
+    assert np.all(el.precession[ok] == 0.0)
+    assert np.all(np.isnan(el.period[E >= 0]))
+
+
+def test_sweep_grid_and_kepler_against_quadrature():
+    closed = sweep(1.0, "kepler", (("alpha", 1.0),), None, -0.45, -0.05, 0.8, 1.4, 9, 7)
+    numeric = sweep(1.0, "kepler", (("alpha", 1.0),), "-alpha/r", -0.45, -0.05, 0.8, 1.4, 9, 7)
+    assert closed.E.shape == (7, 9)
+    assert np.allclose(closed.E[0], np.linspace(-0.45, -0.05, 9))
+    assert np.allclose(closed.L[:, 0], np.linspace(0.8, 1.4, 7))
+    for field in ("e", "a", "period"):
+        assert np.allclose(getattr(numeric, field), getattr(closed, field), rtol=1e-7, equal_nan=True), field
+    assert np.allclose(numeric.precession[np.isfinite(closed.e)], 0.0, atol=1e-8)
+
+
+def test_sweep_precession_of_small_gr_correction():
+    # U = −α/r − β/r³ con β pequeño: Δθ − 2π ≈ 6π β m² α / L⁴ (primer orden en β)
+    m, alpha, beta = 1.0, 1.0, 1e-4
+    el = sweep(m, "gr", (("alpha", alpha), ("beta", beta)), None, -0.4, -0.2, 1.0, 1.5, 3, 3)
+    expected = 6 * np.pi * beta * m**2 * alpha / el.L**4
+    bound = np.isfinite(el.precession)
+    assert bound.sum() >= 6
+    assert np.allclose(el.precession[bound], expected[bound], rtol=0.02)
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from central_force.events import integrate_events
+from central_force.physics import initial_radial_momentum
+
+
+def test_wide_bound_orbit_is_not_an_escape():
+    # E = −0.005: a = 100 y r_max ≈ 200, muy por encima de r_escape = 50
+    y0 = [1.0, 0.0, float(initial_radial_momentum(1.0, -0.005, 1.0, 1.0, 1.0)), 1.0]
+    info = integrate_events(y0, 1.0, 1.0, t_end=1500.0)
+    assert info["status"] == "t_end"
+    assert info["sol"]([info["t_stop"]])[0, 0] > 50.0
+
+
+@pytest.mark.parametrize("r0, pr0", [(1.0, 1.0), (80.0, 0.5), (80.0, -0.5)])
+def test_unbound_orbit_escapes(r0, pr0):
+    info = integrate_events([r0, 0.0, pr0, 1.0], 1.0, 1.0, t_end=2000.0)
+    assert info["status"] == "escape"
+    assert info["sol"]([info["t_stop"]])[0, 0] == pytest.approx(max(50.0, 2 * r0))
+
+
+def test_bound_orbit_closes_with_kepler_period():
+    info = integrate_events([2.0, 0.0, 0.0, 1.0], 1.0, 1.0, t_end=50.0)
+    assert info["status"] == "periódica"
+    a = 1.0 / (2 * 0.375)   # E = 1/8 − 1/2
+    assert info["period"] == pytest.approx(2 * np.pi * a**1.5, rel=1e-6)
+    assert info["delta_theta"] == pytest.approx(2 * np.pi, rel=1e-6)
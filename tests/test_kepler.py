@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from central_force.kepler import (
+    propagate_kepler,
+    solve_barker,
+    solve_kepler_elliptic,
+    solve_kepler_hyperbolic,
+)
+from central_force.physics import derivadas_orbita, hamiltonian
+
+
+def test_kepler_equation_solvers():
+    M = np.linspace(-20.0, 20.0, 401)
+    for e in (0.0, 0.3, 0.9, 0.999):
+        E = solve_kepler_elliptic(M, e)
+        assert np.allclose(E - e * np.sin(E), M, atol=1e-12)
+    for e in (1.001, 1.5, 5.0):
+        F = solve_kepler_hyperbolic(M, e)
+        assert np.allclose(e * np.sinh(F) - F, M, atol=1e-10 * np.maximum(1.0, np.abs(M)))
+    D = solve_barker(M)
+    assert np.allclose(D + D**3 / 3, M, atol=1e-10 * np.maximum(1.0, np.abs(M)))
+
+
+@pytest.mark.parametrize("y0, m, alpha", [
+    ([2.0, 0.0, 0.0, 1.0], 1.0, 1.0),           # elipse desde el apoapsis
+    ([1.5, 0.7, 0.4, 0.6], 2.0, 1.5),           # elipse excéntrica, m y α distintos
+    ([2.0, 0.0, -0.5, np.sqrt(0.75)], 1.0, 1.0),   # parábola (H = 0)
+    ([1.0, 0.0, 1.0, 1.2], 1.0, 1.0),           # hipérbola
+])
+def test_propagate_kepler_matches_tight_rk45(y0, m, alpha):
+    t = np.linspace(0.0, 12.0, 49)
+    reference = solve_ivp(derivadas_orbita, (0.0, 12.0), y0, args=(m, alpha), t_eval=t,
+                          method="DOP853", rtol=1e-12, atol=1e-12)
+    kepler = propagate_kepler(t, y0, m, alpha)
+    assert kepler.shape == (4, t.size)
+    assert np.allclose(kepler, reference.y, rtol=1e-7, atol=1e-7)
+    assert np.allclose(hamiltonian(kepler.T, m, alpha), hamiltonian(np.asarray(y0), m, alpha), atol=1e-10)
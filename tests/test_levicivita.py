@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import scipy.integrate
+
+from central_force.kepler import propagate_kepler
+from central_force.levicivita import integrate_levi_civita, propagate_levi_civita
+
+
+@pytest.mark.parametrize("y0", [
+    [2.0, 0.0, 0.0, 1.0],       # elipse
+    [1.0, 0.3, 0.0, 0.05],      # e ≈ 1: periapsis casi en el origen
+    [1.0, 0.0, 1.0, 1.2],       # hipérbola
+])
+def test_matches_kepler_propagator(y0):
+    t = np.linspace(0.0, 15.0, 61)
+    exact = propagate_kepler(t, y0, 1.0, 1.0)
+    reg = propagate_levi_civita(t, y0, 1.0, 1.0, rtol=1e-10, atol=1e-12)
+    z_exact = exact[0] * np.exp(1j * exact[1])
+    z_reg = reg[0] * np.exp(1j * reg[1])
+    assert np.max(np.abs(z_reg - z_exact) / exact[0]) < 1e-6
+    assert np.allclose(reg[2], exact[2], atol=1e-5 * max(1.0, np.max(np.abs(exact[2]))))
+    assert np.allclose(reg[3], y0[3])
+
+
+def _fake_solve_ivp(status, t_reached):
+    def solve_ivp(*args, **kwargs):
+        y = np.zeros((5, 2))
+        y[4, -1] = t_reached
+        return SimpleNamespace(status=status, message="Required step size is less than spacing",
+                               t=np.array([0.0, 0.1]), y=y, nfev=10)
+
+    return solve_ivp
+
+
+@pytest.mark.parametrize("status", [-1, 0])   # fallo de RK45, o t(s) que no llega a t_end
+def test_unreachable_t_end_raises_instead_of_looping(monkeypatch, status):
+    monkeypatch.setattr(scipy.integrate, "solve_ivp", _fake_solve_ivp(status, 1.0))
+    with pytest.raises(RuntimeError):
+        integrate_levi_civita([2.0, 0.0, 0.0, 1.0], 1.0, 1.0, t_end=20.0)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from central_force.curves import curve_set
+from central_force.lookup import (
+    Axis,
+    build_lookup_table,
+    lattice_covers,
+    lattice_curve_set,
+    load_lookup_table,
+)
+from central_force.physics import turning_points_exact
+
+LATTICE = {
+    "E": Axis(-0.5, 0.5, 0.25),
+    "L": Axis(0.5, 1.5, 0.5),
+    "m": Axis(1.0, 2.0, 0.5),
+    "alpha": Axis(1.0, 1.0, 0.1),
+}
+
+
+@pytest.mark.parametrize("E, L, m", [(-0.25, 1.0, 1.0), (0.25, 0.5, 2.0), (-0.5, 1.5, 1.5)])
+def test_table_matches_uniform_curve_set(tmp_path, E, L, m):
+    build_lookup_table(tmp_path, LATTICE, (0.1, 8.0, 200))
+    table = lattice_curve_set(E, L, m, 1.0, 0.1, 8.0, 200, path=tmp_path)
+    uniform = curve_set.__wrapped__(E, L, m, 1.0, 0.1, 8.0, 200)
+    assert np.array_equal(table.r, uniform.r)
+    assert np.allclose(table.veff, uniform.veff, rtol=1e-6)
+    # Mismos nodos de la malla más el cierre en los puntos de retorno
+    grid = np.isin(table.r_valid, uniform.r)
+    assert np.array_equal(table.r_valid[grid], uniform.r_valid)
+    assert np.allclose(table.pr_pos[grid], uniform.pr_pos, rtol=1e-5, atol=1e-6)
+    assert np.allclose(table.turning_points, uniform.turning_points)
+
+
+@pytest.mark.parametrize("E, L, m", [
+    (-0.25, 1.0, 1.0),    # ligada: cierra en r_min y r_max
+    (0.25, 1.0, 2.0),     # no ligada: cierra en r_min
+    (-0.3, 0.9, 1.3),     # fuera de la malla: respaldo adaptativo
+])
+@pytest.mark.parametrize("built", [True, False])
+def test_lab_phase_curve_closes_at_exact_turning_points(tmp_path, E, L, m, built):
+    if built:
+        build_lookup_table(tmp_path, LATTICE, (0.1, 8.0, 600))
+    curves = lattice_curve_set(E, L, m, 1.0, 0.1, 8.0, 600, path=tmp_path, tol=1e-3, y_clip=(-4.0, 4.0))
+    tp = turning_points_exact(E, L, m, 1.0)
+    assert curves.r_valid[0] == pytest.approx(tp.r_min) and curves.pr_pos[0] == 0.0
+    if tp.bound:
+        assert curves.r_valid[-1] == pytest.approx(tp.r_max) and curves.pr_pos[-1] == 0.0
+    assert np.all(np.diff(curves.r_valid) >= 0)
+
+
+def test_lattice_covers_only_table_hits(tmp_path):
+    assert not lattice_covers(-0.25, 1.0, 1.0, 1.0, 0.1, 8.0, 200, path=tmp_path)
+    build_lookup_table(tmp_path, LATTICE, (0.1, 8.0, 200))
+    load_lookup_table.cache_clear()   # la tabla se abre una vez por proceso
+    assert lattice_covers(-0.25, 1.0, 1.0, 1.0, 0.1, 8.0, 200, path=tmp_path)
+    assert not lattice_covers(-0.3, 1.0, 1.0, 1.0, 0.1, 8.0, 200, path=tmp_path)    # fuera de la malla
+    assert not lattice_covers(-0.25, 1.0, 1.0, 1.0, 0.1, 8.0, 600, path=tmp_path)   # otra malla en r
@@ -0,0 +1,89 @@
+import json
+import math
+
+import pytest
+
+from central_force import metrics
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(metrics, "_ENABLED", True)
+    metrics.reset_metrics()
+    yield
+    metrics.reset_metrics()
+
+
+def test_quantile_interpolates_inside_bucket_and_clamps_to_max():
+    hist = metrics.Histogram()
+    assert math.isnan(hist.quantile(0.5))
+    for _ in range(10):
+        hist.observe(0.002)                     # cubo (0.001, 0.0025]
+    assert hist.quantile(0.5) == pytest.approx(0.00175)
+    assert hist.quantile(1.0) == 0.002          # 0.0025 recortado al máximo observado
+    hist.observe(20.0)                          # cubo +Inf
+    assert hist.quantile(0.99) == 20.0
+    snap = hist.snapshot()
+    assert snap["count"] == 11 and snap["buckets"][-1] == ["+Inf", 11]
+
+
+def test_span_is_shared_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(metrics, "_ENABLED", False)
+    metrics.reset_metrics()
+    assert metrics.span("a") is metrics.span("b") is metrics._NULL
+    with metrics.span("a"):
+        pass
+    metrics.observe("b", 1.0)
+    assert metrics.export_json() == {"spans": {}}
+    assert metrics.write_metrics("ignored.prom") is None
+
+
+def test_span_and_instrumented_record(enabled):
+    @metrics.instrumented("f")
+    def f():
+        return 3
+
+    with metrics.span("bloque"):
+        assert f() == 3
+    spans = metrics.export_json()["spans"]
+    assert sorted(spans) == ["bloque", "f"]
+    assert spans["f"]["count"] == 1
+    assert [row["span"] for row in metrics.metrics_summary()] == ["bloque", "f"]
+
+
+def test_export_prometheus_text_format(enabled):
+    metrics.observe('a"b', 0.003)
+    metrics.observe('a"b', 7.0)
+    lines = metrics.export_prometheus().splitlines()
+    assert lines[0].startswith("# HELP central_force_span_seconds ")
+    assert lines[1] == "# TYPE central_force_span_seconds histogram"
+    assert 'central_force_span_seconds_bucket{span="a\\"b",le="0.0025"} 0' in lines
+    assert 'central_force_span_seconds_bucket{span="a\\"b",le="0.005"} 1' in lines
+    assert 'central_force_span_seconds_bucket{span="a\\"b",le="+Inf"} 2' in lines
+    assert lines[-2] == 'central_force_span_seconds_sum{span="a\\"b"} 7.003'
+    assert lines[-1] == 'central_force_span_seconds_count{span="a\\"b"} 2'
+    assert len(lines) == 2 + len(metrics.BUCKETS) + 2
+
+
+def test_write_metrics_json_and_prometheus(enabled, tmp_path, monkeypatch):
+    metrics.observe("x", 0.01)
+    path = metrics.write_metrics(tmp_path / "m.json")
+    assert json.loads(path.read_text()) == metrics.export_json()
+    monkeypatch.setenv(metrics.ENV_FILE, str(tmp_path / "m.prom"))
+    path = metrics.write_metrics()
+    assert path.read_text() == metrics.export_prometheus()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["m.json", "m.prom"]
+
+
+def test_write_metrics_is_atomic(enabled, tmp_path, monkeypatch):
+    target = tmp_path / "m.prom"
+    target.write_text("anterior")
+    metrics.observe("x", 0.01)
+
+    def fail(src, dst):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(metrics.os, "replace", fail)
+    with pytest.raises(OSError):
+        metrics.write_metrics(target)
+    assert target.read_text() == "anterior"     # nunca se escribe directamente sobre el destino
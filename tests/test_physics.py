@@ -0,0 +1,59 @@
+from decimal import Decimal, getcontext
+
+import numpy as np
+import pytest
+
+from central_force.physics import get_veff, turning_points_exact
+
+
+def test_bound_orbit_turning_points_lie_on_veff():
+    E, L, m, alpha = -0.3, 1.0, 1.0, 1.0
+    tp = turning_points_exact(E, L, m, alpha)
+    assert tp.bound and isinstance(tp.r_min, float)
+    assert tp.r_min < tp.r_circular < tp.r_max
+    assert get_veff(np.array([tp.r_min, tp.r_max]), L, m, alpha) == pytest.approx([E, E], abs=1e-14)
+    # Kepler: r_min + r_max = 2a = α/|E|
+    assert tp.r_min + tp.r_max == pytest.approx(alpha / abs(E))
+
+
+@pytest.mark.parametrize("E", [0.0, 0.5, 3.0])
+def test_unbound_orbit_has_no_r_max(E):
+    tp = turning_points_exact(E, 1.2, 2.0, 0.7)
+    assert not tp.bound and tp.r_max == np.inf
+    assert get_veff(tp.r_min, 1.2, 2.0, 0.7) == pytest.approx(E, abs=1e-14)
+    if E == 0.0:
+        assert tp.r_min == pytest.approx(1.2**2 / (2 * 2.0 * 0.7))   # parábola: r_min = p/2
+
+
+def test_circular_orbit():
+    L, m, alpha = 1.5, 2.0, 3.0
+    tp = turning_points_exact(-m * alpha**2 / (2 * L**2), L, m, alpha)
+    assert tp.bound
+    assert tp.r_min == pytest.approx(tp.r_circular) and tp.r_max == pytest.approx(tp.r_circular)
+    assert tp.r_circular == pytest.approx(L**2 / (m * alpha))
+
+
+def test_forbidden_energy():
+    tp = turning_points_exact(-5.0, 1.0, 1.0, 1.0)
+    assert not tp.bound
+    assert np.isnan(tp.r_min) and np.isnan(tp.r_max)
+
+
+def test_vectorized_branches():
+    E = np.array([-0.3, -0.5, 0.2, -5.0])
+    tp = turning_points_exact(E, 1.0, 1.0, 1.0)
+    assert tp.r_min.shape == (4,)
+    assert tp.bound.tolist() == [True, True, False, False]
+    assert np.isfinite(tp.r_max[:2]).all() and tp.r_max[2] == np.inf and np.isnan(tp.r_max[3])
+
+
+@pytest.mark.parametrize("E", [-1e-6, -1e-10, -1e-14])
+def test_r_max_without_cancellation_near_zero_energy(E):
+    L, m, alpha = 1.0, 1.0, 1.0
+    getcontext().prec = 50
+    disc = Decimal(alpha)**2 + 2 * Decimal(E) * Decimal(L)**2 / Decimal(m)
+    exact = float((Decimal(alpha) + disc.sqrt()) / (-2 * Decimal(E)))
+    tp = turning_points_exact(E, L, m, alpha)
+    assert tp.r_max == pytest.approx(exact, rel=1e-14)
+    # r_min + r_max = α/|E| sigue valiendo aunque r_max ~ 1/|E| sea enorme
+    assert tp.r_min + tp.r_max == pytest.approx(alpha / abs(E), rel=1e-14)
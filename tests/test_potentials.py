@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+import pytest
+
+from central_force.curves import potential_curve_set
+from central_force.potentials import from_expression, get_potential
+
+
+def test_expression_matches_registered_potential():
+    r = np.linspace(0.2, 5.0, 50)
+    custom = from_expression("-alpha/r + 0.1/r**2", alpha=1.5)
+    assert np.allclose(custom.U(r), -1.5 / r + 0.1 / r**2)
+    assert np.allclose(custom.dU(r), 1.5 / r**2 - 0.2 / r**3)
+    kepler = get_potential("kepler", alpha=1.5)
+    assert np.allclose(from_expression("-alpha/r", alpha=1.5).veff(r, 1.0, 1.0), kepler.veff(r, 1.0, 1.0))
+
+
+@pytest.mark.parametrize("expr", [
+    "",
+    "   ",
+    "1/0",
+    "-alpha/r + 1/(2 - 2)",
+    "r,r",
+    "-alpha/r + 9**9**9",
+    "2**(10**10)",
+    "r**1000",
+    "1" * 40,
+    "-alpha/r" + " + r" * 100,
+    "__import__('os')",
+    "r.real",
+    "r[0]",
+    "lambda: r",
+    "-alpha/r +",
+    "exp(r, r, r)",
+])
+def test_bad_expressions_raise_value_error_quickly(expr):
+    t0 = time.perf_counter()
+    with pytest.raises(ValueError):
+        from_expression(expr, alpha=1.0)
+    assert time.perf_counter() - t0 < 5.0
+
+
+def test_empty_custom_expression_does_not_fall_back_to_registry():
+    with pytest.raises(ValueError):
+        potential_curve_set.__wrapped__(-0.3, 1.0, 1.0, "custom", (("alpha", 1.0),), "")
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from central_force.elements import kepler_orbital_elements, orbital_elements
+from central_force.potentials import get_potential
+from central_force.quadrature import radial_quadrature
+
+
+@pytest.mark.parametrize("m, alpha", [(1.0, 1.0), (2.0, 0.5)])
+def test_kepler_period_and_turning_points(m, alpha):
+    E, L = np.meshgrid(np.linspace(-0.9, -0.05, 12) * alpha**2 * m / 2, np.linspace(0.4, 1.4, 6))
+    e2 = 1 + 2 * E * L**2 / (m * alpha**2)
+    e = np.sqrt(np.maximum(e2, 0.0))
+    # Cerca de e = 1 la cuadratura de 64 nodos pierde precisión
+    ok = (e2 >= 0) & (e < 0.95)
+    a = -alpha / (2 * E)
+    q = radial_quadrature(E, L, m, get_potential("kepler", alpha=alpha))
+    assert np.allclose(q.r_min[ok], (a * (1 - e))[ok], rtol=1e-9)
+    assert np.allclose(q.r_max[ok], (a * (1 + e))[ok], rtol=1e-9)
+    assert np.allclose(q.period[ok], (2 * np.pi * np.sqrt(m * a**3 / alpha))[ok], rtol=1e-8)
+    assert np.allclose(q.delta_theta[ok], 2 * np.pi, rtol=1e-8)
+
+
+def test_harmonic_radial_period_is_half_the_angular_one():
+    # U = k r²/2: elipse centrada, T_r = π √(m/k) y Δθ = π por periodo radial
+    k, m = 2.0, 0.5
+    E, L = np.meshgrid(np.linspace(2.5, 6.0, 5), np.linspace(0.3, 1.0, 4))   # E > mín V_eff = 2L
+    q = radial_quadrature(E, L, m, get_potential("harmonic", k=k))
+    assert np.allclose(q.period, np.pi * np.sqrt(m / k), rtol=1e-8)
+    assert np.allclose(q.delta_theta, np.pi, rtol=1e-8)
+
+
+def test_numeric_elements_match_kepler_closed_form():
+    E, L = np.meshgrid(np.linspace(-0.45, -0.05, 9), np.linspace(0.5, 1.5, 5))
+    E, L = np.where(1 + 2 * E * L**2 < 0.95**2, E, np.nan), L   # sin los casos con e > 0.95
+    closed = kepler_orbital_elements(E, L, 1.0, 1.0)
+    numeric = orbital_elements(E, L, 1.0, get_potential("kepler", alpha=1.0))
+    for field in ("e", "a", "period", "precession"):
+        assert np.allclose(getattr(numeric, field), getattr(closed, field), rtol=1e-7, atol=1e-8, equal_nan=True), field
+
+
+def test_unbound_energies_are_nan():
+    q = radial_quadrature(np.array([0.2, -5.0]), np.array([1.0, 1.0]), 1.0, get_potential("kepler"))
+    assert np.all(np.isnan(q.period)) and np.all(np.isnan(q.delta_theta))
@@ -0,0 +1,91 @@
+import matplotlib.pyplot as plt
+import pytest
+
+from central_force.rendering import (
+    IMAGE_CACHE,
+    RenderStats,
+    cached_figure,
+    encode,
+    figure,
+    render_figure,
+)
+
+
+def _draw(fig, axes):
+    axes.plot([0, 1, 2], [0, 1, 4], color="black")
+    axes.set_title("prueba")
+
+
+def test_render_figure_leaves_no_figures_open():
+    stats = RenderStats()
+    png = render_figure(_draw, figsize=(3, 2), dpi=50, theme="dark", stats=stats)
+    svg = render_figure(_draw, figsize=(3, 2), fmt="svg", stats=stats)
+    assert png.startswith(b"\x89PNG") and b"<svg" in svg
+    assert plt.get_fignums() == []
+    snap = stats.snapshot()
+    assert snap["created"] == 2 and snap["open"] == 0 and snap["encoded"] == 2
+    assert snap["bytes"] == len(png) + len(svg)
+
+
+def test_failing_draw_still_releases_the_figure():
+    stats = RenderStats()
+
+    def broken(fig, axes):
+        axes.plot([0, 1], [0, 1])
+        raise RuntimeError("fallo al dibujar")
+
+    with pytest.raises(RuntimeError):
+        render_figure(broken, stats=stats)
+    assert plt.get_fignums() == []
+    assert stats.snapshot() == {"created": 1, "open": 0, "encoded": 0, "cached": 0, "bytes": 0}
+
+
+def test_figure_context_and_encode():
+    stats = RenderStats()
+    with figure(figsize=(2, 2), nrows=1, ncols=2, stats=stats) as (fig, axes):
+        assert len(axes) == 2
+        assert stats.open == 1
+        data = encode(fig, dpi=40, stats=stats)
+    assert data.startswith(b"\x89PNG")
+    assert stats.open == 0 and not fig.axes
+    assert plt.get_fignums() == []
+
+
+@pytest.fixture
+def image_cache():
+    IMAGE_CACHE.clear()
+    yield IMAGE_CACHE
+    IMAGE_CACHE.clear()
+
+
+def test_cached_figure_hits_on_quantized_key_and_same_theme(image_cache):
+    stats = RenderStats()
+    first = cached_figure(("fase", 0.3, 1.0), _draw, figsize=(3, 2), dpi=50, stats=stats)
+    again = cached_figure(("fase", 0.1 + 0.2, 1.0), _draw, figsize=(3, 2), dpi=50, stats=stats)
+    assert again == first
+    snap = stats.snapshot()
+    assert snap["encoded"] == 1 and snap["cached"] == 1 and snap["created"] == 1
+    assert snap["bytes"] == 2 * len(first)
+
+
+def test_theme_change_misses(image_cache):
+    stats = RenderStats()
+    light = cached_figure(("fase", 0.3), _draw, figsize=(3, 2), dpi=50, theme="light", stats=stats)
+    dark = cached_figure(("fase", 0.3), _draw, figsize=(3, 2), dpi=50, theme="dark", stats=stats)
+    assert light != dark
+    assert stats.snapshot()["encoded"] == 2 and stats.snapshot()["cached"] == 0
+    assert image_cache.stats()["size"] == 2
+
+
+def test_cache_evicts_past_64_mb(image_cache):
+    assert image_cache.maxbytes == 64 * 2**20
+    stats = RenderStats()
+    cached_figure(("vista",), _draw, figsize=(3, 2), dpi=50, stats=stats)
+    # Dos imágenes de 32 MB superan el límite junto con la primera: sale la más antigua
+    image_cache.put("grande-1", b"\0" * (32 * 2**20))
+    assert image_cache.stats()["evictions"] == 0
+    image_cache.put("grande-2", b"\0" * (32 * 2**20))
+    assert image_cache.stats()["evictions"] == 1
+    assert image_cache.nbytes <= image_cache.maxbytes
+    cached_figure(("vista",), _draw, figsize=(3, 2), dpi=50, stats=stats)
+    assert stats.snapshot()["encoded"] == 2 and stats.snapshot()["cached"] == 0
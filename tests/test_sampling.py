@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from central_force.curves import curve_set
+from central_force.physics import turning_points_exact
+from central_force.sampling import adaptive_phase
+
+
+@pytest.mark.parametrize("E, L, m, alpha, r_lo, r_hi, inner, outer", [
+    (-0.3, 1.0, 1.0, 1.0, 0.1, 10.0, True, True),     # ambos puntos de retorno dentro
+    (0.5, 1.0, 1.0, 1.0, 0.1, 10.0, True, False),     # no ligada: solo r_min
+    (-0.5, 0.5, 2.0, 3.0, 0.1, 8.0, False, True),     # r_min < r_lo: solo r_max
+    (-0.2, 0.3, 1.0, 1.0, 0.3, 25.0, False, True),
+])
+def test_adaptive_phase_is_monotonic_and_closes_at_turning_points(E, L, m, alpha, r_lo, r_hi, inner, outer):
+    tp = turning_points_exact(E, L, m, alpha)
+    r, pr = adaptive_phase(E, L, m, alpha, r_lo, r_hi, tol=1e-3)
+    assert np.all(np.diff(r) > 0)
+    assert np.all(pr >= 0)
+    if inner:
+        assert r[0] == tp.r_min and pr[0] == 0.0
+    else:
+        assert r[0] == pytest.approx(r_lo) and pr[0] > 0
+    if outer:
+        assert r[-1] == tp.r_max and pr[-1] == 0.0
+    else:
+        assert r[-1] == pytest.approx(r_hi) and pr[-1] > 0
+
+
+def test_curve_set_adaptive_r_valid_is_monotonic():
+    curves = curve_set.__wrapped__(-0.2, 0.3, 1.0, 1.0, 0.3, 25.0, tol=1e-3)
+    assert np.all(np.diff(curves.r_valid) > 0)
+    assert curves.r_valid[-1] == pytest.approx(turning_points_exact(-0.2, 0.3, 1.0, 1.0).r_max)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from central_force.spherical import cartesian_to_spherical, integrate_spherical, spherical_to_cartesian
+
+
+def test_coordinate_round_trip():
+    rng = np.random.default_rng(0)
+    y = np.column_stack([rng.uniform(0.5, 3, 50), rng.uniform(0.1, 3.0, 50), rng.uniform(-3, 3, 50),
+                         rng.normal(size=(50, 3))])
+    assert np.allclose(cartesian_to_spherical(spherical_to_cartesian(y)), y)
+
+
+def test_parabolic_orbit_has_finite_drift():
+    # H0 = p²/2 − 1/r = 0 en r = 2 con |p| = 1: la deriva se mide respecto a α/r0
+    y0 = np.array([[2.0, np.pi / 2, 0.0, 0.0, 0.0, 2.0],
+                   [2.0, np.pi / 3, 0.0, -0.5, 0.0, 0.5]])
+    res = integrate_spherical(y0, t_span=(0, 5), dt=0.01, n_save=11)
+    assert np.all(np.isfinite(res.energy_drift))
+    assert res.energy_drift[0] < 1e-6
+
+
+@pytest.mark.parametrize("method", ["rk4", "verlet", "yoshida4"])
+def test_equatorial_orbit_matches_planar_energy(method):
+    y0 = [2.0, np.pi / 2, 0.0, 0.0, 0.0, 1.0]   # elipse en el plano z = 0
+    res = integrate_spherical(y0, t_span=(0, 20), dt=0.005, method=method, n_save=5)
+    assert np.allclose(res.y[:, 0, 1], np.pi / 2)
+    assert np.allclose(res.y[:, 0, 5], 1.0)
+    assert res.energy_drift[0] < 1e-4
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from central_force.kepler import propagate_kepler
+from central_force.symplectic import integrate_symplectic
+
+Y0 = [2.0, 0.0, 0.0, 1.0]
+
+
+@pytest.mark.parametrize("method", ["verlet", "yoshida4"])
+def test_single_orbit_path_matches_vectorized_path(method):
+    single = integrate_symplectic(Y0, t_span=(0, 30), dt=0.01, method=method, n_save=301)
+    batch = integrate_symplectic(np.array([Y0, Y0]), t_span=(0, 30), dt=0.01, method=method, n_save=301)
+    assert np.allclose(single.y, batch.y[:, 0], rtol=1e-12, atol=1e-12)
+    assert single.energy_drift == pytest.approx(batch.energy_drift[0])
+
+
+@pytest.mark.parametrize("n_save", [2, 7, 1000, 3001])
+def test_saved_times_are_the_requested_grid(n_save):
+    res = integrate_symplectic(Y0, t_span=(0, 20), dt=0.01, n_save=n_save)
+    assert np.allclose(res.t, np.linspace(0, 20, n_save), rtol=0, atol=1e-12)
+    assert res.y.shape == (n_save, 4)
+
+
+@pytest.mark.parametrize("method, order", [("verlet", 2), ("yoshida4", 4)])
+def test_converges_to_kepler_with_its_order(method, order):
+    exact = propagate_kepler(np.array([10.0]), Y0, 1.0, 1.0)[:, -1]
+    errors = [np.max(np.abs(integrate_symplectic(Y0, t_span=(0, 10), dt=dt, method=method).y - exact))
+              for dt in (0.02, 0.01)]
+    assert errors[0] / errors[1] == pytest.approx(2**order, rel=0.2)
+
+
+def test_rejects_too_few_samples():
+    with pytest.raises(ValueError):
+        integrate_symplectic(Y0, n_save=1)